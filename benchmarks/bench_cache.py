@@ -0,0 +1,128 @@
+"""
+Shared disk cache check across worker processes: single-flight fills, warm loads, standings sharing
+
+1. N processes call ``get_or_fill`` on one key at the same moment with a slow
+   fill; exactly one fill must run and every process must get its value.
+2. Dataset load: cold (fill) vs warm (cache read) per process.
+3. N processes each run one standings refresh against a local stub server
+   through the shared cache: one HTTP request in total. After the entry
+   expires, the next round revalidates with one conditional request (304).
+
+Run with: python benchmarks/bench_cache.py [--workers 8] [--cache-dir DIR]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plfinance.cache import DiskCache
+from plfinance.dataset import cached_dataset
+from plfinance.live import StandingsFetcher
+from plfinance.testing import StandingsStubServer
+
+FILL_SECONDS = 0.5
+
+
+def _slow_fill(log_path):
+    with open(log_path, 'a') as f:
+        f.write(f"{os.getpid()}\n")
+    time.sleep(FILL_SECONDS)
+    return {'filled_by': os.getpid()}
+
+
+def single_flight_worker(cache_dir, log_path, start_event, results):
+    cache = DiskCache(cache_dir)
+    start_event.wait()
+    start = time.perf_counter()
+    value = cache.get_or_fill('bench:single-flight', lambda: _slow_fill(log_path), ttl=60)
+    results.put((os.getpid(), value['filled_by'], time.perf_counter() - start))
+
+
+def dataset_worker(cache_dir, start_event, results):
+    cache = DiskCache(cache_dir)
+    start_event.wait()
+    start = time.perf_counter()
+    dataset = cached_dataset(cache)
+    results.put((os.getpid(), len(dataset.financial), time.perf_counter() - start, cache.stats()['fills']))
+
+
+def standings_worker(cache_dir, url, start_event, results):
+    fetcher = StandingsFetcher(url=url, refresh_interval=1, cache=DiskCache(cache_dir))
+    start_event.wait()
+
+    async def refresh_once():
+        async with fetcher.make_client() as client:
+            return await fetcher.refresh(client)
+
+    changed = asyncio.run(refresh_once())
+    snapshot = fetcher.latest()
+    results.put((os.getpid(), changed, fetcher.requests_made, snapshot.standings['Points'].tolist()))
+
+
+def run_workers(target, args, workers):
+    ctx = multiprocessing.get_context('spawn')
+    start_event = ctx.Event()
+    results = ctx.Queue()
+    processes = [ctx.Process(target=target, args=(*args, start_event, results)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    # Give every worker time to import and open the cache before releasing them together
+    time.sleep(2.0)
+    start_event.set()
+    collected = [results.get(timeout=60) for _ in processes]
+    for process in processes:
+        process.join()
+    return collected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--cache-dir', default=None, help="Cache directory (default: a fresh temporary directory)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = args.cache_dir or os.path.join(tmp, 'cache')
+        DiskCache(cache_dir)
+
+        # 1. Single-flight fill
+        log_path = os.path.join(tmp, 'fills.log')
+        results = run_workers(single_flight_worker, (cache_dir, log_path), args.workers)
+        with open(log_path) as f:
+            fills = len(f.read().split())
+        fillers = {filled_by for _, filled_by, _ in results}
+        waits = sorted(seconds for _, _, seconds in results)
+        print(f"single-flight: {args.workers} processes, {fills} fill(s), value from {len(fillers)} process(es), "
+              f"latency min {waits[0] * 1000:.0f} ms / max {waits[-1] * 1000:.0f} ms")
+        assert fills == 1 and len(fillers) == 1, "more than one process ran the fill"
+
+        # 2. Dataset load, cold then warm
+        for label in ('cold', 'warm'):
+            results = run_workers(dataset_worker, (cache_dir,), args.workers)
+            fills = sum(result[3] for result in results)
+            latencies = sorted(result[2] for result in results)
+            print(f"dataset ({label}): {fills} fill(s), latency median {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+                  f"max {latencies[-1] * 1000:.1f} ms")
+            assert fills == (1 if label == 'cold' else 0)
+
+        # 3. Standings shared through the cache
+        with StandingsStubServer() as server:
+            for round_number in (1, 2):
+                before, before_304 = server.request_count, server.not_modified_count
+                results = run_workers(standings_worker, (cache_dir, server.url), args.workers)
+                points = {tuple(result[3]) for result in results}
+                print(f"standings round {round_number}: {args.workers} processes, "
+                      f"{server.request_count - before} HTTP request(s) "
+                      f"({server.not_modified_count - before_304} not modified), {len(points)} distinct table(s)")
+                assert server.request_count - before == 1 and len(points) == 1
+                # Let the entry (refresh_interval=1) expire before the revalidation round
+                time.sleep(1.5)
+
+
+if __name__ == "__main__":
+    main()
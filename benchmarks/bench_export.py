@@ -0,0 +1,101 @@
+"""
+Export benchmark: peak RSS and time per format for a large multi-season export
+
+Each format runs in its own subprocess so peak RSS is measured in isolation.
+The "base64" row is the old data-URI path (whole CSV string, base64-encoded).
+
+Run with: python benchmarks/bench_export.py [--clubs 2000] [--seasons 50]
+"""
+import argparse
+import base64
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plfinance.export import EXPORT_FORMATS, write_export
+
+FORMATS = ['base64'] + list(EXPORT_FORMATS)
+
+
+def season_frames(clubs, seasons, seed=7):
+    """
+    Synthetic financial frames, generated one season at a time
+    """
+    rng = np.random.default_rng(seed)
+    teams = [f"Club {i:05d}" for i in range(clubs)]
+    for season_offset in range(seasons):
+        matchday = rng.uniform(5, 120, clubs).round(1)
+        broadcasting = rng.uniform(80, 330, clubs).round(1)
+        commercial = rng.uniform(20, 380, clubs).round(1)
+        yield pd.DataFrame({
+            'Team': teams,
+            'Matchday_Revenue': matchday,
+            'Broadcasting_Revenue': broadcasting,
+            'Commercial_Revenue': commercial,
+            'Total_Revenue': (matchday + broadcasting + commercial).round(1),
+            'Revenue_Growth': rng.uniform(-20, 30, clubs).round(1),
+            'Season': f"{1975 + season_offset}-{(76 + season_offset) % 100:02d}"
+        })
+
+
+def peak_rss_mb():
+    # ru_maxrss is reported in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_one(fmt, clubs, seasons):
+    baseline_rss = peak_rss_mb()
+    start = time.perf_counter()
+    with open(os.devnull, 'wb') as sink:
+        if fmt == 'base64':
+            df = pd.concat(season_frames(clubs, seasons), ignore_index=True)
+            csv = df.to_csv(index=False)
+            payload = base64.b64encode(csv.encode()).decode()
+            size = len(payload)
+            sink.write(payload.encode())
+        else:
+            size = write_export(season_frames(clubs, seasons), fmt, sink)
+    elapsed = time.perf_counter() - start
+    return {
+        'format': fmt,
+        'rows': clubs * seasons,
+        'seconds': round(elapsed, 3),
+        'bytes': size,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'rss_growth_mb': round(peak_rss_mb() - baseline_rss, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clubs', type=int, default=2000)
+    parser.add_argument('--seasons', type=int, default=50)
+    parser.add_argument('--formats', nargs='+', default=FORMATS, choices=FORMATS)
+    parser.add_argument('--run', choices=FORMATS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run_one(args.run, args.clubs, args.seasons)))
+        return
+
+    print(f"{'format':>8} {'rows':>10} {'time (s)':>9} {'size (MB)':>10} {'peak RSS (MB)':>14} {'RSS growth (MB)':>16}")
+    for fmt in args.formats:
+        output = subprocess.run(
+            [sys.executable, __file__, '--run', fmt, '--clubs', str(args.clubs), '--seasons', str(args.seasons)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output)
+        print(f"{fmt:>8} {result['rows']:>10} {result['seconds']:>9.2f} {result['bytes'] / 1e6:>10.1f} "
+              f"{result['peak_rss_mb']:>14.1f} {result['rss_growth_mb']:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Figure payload benchmark: full SVG traces vs WebGL + LTTB/aggregated trend lines
+
+For N clubs x M seasons, builds the trend line and the points-vs-revenue
+scatter both ways and reports trace count, points sent, serialized JSON size
+and build + serialization time.
+
+Run with: python benchmarks/bench_figures.py [--shapes 6x5 100x40 500x80] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plfinance.figures import build_points_revenue_scatter, build_revenue_trend_line
+
+UNLIMITED = 10 ** 9
+
+
+def history_frame(clubs, seasons, seed=7):
+    rng = np.random.default_rng(seed)
+    growth = 1 + rng.normal(0.04, 0.08, (clubs, seasons))
+    revenue = rng.uniform(50, 400, (clubs, 1)) * np.cumprod(growth, axis=1)
+    return pd.DataFrame({
+        'Team': np.repeat([f"Club {i:05d}" for i in range(clubs)], seasons),
+        'Season': np.tile([f"{1950 + i}-{(51 + i) % 100:02d}" for i in range(seasons)], clubs),
+        'Total_Revenue': revenue.ravel().round(1)
+    })
+
+
+def standings_frame(rows, seed=7):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Team': [f"Club {i:05d}" for i in range(rows)],
+        'Total_Revenue': rng.uniform(50, 900, rows).round(1),
+        'Points': rng.integers(10, 100, rows),
+        'Goals_Scored': rng.integers(20, 110, rows),
+        'Revenue_Growth': rng.uniform(-20, 30, rows).round(1)
+    })
+
+
+def measure(build, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fig = build()
+        payload = fig.to_json()
+        timings.append(time.perf_counter() - start)
+    points = sum(len(trace.x) for trace in fig.data)
+    return {
+        'traces': len(fig.data),
+        'trace_type': fig.data[0].type,
+        'points': points,
+        'kib': len(payload) / 1024,
+        'ms': min(timings) * 1000
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--shapes', nargs='+', default=['6x5', '100x40', '500x80'])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'chart':>8} {'shape':>8} {'mode':>8} {'type':>10} {'traces':>7} {'points':>8} {'JSON (KiB)':>11} {'time (ms)':>10}")
+    for shape in args.shapes:
+        clubs, seasons = (int(part) for part in shape.split('x'))
+        hist = history_frame(clubs, seasons)
+        scatter_df = standings_frame(clubs * seasons)
+        cases = [
+            ('trend', 'full', lambda: build_revenue_trend_line(hist, max_points=UNLIMITED, max_traces=UNLIMITED, webgl_threshold=UNLIMITED)),
+            ('trend', 'reduced', lambda: build_revenue_trend_line(hist)),
+            ('scatter', 'svg', lambda: build_points_revenue_scatter(scatter_df, webgl_threshold=UNLIMITED)),
+            ('scatter', 'auto', lambda: build_points_revenue_scatter(scatter_df))
+        ]
+        for chart, mode, build in cases:
+            result = measure(build, args.repeat)
+            print(f"{chart:>8} {shape:>8} {mode:>8} {result['trace_type']:>10} {result['traces']:>7} {result['points']:>8} "
+                  f"{result['kib']:>11.1f} {result['ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
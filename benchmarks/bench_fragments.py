@@ -0,0 +1,159 @@
+"""
+Partial rerun check: which dashboard stages execute for each widget interaction
+
+Drives premier_league_dashboard.py with Streamlit's AppTest and profiling on,
+collecting the stage records every run logs. Sidebar filters trigger a full
+run; widgets inside a section (the pie team picker, the revenue stream, the
+simulator's shock sliders, the export format) must rerun only their own
+fragment. AppTest always reruns the whole script, so fragment interactions are
+replayed the way the browser sends them: a rerun scoped to the fragment the
+widget belongs to.
+
+Any interaction that runs stages outside its section, or falls back to a full
+run, is reported as a regression (exit code 1). Runs offline: live standings
+point at an unreachable address, so the static table is used.
+
+Run with: python benchmarks/bench_fragments.py [--json results.json]
+"""
+import argparse
+import functools
+import json
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ['PL_PROFILE'] = '1'
+os.environ.setdefault('PL_STANDINGS_URL', 'http://127.0.0.1:9/standings')
+
+from streamlit.runtime.scriptrunner import RerunData
+from streamlit.testing.v1 import AppTest, local_script_runner
+
+APP_PATH = os.path.join(ROOT, 'premier_league_dashboard.py')
+
+# (interaction, widget type, label, new value as displayed, fragment key or None for a full run)
+INTERACTIONS = [
+    ('season', 'selectbox', "Select Season:", '2022-23', None),
+    ('teams', 'multiselect', "Select Teams:", ['Arsenal', 'Chelsea', 'Liverpool'], None),
+    ('pie team', 'selectbox', "Select team for revenue breakdown:", 'Chelsea', 'pie'),
+    ('revenue stream', 'selectbox', "Revenue stream:", 'Commercial Revenue', 'growth_detail'),
+    ('scenario shock', 'slider', "Commercial shock (±%)", 12, 'simulation'),
+    ('export format', 'selectbox', "Export format:", 'Parquet', 'export')
+]
+
+# Stages a fragment rerun may execute
+FRAGMENT_STAGES = {
+    'pie': {'figure:pie', 'chart:pie'},
+    'growth_detail': {'growth_analytics'},
+    'simulation': {'simulation', 'figure:fei_bands', 'chart:fei_bands'},
+    'export': {'export'}
+}
+
+
+class RecordCollector(logging.Handler):
+    """
+    Keeps the render_profile records logged since the last ``drain``
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(json.loads(record.getMessage()))
+
+    def drain(self):
+        records, self.records = self.records, []
+        return records
+
+
+def find_widget(at, kind, label):
+    return next(widget for widget in getattr(at, kind) if widget.label == label)
+
+
+def fragment_run(at, fragment):
+    """
+    Rerun only the fragment registered under ``fragment`` (what the browser requests
+    when a widget inside it changes)
+    """
+    fragment_ids = at._fragment_storage.resolve_target(fragment)
+    scoped = functools.partial(RerunData, fragment_id_queue=fragment_ids)
+    with mock.patch.object(local_script_runner, 'RerunData', scoped):
+        at.run()
+
+
+def summarize(name, records, seconds, fragment):
+    stages = Counter(
+        stage['stage'] for record in records for stage in record['stages'] if stage['stage'] != 'total'
+    )
+    full_runs = sum('fragment' not in record for record in records)
+    problems = []
+    if fragment is not None:
+        if full_runs:
+            problems.append('full rerun')
+        unexpected = sorted(set(stages) - FRAGMENT_STAGES[fragment])
+        if unexpected:
+            problems.append('ran ' + ', '.join(unexpected))
+    return {
+        'interaction': name,
+        'scope': fragment or 'app',
+        'runs': len(records),
+        'full_runs': full_runs,
+        'stage_executions': sum(stages.values()),
+        'stages': dict(stages),
+        'ms': round(seconds * 1000, 1),
+        'problems': problems
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--json', help="Also write the results to this file")
+    parser.add_argument('--timeout', type=float, default=120)
+    args = parser.parse_args()
+
+    collector = RecordCollector()
+    profile_logger = logging.getLogger('plfinance.profiling')
+    profile_logger.addHandler(collector)
+    profile_logger.setLevel(logging.INFO)
+
+    results = []
+    for name, kind, label, value, fragment in [('initial load', None, None, None, None)] + INTERACTIONS:
+        # A fresh session per interaction, so each count starts from the same page
+        at = AppTest.from_file(APP_PATH, default_timeout=args.timeout)
+        start = time.perf_counter()
+        at.run()
+        if kind is not None:
+            collector.drain()
+            find_widget(at, kind, label).set_value(value)
+            start = time.perf_counter()
+            if fragment is None:
+                at.run()
+            else:
+                fragment_run(at, fragment)
+        seconds = time.perf_counter() - start
+        if at.exception:
+            raise RuntimeError(f"{name}: {at.exception[0].value}")
+        results.append(summarize(name, collector.drain(), seconds, fragment))
+
+    print(f"{'interaction':>16} {'scope':>14} {'runs':>5} {'stages':>7} {'ms':>8}  result")
+    for row in results:
+        print(f"{row['interaction']:>16} {row['scope']:>14} {row['runs']:>5} {row['stage_executions']:>7} "
+              f"{row['ms']:>8.1f}  {'; '.join(row['problems']) or 'ok'}")
+        print(' ' * 18 + ', '.join(f"{stage} x{count}" for stage, count in row['stages'].items()))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'results': results}, f, indent=2)
+
+    if any(row['problems'] for row in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
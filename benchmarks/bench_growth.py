@@ -0,0 +1,80 @@
+"""
+Growth benchmark: season-over-season comparison table, pivot + per-season loop vs shifted arrays
+
+Checks both paths produce the same table, then times them for several
+(clubs x seasons) shapes.
+
+Run with: python benchmarks/bench_growth.py [--shapes 6x5 100x30 2000x50] [--repeat 10]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plfinance.growth import GrowthAnalytics, season_comparison
+from plfinance.schema import TeamSeasonDictionary, apply_schema
+
+
+def historical_frame(clubs, seasons, seed=7):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Team': np.tile([f"Club {i:05d}" for i in range(clubs)], seasons),
+        'Season': np.repeat([f"{1975 + i}-{(76 + i) % 100:02d}" for i in range(seasons)], clubs),
+        'Matchday_Revenue': rng.uniform(5, 120, clubs * seasons).round(1),
+        'Broadcasting_Revenue': rng.uniform(80, 330, clubs * seasons).round(1),
+        'Commercial_Revenue': rng.uniform(20, 380, clubs * seasons).round(1),
+        'Total_Revenue': rng.uniform(150, 900, clubs * seasons).round(1)
+    })
+
+
+def loop_comparison(hist_df):
+    """
+    The previous dashboard code: pivot, then insert one growth column per season
+    """
+    revenue_pivot = hist_df.pivot(index='Team', columns='Season', values='Total_Revenue').round(1)
+    for i in range(1, len(revenue_pivot.columns)):
+        prev_season = revenue_pivot.columns[i-1]
+        curr_season = revenue_pivot.columns[i]
+        growth_col = f'{curr_season} Growth %'
+        revenue_pivot[growth_col] = ((revenue_pivot[curr_season] - revenue_pivot[prev_season]) / revenue_pivot[prev_season] * 100).round(1)
+    return revenue_pivot
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--shapes', nargs='+', default=['6x5', '100x30', '2000x50'])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'shape':>10} {'loop (ms)':>10} {'vectorized (ms)':>16} {'speedup':>8} {'all streams (ms)':>17}")
+    for shape in args.shapes:
+        clubs, seasons = (int(part) for part in shape.split('x'))
+        plain = historical_frame(clubs, seasons)
+        compact = apply_schema(plain, TeamSeasonDictionary.from_frames(plain))
+
+        pd.testing.assert_frame_equal(
+            loop_comparison(plain), season_comparison(compact), check_names=False, check_column_type=False
+        )
+
+        loop_ms = best_of(lambda: loop_comparison(plain), args.repeat)
+        vector_ms = best_of(lambda: season_comparison(compact), args.repeat)
+        streams_ms = best_of(lambda: GrowthAnalytics.from_frame(compact), args.repeat)
+        print(f"{shape:>10} {loop_ms:>10.2f} {vector_ms:>16.2f} {loop_ms / vector_ms:>7.1f}x {streams_ms:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
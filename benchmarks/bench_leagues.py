@@ -0,0 +1,95 @@
+"""
+League catalog benchmark: startup and memory as the number of leagues grows
+
+Writes K synthetic league shards plus their ``leagues.json`` index to a
+temporary root, then compares what the dashboard needs before the first
+render (the sidebar options of every league) and for a cross-league
+comparison of one season. The catalog reads the index only and loads one
+league when it is selected; eager loading reads every league's full
+dataset up front. Cross-league comparisons read one season's revenue
+columns shard by shard instead of concatenating every league. Both must
+give the same comparison.
+
+Run with: python benchmarks/bench_leagues.py [--leagues 1 5 20] [--clubs 20] [--seasons 30]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plfinance.data_sources import write_parquet_dataset
+from plfinance.dataset import load_dataset
+from plfinance.leagues import STREAM_COLUMNS, LeagueCatalog, build_index, compare_leagues
+from plfinance.synthetic import SyntheticDataSource
+
+
+def write_leagues(root, leagues, clubs, seasons):
+    for i in range(leagues):
+        write_parquet_dataset(SyntheticDataSource(clubs, seasons, seed=i), os.path.join(root, f'league-{i:02d}'))
+    build_index(root)
+
+
+def dataset_bytes(dataset):
+    frames = [dataset.combined, dataset.historical, dataset.financial, dataset.performance]
+    return sum(int(frame.memory_usage(deep=True).sum()) for frame in frames)
+
+
+def eager_comparison(datasets, season):
+    """
+    Per-league totals from every fully loaded league, concatenated
+    """
+    frames = [
+        dataset.financial[dataset.financial['Season'] == season][['Total_Revenue', *STREAM_COLUMNS]].assign(League=key)
+        for key, dataset in datasets.items()
+    ]
+    return pd.concat(frames).groupby('League', sort=False)['Total_Revenue'].sum()
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--leagues', type=int, nargs='+', default=[1, 5, 20])
+    parser.add_argument('--clubs', type=int, default=20)
+    parser.add_argument('--seasons', type=int, default=30)
+    args = parser.parse_args()
+
+    print(f"{'leagues':>8} {'index (ms)':>11} {'select 1 (ms)':>14} {'eager (ms)':>11} {'held lazy MB':>13} "
+          f"{'held eager MB':>14} {'compare (ms)':>13} {'load all + compare (ms)':>24}")
+    for n_leagues in args.leagues:
+        with tempfile.TemporaryDirectory() as root:
+            write_leagues(root, n_leagues, args.clubs, args.seasons)
+
+            # What the first render needs: every league's seasons and clubs, then the selected league
+            catalog, index_ms = timed(lambda: LeagueCatalog.from_root(root))
+            options = [(league.label, league.seasons, league.season_teams(league.current_season))
+                       for league in catalog.leagues()]
+            assert len(options) == n_leagues
+            first = catalog.keys()[0]
+            selected, select_ms = timed(lambda: load_dataset(catalog.source(first)))
+
+            datasets, eager_ms = timed(lambda: {key: load_dataset(catalog.source(key)) for key in catalog.keys()})
+
+            season = catalog[first].current_season
+            comparison, compare_ms = timed(lambda: compare_leagues(catalog, season))
+            expected, eager_compare_ms = timed(lambda: eager_comparison(datasets, season))
+            assert np.allclose(comparison['Total_Revenue'], expected.loc[catalog.keys()].to_numpy(), rtol=1e-5)
+
+            lazy_mb = dataset_bytes(selected) / 1e6
+            eager_mb = sum(dataset_bytes(dataset) for dataset in datasets.values()) / 1e6
+            print(f"{n_leagues:>8} {index_ms:>11.1f} {select_ms:>14.1f} {eager_ms:>11.1f} {lazy_mb:>13.2f} "
+                  f"{eager_mb:>14.2f} {compare_ms:>13.1f} {eager_compare_ms + eager_ms:>24.1f}")
+
+
+if __name__ == "__main__":
+    main()
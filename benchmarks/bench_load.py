@@ -0,0 +1,421 @@
+"""
+Load test: concurrent browser sessions against a local Streamlit server
+
+Starts ``streamlit run premier_league_dashboard.py`` headless and connects N
+simulated sessions per level over the same websocket protocol the browser
+uses. Each session loads the page, then changes widgets in a weighted mix:
+the season (full rerun), the team multiselect (full rerun) and the pie team
+picker (a rerun of the pie fragment only). Between interactions a session
+waits a random think time.
+
+For every level the table shows rerun latency percentiles (from sending the
+widget change to the server's ``script_finished``), the server's CPU use and
+its resident memory. Results are saved as JSON; passing a previous results
+file with --compare exits non-zero when a level's p95 got slower than the
+tolerance, so releases can be checked for regressions.
+
+Runs offline: the live standings come from the local stub feed in
+plfinance/testing.py (--standings unreachable uses the static table instead).
+
+Run with: python benchmarks/bench_load.py [--sessions 1 5 10 25] [--actions 10] [--think 0.5]
+                                          [--output results.json] [--compare baseline.json] [--tolerance 0.25]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from plfinance.testing import StandingsStubServer
+
+APP_PATH = os.path.join(ROOT, 'premier_league_dashboard.py')
+SEASON_LABEL = "Select Season:"
+TEAMS_LABEL = "Select Teams:"
+PIE_LABEL = "Select team for revenue breakdown:"
+LIVE_MESSAGE = "Live data active"
+
+# (interaction, relative weight): most clicks stay inside a section, filters change less often
+MIX = [('season', 2), ('teams', 3), ('pie team', 5)]
+
+WIDGET_TYPES = {'selectbox', 'multiselect'}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_app(port, standings_url, timeout):
+    """
+    Headless ``streamlit run`` of the dashboard; returns the process once the health check answers
+    """
+    env = {**os.environ, 'PL_STANDINGS_URL': standings_url}
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP_PATH, '--server.headless', 'true',
+         '--server.port', str(port), '--server.fileWatcherType', 'none', '--browser.gatherUsageStats', 'false'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"streamlit exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1) as response:
+                if response.status == 200:
+                    return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"streamlit did not answer on port {port} within {timeout}s")
+
+
+class ProcessSampler:
+    """
+    CPU seconds and resident memory of one process, from psutil when installed, else /proc
+    """
+
+    def __init__(self, pid):
+        try:
+            import psutil
+        except ImportError:
+            psutil = None
+        self._process = psutil.Process(pid) if psutil is not None else None
+        self._pid = pid
+        self._ticks = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+        self.peak_rss = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def cpu_seconds(self):
+        if self._process is not None:
+            times = self._process.cpu_times()
+            return times.user + times.system
+        try:
+            with open(f'/proc/{self._pid}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+        except OSError:
+            return None
+        return (int(fields[11]) + int(fields[12])) / self._ticks
+
+    def rss(self):
+        if self._process is not None:
+            return self._process.memory_info().rss
+        try:
+            with open(f'/proc/{self._pid}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            return None
+        return None
+
+    def __enter__(self):
+        self.peak_rss = self.rss() or 0
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _sample(self):
+        while not self._stop.wait(0.2):
+            self.peak_rss = max(self.peak_rss, self.rss() or 0)
+
+
+class Session:
+    """
+    One simulated browser tab: sends widget changes as BackMsg reruns and waits for script_finished
+    """
+
+    def __init__(self, ws, rng, timeout):
+        self.ws = ws
+        self.rng = rng
+        self.timeout = timeout
+        # label -> (widget type, id, options, fragment id) as last rendered
+        self.widgets = {}
+        # widget id -> WidgetState the browser would resend with every rerun
+        self.states = {}
+        self.errors = 0
+        self.live = False
+
+    async def rerun(self, fragment_id=''):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+
+        message = BackMsg()
+        message.rerun_script.query_string = ''
+        message.rerun_script.fragment_id = fragment_id
+        message.rerun_script.widget_states.widgets.extend(self.states.values())
+        start = time.perf_counter()
+        await self.ws.send(message.SerializeToString())
+        await asyncio.wait_for(self._until_finished(full=not fragment_id), self.timeout)
+        return (time.perf_counter() - start) * 1000
+
+    async def _until_finished(self, full):
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        seen = set()
+        while True:
+            message = ForwardMsg()
+            message.ParseFromString(await self.ws.recv())
+            kind = message.WhichOneof('type')
+            if kind == 'delta' and message.delta.WhichOneof('type') == 'new_element':
+                element = message.delta.new_element
+                element_type = element.WhichOneof('type')
+                if element_type == 'exception':
+                    self.errors += 1
+                elif element_type == 'alert':
+                    self.live = self.live or element.alert.body == LIVE_MESSAGE
+                elif element_type in WIDGET_TYPES:
+                    widget = getattr(element, element_type)
+                    self.widgets[widget.label] = (element_type, widget.id, list(widget.options),
+                                                  message.delta.fragment_id)
+                    seen.add(widget.id)
+            elif kind == 'script_finished':
+                if message.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    self.errors += 1
+                if message.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    break
+        if full:
+            # Widgets that were not rendered again are gone (e.g. the pie picker after its options changed)
+            self.states = {widget_id: state for widget_id, state in self.states.items() if widget_id in seen}
+
+    def _set(self, label, value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        element_type, widget_id, _, fragment_id = self.widgets[label]
+        state = WidgetState(id=widget_id)
+        if element_type == 'multiselect':
+            state.string_array_value.data.extend(value)
+        else:
+            state.string_value = value
+        self.states[widget_id] = state
+        return fragment_id
+
+    async def interact(self, action):
+        """
+        Change one widget the way a user would; returns the rerun latency in ms
+        """
+        if action == 'teams':
+            options = self.widgets[TEAMS_LABEL][2]
+            teams = self.rng.sample(options, self.rng.randint(2, len(options)))
+            fragment_id = self._set(TEAMS_LABEL, sorted(teams, key=options.index))
+        else:
+            label = SEASON_LABEL if action == 'season' else PIE_LABEL
+            fragment_id = self._set(label, self.rng.choice(self._other_options(label)))
+        return await self.rerun(fragment_id)
+
+    def _other_options(self, label):
+        # A selectbox change picks a value other than the current one
+        _, widget_id, options, _ = self.widgets[label]
+        current = self.states[widget_id].string_value if widget_id in self.states else None
+        return [option for option in options if option != current] or options
+
+
+async def run_session(url, origin, seed, actions, think, timeout, latencies):
+    import websockets
+
+    rng = random.Random(seed)
+    names, weights = zip(*MIX)
+    async with websockets.connect(url, subprotocols=['streamlit'], origin=origin, max_size=None) as ws:
+        session = Session(ws, rng, timeout)
+        latencies['load'].append(await session.rerun())
+        for _ in range(actions):
+            await asyncio.sleep(rng.expovariate(1 / think) if think > 0 else 0)
+            action = rng.choices(names, weights)[0]
+            latencies[action].append(await session.interact(action))
+        return session.errors
+
+
+async def warm_up(port, live, timeout):
+    """
+    Load the page until the server has its data (and, with live standings, the first fetch) cached
+    """
+    import websockets
+
+    url, origin = f'ws://127.0.0.1:{port}/_stcore/stream', f'http://127.0.0.1:{port}'
+    deadline = time.monotonic() + timeout
+    async with websockets.connect(url, subprotocols=['streamlit'], origin=origin, max_size=None) as ws:
+        session = Session(ws, random.Random(0), timeout)
+        await session.rerun()
+        # The fetch starts on the first run and never blocks it
+        while live and not session.live:
+            if time.monotonic() > deadline:
+                raise RuntimeError("the dashboard never picked up the stub standings")
+            await asyncio.sleep(0.5)
+            await session.rerun()
+
+
+async def run_level(port, sessions, actions, think, timeout, seed):
+    url, origin = f'ws://127.0.0.1:{port}/_stcore/stream', f'http://127.0.0.1:{port}'
+    latencies = defaultdict(list)
+    errors = await asyncio.gather(*(
+        run_session(url, origin, seed * 1000 + i, actions, think, timeout, latencies) for i in range(sessions)
+    ), return_exceptions=True)
+    failed = [error for error in errors if isinstance(error, BaseException)]
+    return latencies, sum(error for error in errors if not isinstance(error, BaseException)), failed
+
+
+def percentiles(values):
+    if not values:
+        return {'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'max_ms': None}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {'p50_ms': round(p50, 1), 'p95_ms': round(p95, 1), 'p99_ms': round(p99, 1),
+            'max_ms': round(max(values), 1)}
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, tolerance, min_delta_ms):
+    """
+    Print current/baseline p95 ratios; returns the regressed session counts
+    """
+    with open(baseline_path) as f:
+        baseline = {row['sessions']: row for row in json.load(f)['results']}
+
+    regressions = []
+    print(f"\nvs {baseline_path} (tolerance {tolerance:.0%}, rerun p95)")
+    for row in results:
+        previous = baseline.get(row['sessions'])
+        if previous is None or previous['p95_ms'] is None or row['p95_ms'] is None:
+            continue
+        ratio = row['p95_ms'] / previous['p95_ms'] if previous['p95_ms'] else float('inf')
+        slower = row['p95_ms'] - previous['p95_ms'] > min_delta_ms
+        flag = 'REGRESSION' if ratio > 1 + tolerance and slower else ''
+        if flag:
+            regressions.append(row['sessions'])
+        print(f"{row['sessions']:>8} sessions {previous['p95_ms']:>10.1f} -> {row['p95_ms']:>10.1f} ms "
+              f"{ratio:>6.2f}x {flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 5, 10, 25], help="Concurrent sessions per level")
+    parser.add_argument('--actions', type=int, default=10, help="Widget changes per session")
+    parser.add_argument('--think', type=float, default=0.5, help="Mean seconds between a session's interactions")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--standings', choices=['stub', 'unreachable'], default='stub',
+                        help="Live standings from a local stub feed, or an unreachable address (static table)")
+    parser.add_argument('--timeout', type=float, default=120, help="Seconds to wait for one rerun or for startup")
+    parser.add_argument('--output', default='bench_load.json')
+    parser.add_argument('--compare', help="Previous results file to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed slowdown before flagging (0.25 = 25%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=20.0, help="Ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        sys.exit("bench_load.py needs the websockets package: pip install websockets")
+
+    stub = StandingsStubServer().start() if args.standings == 'stub' else None
+    standings_url = stub.url if stub is not None else 'http://127.0.0.1:9/standings'
+    port = free_port()
+    process = start_app(port, standings_url, args.timeout)
+    sampler = ProcessSampler(process.pid)
+    # Warm up first, so the data load and first-run caches are not charged to the sessions
+    asyncio.run(warm_up(port, stub is not None, args.timeout))
+    idle_rss = sampler.rss()
+
+    results = []
+    failures = 0
+    print(f"{'sessions':>8} {'reruns':>7} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9} "
+          f"{'load p95':>9} {'errors':>7} {'CPU %':>6} {'RSS MB':>7} {'MB/sess':>8}")
+    try:
+        for sessions in args.sessions:
+            cpu_start, wall_start = sampler.cpu_seconds(), time.perf_counter()
+            with sampler:
+                latencies, errors, failed = asyncio.run(
+                    run_level(port, sessions, args.actions, args.think, args.timeout, args.seed)
+                )
+            wall = time.perf_counter() - wall_start
+            cpu_end, rss = sampler.cpu_seconds(), sampler.rss()
+            cpu_percent = (cpu_end - cpu_start) / wall * 100 if cpu_start is not None and cpu_end is not None else None
+
+            reruns = [ms for action, _ in MIX for ms in latencies[action]]
+            row = {
+                'sessions': sessions,
+                'reruns': len(reruns),
+                **percentiles(reruns),
+                'load_p95_ms': percentiles(latencies['load'])['p95_ms'],
+                'by_interaction': {action: percentiles(latencies[action]) for action, _ in MIX},
+                'errors': errors,
+                'failed_sessions': len(failed),
+                'cpu_percent': round(cpu_percent, 1) if cpu_percent is not None else None,
+                'rss_mb': round(rss / 1e6, 1) if rss else None,
+                'peak_rss_mb': round(sampler.peak_rss / 1e6, 1) if sampler.peak_rss else None,
+                'rss_per_session_mb': round((sampler.peak_rss - idle_rss) / 1e6 / sessions, 2) if idle_rss else None,
+                'wall_s': round(wall, 2)
+            }
+            results.append(row)
+            failures += errors + len(failed)
+            for error in failed:
+                print(f"  session failed: {error!r}")
+
+            def show(value, fmt):
+                return format(value, fmt) if value is not None else '-'
+
+            print(f"{sessions:>8} {len(reruns):>7} {show(row['p50_ms'], '>9.1f')} {show(row['p95_ms'], '>9.1f')} "
+                  f"{show(row['p99_ms'], '>9.1f')} {show(row['max_ms'], '>9.1f')} {show(row['load_p95_ms'], '>9.1f')} "
+                  f"{errors + len(failed):>7} {show(row['cpu_percent'], '>6.1f')} {show(row['peak_rss_mb'], '>7.1f')} "
+                  f"{show(row['rss_per_session_mb'], '>8.2f')}")
+    finally:
+        process.terminate()
+        try:
+            process.wait(10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        if stub is not None:
+            stub.stop()
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'cpus': os.cpu_count(),
+            'actions': args.actions,
+            'think_s': args.think,
+            'mix': dict(MIX),
+            'standings': args.standings,
+            'seed': args.seed,
+            'idle_rss_mb': round(idle_rss / 1e6, 1) if idle_rss else None
+        },
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {len(results)} levels to {args.output}")
+
+    regressions = compare(results, args.compare, args.tolerance, args.min_delta_ms) if args.compare else []
+    if regressions or failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Lookup benchmark: boolean-mask filtering vs the (Season, Team) index
+
+Times the dashboard's selections - one season for a team subset, a subset's
+history across seasons, and a single club-season row - with full-column
+masks and with ``TeamSeasonIndex`` on synthetic leagues of increasing size.
+
+Run with: python benchmarks/bench_lookup.py [--sizes 20x5 2000x50 20000x50] [--repeat 50]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plfinance.dataset import load_dataset
+from plfinance.schema import TeamSeasonIndex, season_mask, team_mask
+from plfinance.synthetic import SyntheticDataSource
+
+SUBSET_SIZE = 6
+
+
+def best_ms(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['20x5', '2000x50', '20000x50'], help="clubs x seasons")
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} {'selection':>14} {'mask (ms)':>10} {'index (ms)':>11} {'speedup':>8}")
+    for size in args.sizes:
+        clubs, seasons = (int(part) for part in size.split('x'))
+        dataset = load_dataset(SyntheticDataSource(clubs, seasons))
+        financial, dictionary = dataset.financial, dataset.dictionary
+        rng = np.random.default_rng(0)
+        season = dataset.seasons[len(dataset.seasons) // 2]
+        teams = list(rng.choice(dictionary.team_dtype.categories, SUBSET_SIZE, replace=False))
+        team = teams[0]
+
+        build_ms = best_ms(lambda: TeamSeasonIndex(financial, dictionary), max(3, args.repeat // 10))
+        index = dataset.index
+        cases = [
+            ('season+teams',
+             lambda: financial[season_mask(financial, season, dictionary) & team_mask(financial, teams, dictionary)],
+             lambda: index.take(financial, season, teams)),
+            ('team history',
+             lambda: financial[team_mask(financial, teams, dictionary)],
+             lambda: index.take(financial, teams=teams)),
+            ('single row',
+             lambda: financial[season_mask(financial, season, dictionary) & team_mask(financial, [team], dictionary)].iloc[0],
+             lambda: financial.iloc[index.row(season, team)])
+        ]
+        for name, masked, indexed in cases:
+            assert masked().equals(indexed()), name
+            mask_ms, index_ms = best_ms(masked, args.repeat), best_ms(indexed, args.repeat)
+            print(f"{len(financial):>9} {name:>14} {mask_ms:>10.3f} {index_ms:>11.3f} {mask_ms / index_ms:>7.1f}x")
+        print(f"{len(financial):>9} {'index build':>14} {'':>10} {build_ms:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
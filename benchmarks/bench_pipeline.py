@@ -0,0 +1,158 @@
+"""
+Pipeline benchmark suite: the dashboard's stages on synthetic leagues of increasing size
+
+Times load, merge (current season + standings), filter, FEI, risk evaluation,
+pivot/growth and export for each size tier on deterministic synthetic data
+(plfinance/synthetic.py), and saves the results as JSON. Passing a previous
+results file with --compare prints the ratio per stage and exits non-zero when
+any stage got slower than the tolerance (and by more than --min-delta-ms), so releases can be checked for
+regressions.
+
+Run with: python benchmarks/bench_pipeline.py [--tiers small medium large] [--output results.json]
+                                              [--compare baseline.json] [--tolerance 0.25] [--min-delta-ms 1]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plfinance.dataset import load_dataset, season_view
+from plfinance.export import export_bytes
+from plfinance.fei import calculate_fei
+from plfinance.growth import GrowthAnalytics, season_comparison
+from plfinance.risk import evaluate_risk_rules
+from plfinance.sample_data import CURRENT_SEASON
+from plfinance.schema import to_presentation
+from plfinance.synthetic import SyntheticDataSource
+
+# (clubs, seasons) per tier
+TIERS = {
+    'small': (20, 10),
+    'medium': (200, 30),
+    'large': (2000, 50)
+}
+
+
+def stages(source, export_format):
+    """
+    (name, callable) per pipeline stage; later stages reuse the loaded dataset
+    """
+    dataset = load_dataset(source)
+    teams = dataset.teams
+    middle_season = dataset.seasons[len(dataset.seasons) // 2]
+    financial = dataset.financial
+    scored = financial.assign(FEI=calculate_fei(financial))
+
+    return [
+        ('load', lambda: load_dataset(source)),
+        ('merge', lambda: season_view(dataset, CURRENT_SEASON, teams)),
+        ('filter', lambda: season_view(dataset, middle_season, teams[::2])),
+        ('fei', lambda: calculate_fei(financial)),
+        ('risk', lambda: evaluate_risk_rules(scored, group_by='Season', messages=False)),
+        ('pivot_growth', lambda: (season_comparison(dataset.historical), GrowthAnalytics.from_frame(financial))),
+        ('export', lambda: export_bytes(to_presentation(financial), export_format))
+    ]
+
+
+def time_stage(fn, repeat):
+    fn()  # warm-up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings), statistics.median(timings)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, tolerance, min_delta_ms):
+    """
+    Print current/baseline median ratios; returns the regressed (tier, stage) pairs
+    """
+    with open(baseline_path) as f:
+        baseline = {(row['tier'], row['stage']): row for row in json.load(f)['results']}
+
+    regressions = []
+    print(f"\nvs {baseline_path} (tolerance {tolerance:.0%})")
+    for row in results:
+        previous = baseline.get((row['tier'], row['stage']))
+        if previous is None:
+            continue
+        ratio = row['median_ms'] / previous['median_ms'] if previous['median_ms'] else float('inf')
+        # Sub-millisecond stages are too noisy to flag on the ratio alone
+        slower = row['median_ms'] - previous['median_ms'] > min_delta_ms
+        flag = 'REGRESSION' if ratio > 1 + tolerance and slower else ''
+        if flag:
+            regressions.append((row['tier'], row['stage']))
+        print(f"{row['tier']:>8} {row['stage']:>13} {previous['median_ms']:>10.2f} -> {row['median_ms']:>10.2f} ms "
+              f"{ratio:>6.2f}x {flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tiers', nargs='+', default=list(TIERS), choices=list(TIERS))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--export-format', default='csv.gz')
+    parser.add_argument('--output', default='bench_pipeline.json')
+    parser.add_argument('--compare', help="Previous results file to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed slowdown before flagging (0.25 = 25%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=1.0, help="Ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'tier':>8} {'rows':>8} {'stage':>13} {'min (ms)':>10} {'median (ms)':>12}")
+    for tier in args.tiers:
+        clubs, seasons = TIERS[tier]
+        source = SyntheticDataSource(clubs, seasons, seed=args.seed)
+        rows = clubs * seasons
+        for stage, fn in stages(source, args.export_format):
+            best, median = time_stage(fn, args.repeat)
+            results.append({
+                'tier': tier, 'clubs': clubs, 'seasons': seasons, 'rows': rows, 'stage': stage,
+                'min_ms': round(best, 3), 'median_ms': round(median, 3), 'repeat': args.repeat
+            })
+            print(f"{tier:>8} {rows:>8} {stage:>13} {best:>10.2f} {median:>12.2f}")
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+            'seed': args.seed,
+            'export_format': args.export_format
+        },
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {len(results)} timings to {args.output}")
+
+    if args.compare and compare(results, args.compare, args.tolerance, args.min_delta_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
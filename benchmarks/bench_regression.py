@@ -0,0 +1,74 @@
+"""
+Regression benchmark: fits combined from cached moments vs refits from the data rows
+
+For synthetic leagues of increasing size, times the points-vs-revenue fits
+(OLS and Spearman for every revenue stream) of a random team subset over a
+season range. It compares ``RegressionStats``, which combines per-season
+moments built once at load, with a refit that joins and filters the raw
+frames every time. Both must agree.
+
+Run with: python benchmarks/bench_regression.py [--sizes 20x10 200x30 2000x50] [--subset 20] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plfinance.dataset import load_dataset
+from plfinance.regression import REGRESSION_STREAMS, RegressionStats
+from plfinance.synthetic import SyntheticDataSource
+
+
+def refit(dataset, seasons, teams):
+    """
+    Slope, Pearson r and Spearman rho per stream, recomputed from the joined rows
+    """
+    frame = pd.merge(
+        dataset.performance[['Season', 'Team', 'Points']],
+        dataset.financial[['Season', 'Team', *REGRESSION_STREAMS]],
+        on=['Season', 'Team']
+    )
+    frame = frame[frame['Season'].isin(seasons) & frame['Team'].isin(teams)]
+    y = frame['Points'].to_numpy(dtype=np.float64)
+    rows = []
+    for stream in REGRESSION_STREAMS:
+        x = frame[stream].to_numpy(dtype=np.float64)
+        slope = np.polyfit(x, y, 1)[0]
+        rows.append((slope, np.corrcoef(x, y)[0, 1], pd.Series(x).rank().corr(pd.Series(y).rank())))
+    return pd.DataFrame(rows, index=REGRESSION_STREAMS, columns=['Slope', 'Pearson_r', 'Spearman_rho'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['20x10', '200x30', '2000x50'], help="clubs x seasons")
+    parser.add_argument('--subset', type=int, default=20, help="teams per selection")
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} {'selection':>16} {'build (ms)':>11} {'moments (ms)':>13} {'refit (ms)':>11} {'speedup':>8}")
+    for size in args.sizes:
+        clubs, n_seasons = (int(part) for part in size.split('x'))
+        dataset = load_dataset(SyntheticDataSource(clubs, n_seasons))
+        build_ms = min(timeit.repeat(lambda: RegressionStats.from_dataset(dataset), number=1, repeat=3)) * 1000
+        stats = RegressionStats.from_dataset(dataset)
+
+        rng = np.random.default_rng(0)
+        teams = list(rng.choice(dataset.teams, min(args.subset, clubs), replace=False))
+        selections = [('all seasons', dataset.seasons), ('last 5 seasons', dataset.seasons[-5:])]
+        for name, seasons in selections:
+            fitted = stats.fit(seasons, teams)
+            expected = refit(dataset, seasons, teams)
+            assert np.allclose(fitted[expected.columns], expected, atol=1e-9), name
+            moments_ms = min(timeit.repeat(lambda: stats.fit(seasons, teams), number=1, repeat=args.repeat)) * 1000
+            refit_ms = min(timeit.repeat(lambda: refit(dataset, seasons, teams), number=1, repeat=args.repeat)) * 1000
+            print(f"{clubs * n_seasons:>9} {name:>16} {build_ms:>11.1f} {moments_ms:>13.3f} {refit_ms:>11.3f} "
+                  f"{refit_ms / moments_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Report export benchmark: a full pack of single-document reports (every season, all six clubs)
+
+Times building the report content, the self-contained interactive HTML, a
+first and a repeat export through the document cache (content built on the
+first only), and, when kaleido is installed, the static-image documents:
+cold with charts rendered serially, cold on the process pool, and warm from
+the image cache. PDF is timed as well when weasyprint is installed.
+
+Run with: python benchmarks/bench_report.py [--workers 4] [--output-dir DIR]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plfinance.cache import MemoryCache
+from plfinance.dataset import load_dataset
+from plfinance.kpi import KPIAggregates
+from plfinance.report import ReportExporter, pdf_export_available, report_content, report_version, static_export_available
+
+
+def export_pack(exporter, contents, fmt, output_dir):
+    """
+    Seconds and total bytes to export and write every report in the pack
+    """
+    start = time.perf_counter()
+    total = 0
+    for content in contents:
+        data = exporter.export(content, fmt)
+        path = os.path.join(output_dir, f"{content.season}.{fmt}")
+        with open(path, 'wb') as f:
+            f.write(data)
+        total += len(data)
+    return time.perf_counter() - start, total
+
+
+def cached_pack(exporter, dataset, kpi_aggregates, fmt, output_dir):
+    """
+    Seconds and total bytes to export every season through the document cache, as the dashboard does
+    """
+    start = time.perf_counter()
+    total = 0
+    for season in dataset.seasons:
+        data = exporter.cached_export(
+            None, season, dataset.teams, report_version(dataset, targets=kpi_aggregates.targets),
+            lambda: report_content(dataset, season, dataset.teams, kpi_aggregates), fmt
+        )
+        with open(os.path.join(output_dir, f"{season}.{fmt}"), 'wb') as f:
+            f.write(data)
+        total += len(data)
+    return time.perf_counter() - start, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--output-dir', default=None, help="Where to write the documents (default: a temporary directory)")
+    args = parser.parse_args()
+
+    # Keep the one-off Plotly import out of the timings
+    import plotly.express  # noqa: F401
+
+    dataset = load_dataset()
+    kpi_aggregates = KPIAggregates.from_frame(dataset.financial)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = args.output_dir or tmp
+        os.makedirs(output_dir, exist_ok=True)
+
+        start = time.perf_counter()
+        contents = [report_content(dataset, season, dataset.teams, kpi_aggregates) for season in dataset.seasons]
+        charts = sum(len(content.figures) for content in contents)
+        print(f"pack: {len(contents)} seasons x {len(dataset.teams)} teams, {charts} charts")
+        print(f"{'content':>28} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+        rows = []
+        with ReportExporter(workers=0) as exporter:
+            rows.append(('html (interactive)', *export_pack(exporter, contents, 'html', output_dir)))
+            rows.append(('html + content, first', *cached_pack(exporter, dataset, kpi_aggregates, 'html', output_dir)))
+            rows.append(('html + content, repeat', *cached_pack(exporter, dataset, kpi_aggregates, 'html', output_dir)))
+
+        if static_export_available():
+            with ReportExporter(cache=MemoryCache(), workers=0) as serial:
+                rows.append(('html-static cold, serial', *export_pack(serial, contents, 'html-static', output_dir)))
+            with ReportExporter(cache=MemoryCache(), workers=args.workers) as pooled:
+                rows.append((f'html-static cold, {args.workers} workers',
+                             *export_pack(pooled, contents, 'html-static', output_dir)))
+                rows.append(('html-static warm (cached)', *export_pack(pooled, contents, 'html-static', output_dir)))
+                if pdf_export_available():
+                    rows.append(('pdf (cached charts)', *export_pack(pooled, contents, 'pdf', output_dir)))
+        else:
+            print("kaleido not installed: static-image and PDF timings skipped")
+
+        for label, seconds, nbytes in rows:
+            print(f"{label:>28} {seconds * 1000:>10.1f} ms {nbytes / 1e6:>8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
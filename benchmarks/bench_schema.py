@@ -0,0 +1,83 @@
+"""
+Schema benchmark: memory and filter/pivot latency, object/float64 vs categorical/float32
+
+Run with: python benchmarks/bench_schema.py [--clubs 100] [--seasons 50] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plfinance.schema import TeamSeasonDictionary, apply_schema, memory_usage_mb, schema_pivot, season_mask, team_mask
+
+
+def financial_frame(clubs, seasons, seed=7):
+    """
+    Synthetic multi-season financial frame with the dashboard's columns
+    """
+    rng = np.random.default_rng(seed)
+    rows = clubs * seasons
+    matchday = rng.uniform(5, 120, rows).round(1)
+    broadcasting = rng.uniform(80, 330, rows).round(1)
+    commercial = rng.uniform(20, 380, rows).round(1)
+    return pd.DataFrame({
+        'Team': np.tile([f"Club {i:05d}" for i in range(clubs)], seasons).astype(object),
+        'Matchday_Revenue': matchday,
+        'Broadcasting_Revenue': broadcasting,
+        'Commercial_Revenue': commercial,
+        'Total_Revenue': (matchday + broadcasting + commercial).round(1),
+        'Revenue_Growth': rng.uniform(-20, 30, rows).round(1),
+        'Season': np.repeat([f"{1975 + i}-{(76 + i) % 100:02d}" for i in range(seasons)], clubs).astype(object)
+    })
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clubs', type=int, default=100)
+    parser.add_argument('--seasons', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    plain = financial_frame(args.clubs, args.seasons)
+    dictionary = TeamSeasonDictionary.from_frames(plain)
+    compact = apply_schema(plain, dictionary)
+
+    season = plain['Season'].iloc[len(plain) // 2]
+    teams = plain['Team'].unique()[::3].tolist()
+
+    variants = {
+        'object/float64': (
+            plain,
+            lambda: plain[(plain['Season'] == season).to_numpy() & plain['Team'].isin(teams).to_numpy()],
+            lambda: plain[plain['Team'].isin(teams)].pivot(index='Team', columns='Season', values='Total_Revenue')
+        ),
+        'categorical/float32': (
+            compact,
+            lambda: compact[season_mask(compact, season, dictionary) & team_mask(compact, teams, dictionary)],
+            lambda: schema_pivot(compact[team_mask(compact, teams, dictionary)])
+        )
+    }
+
+    print(f"{args.clubs} clubs x {args.seasons} seasons ({len(plain)} rows), {len(teams)} teams selected")
+    print(f"{'schema':>20} {'memory (MB)':>12} {'filter (ms)':>12} {'pivot (ms)':>11}")
+    for name, (frame, filter_fn, pivot_fn) in variants.items():
+        print(f"{name:>20} {memory_usage_mb(frame):>12.2f} {best_of(filter_fn, args.repeat):>12.3f} "
+              f"{best_of(pivot_fn, args.repeat):>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+What-if simulator benchmark: scenario throughput and batch memory
+
+Runs the Monte Carlo simulator for the bundled six clubs and for synthetic
+leagues, reporting scenarios per second and the peak memory traced while
+simulating. The peak stays near the ``--max-cells`` batch budget however
+many scenarios are requested.
+
+Run with: python benchmarks/bench_simulation.py [--scenarios 100000 1000000] [--clubs 6 200]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plfinance.dataset import load_dataset
+from plfinance.schema import to_presentation
+from plfinance.simulation import DEFAULT_MAX_CELLS, SIMULATION_COLUMNS, simulate
+from plfinance.synthetic import SyntheticDataSource
+
+
+def season_frame(clubs):
+    """
+    Latest-season frame for the bundled data (6 clubs) or a synthetic league of ``clubs``
+    """
+    source = None if clubs == 6 else SyntheticDataSource(clubs, 2)
+    dataset = load_dataset(source)
+    season = dataset.seasons[-1]
+    return season, to_presentation(dataset.index.take(dataset.financial, season))[SIMULATION_COLUMNS]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scenarios', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--clubs', type=int, nargs='+', default=[6, 200])
+    parser.add_argument('--max-cells', type=int, default=DEFAULT_MAX_CELLS)
+    args = parser.parse_args()
+
+    print(f"{'clubs':>6} {'scenarios':>10} {'seconds':>9} {'scenarios/s':>12} {'peak MB':>8} {'P(target)':>10}")
+    for clubs in args.clubs:
+        season, df = season_frame(clubs)
+        # Target the observed league total, so roughly half the scenarios reach it
+        target = float(df['Total_Revenue'].sum())
+        for n_scenarios in args.scenarios:
+            tracemalloc.start()
+            start = time.perf_counter()
+            result = simulate(df, target, n_scenarios=n_scenarios, max_cells=args.max_cells)
+            seconds = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{len(df):>6} {n_scenarios:>10,} {seconds:>9.2f} {n_scenarios / seconds:>12,.0f} "
+                  f"{peak / 1e6:>8.1f} {result.target_probability:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
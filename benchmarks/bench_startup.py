@@ -0,0 +1,100 @@
+"""
+Startup benchmark: import cost of the core package entry points and the UI shell
+
+Each target is imported in a fresh interpreter under ``python -X importtime``;
+the table shows the cumulative import time of the target, the heaviest
+modules it pulled in, and which heavy dependencies ended up loaded.
+
+Run with: python benchmarks/bench_startup.py [--repeat 5] [--top 3] [--json results.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = [
+    'plfinance',
+    'plfinance.fei',
+    'plfinance.kpi',
+    'plfinance.dataset',
+    'plfinance.risk',
+    'plfinance.growth',
+    'plfinance.figures',
+    'premier_league_reports',
+    'premier_league_dashboard'
+]
+HEAVY_MODULES = ['numpy', 'pandas', 'pyarrow', 'plotly', 'streamlit', 'httpx']
+
+# Wall-clock import time is taken inside the probe; -X importtime gives the per-module breakdown
+_PROBE = (
+    "import importlib, json, sys, time; start = time.perf_counter(); importlib.import_module({target!r}); "
+    "ms = (time.perf_counter() - start) * 1000; "
+    "print(json.dumps({{'ms': ms, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))"
+)
+
+
+def parse_importtime(stderr):
+    """
+    {module: (self_us, cumulative_us)} from ``-X importtime`` output, interpreter startup (site) excluded
+    """
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if name.strip() == 'site':
+            # Everything logged so far was imported during interpreter startup
+            timings.clear()
+            continue
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def measure(target):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _PROBE.format(target=target, heavy=HEAVY_MODULES)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    return parse_importtime(result.stderr), probe['ms'], probe['loaded']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--targets', nargs='+', default=TARGETS)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=3)
+    parser.add_argument('--json', help="Also write the results to this file")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'target':>26} {'median (ms)':>12}  {'loaded':<40} heaviest")
+    for target in args.targets:
+        runs = [measure(target) for _ in range(args.repeat)]
+        cumulative = [ms for _, ms, _ in runs]
+        timings, _, loaded = runs[-1]
+        heaviest = sorted(
+            ((name, cum) for name, (_, cum) in timings.items() if '.' not in name and name != target),
+            key=lambda item: item[1], reverse=True
+        )[:args.top]
+        results.append({
+            'target': target,
+            'median_ms': round(statistics.median(cumulative), 2),
+            'runs_ms': [round(ms, 2) for ms in cumulative],
+            'loaded': loaded,
+            'heaviest': [{'module': name, 'ms': round(cum / 1000, 2)} for name, cum in heaviest]
+        })
+        print(f"{target:>26} {statistics.median(cumulative):>12.1f}  {','.join(loaded) or '-':<40} "
+              + ', '.join(f"{name} {cum / 1000:.0f}ms" for name, cum in heaviest))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'python': sys.version.split()[0], 'results': results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Rolling-form benchmark: incremental appends vs recomputing the full history
+
+Replays a synthetic season one matchday at a time. After each matchday the
+form over the last N matches is read for every club, either from
+``FormTracker`` (new results appended to prefix sums) or by recomputing a
+pandas rolling window over every match so far. Both must agree. Season
+revenue is timed the same way: one new season appended to
+``RollingRevenue`` vs rebuilding the rolling mean from the full table.
+
+Run with: python benchmarks/bench_timeseries.py [--clubs 20 200 2000] [--matchdays 38] [--window 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plfinance.dataset import load_dataset
+from plfinance.growth import GrowthAnalytics
+from plfinance.synthetic import SyntheticDataSource, synthetic_matches
+from plfinance.timeseries import FormTracker, RollingRevenue
+
+
+def recomputed_form(matches, window):
+    """
+    Last-``window`` points per game for every club, recomputed from all matches so far
+    """
+    home = matches['Home_Goals'].to_numpy()
+    away = matches['Away_Goals'].to_numpy()
+    perspectives = pd.DataFrame({
+        'Order': np.tile(np.arange(len(matches)), 2),
+        'Team': np.concatenate([matches['Home_Team'].to_numpy(), matches['Away_Team'].to_numpy()]),
+        'Points': np.concatenate([3 * (home > away) + (home == away), 3 * (away > home) + (home == away)])
+    }).sort_values(['Team', 'Order'], kind='stable')
+    rolling = perspectives.groupby('Team')['Points'].rolling(window, min_periods=1).mean()
+    return rolling.groupby(level='Team').last()
+
+
+def bench_form(clubs, matchdays, window):
+    matches = synthetic_matches(clubs, matchdays)
+    rounds = matches['Round'].to_numpy()
+    tracker = FormTracker()
+    incremental = recompute = 0.0
+    for md in range(1, matchdays + 1):
+        played = matches[np.isin(rounds, [f"Matchday {n}" for n in range(1, md + 1)])]
+        new = matches[rounds == f"Matchday {md}"]
+
+        start = time.perf_counter()
+        tracker.extend(new)
+        form = tracker.form(window)
+        incremental += time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = recomputed_form(played, window)
+        recompute += time.perf_counter() - start
+
+    assert np.allclose(form.set_index('Team')['Form_PPG'], expected.loc[form['Team']].to_numpy())
+    return incremental / matchdays * 1000, recompute / matchdays * 1000
+
+
+def bench_revenue(clubs, seasons, window):
+    financial = load_dataset(SyntheticDataSource(clubs, seasons)).financial
+    last = financial['Season'].cat.categories[-1]
+    history, newest = financial[financial['Season'] != last], financial[financial['Season'] == last]
+    rolling = RollingRevenue.from_frame(history)
+
+    start = time.perf_counter()
+    rolling.extend(newest)
+    latest = rolling.latest(window)
+    incremental = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = GrowthAnalytics.from_frame(financial, streams=['Total_Revenue'], window=window).rolling['Total_Revenue'][last]
+    recompute = time.perf_counter() - start
+
+    assert np.allclose(latest.set_index('Team')['Rolling_Revenue'], expected.loc[latest['Team']].to_numpy(), atol=1e-3)
+    return incremental * 1000, recompute * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clubs', type=int, nargs='+', default=[20, 200, 2000])
+    parser.add_argument('--matchdays', type=int, default=38)
+    parser.add_argument('--seasons', type=int, default=30)
+    parser.add_argument('--window', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'clubs':>6} {'series':>22} {'append (ms)':>12} {'recompute (ms)':>15} {'speedup':>8}")
+    for clubs in args.clubs:
+        rows = [
+            ('form, per matchday', *bench_form(clubs, args.matchdays, args.window)),
+            ('revenue, new season', *bench_revenue(clubs, args.seasons, 3))
+        ]
+        for name, incremental_ms, recompute_ms in rows:
+            print(f"{clubs:>6} {name:>22} {incremental_ms:>12.3f} {recompute_ms:>15.3f} "
+                  f"{recompute_ms / incremental_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
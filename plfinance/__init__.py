@@ -0,0 +1,46 @@
+"""
+Core analytics for the Premier League Performance & Financial Analytics Dashboard
+
+No Streamlit or Plotly dependency: chart builders import Plotly on first use,
+and the names below are resolved lazily, so ``import plfinance`` is cheap and
+``from plfinance.fei import fei_scores`` only pulls in NumPy.
+"""
+import importlib
+
+# Public name -> defining module, imported on first attribute access
+_EXPORTS = {
+    'Dataset': 'plfinance.dataset',
+    'FormTracker': 'plfinance.timeseries',
+    'GrowthAnalytics': 'plfinance.growth',
+    'KPIAggregates': 'plfinance.kpi',
+    'LeagueCatalog': 'plfinance.leagues',
+    'LeagueTable': 'plfinance.standings',
+    'RegressionStats': 'plfinance.regression',
+    'RollingRevenue': 'plfinance.timeseries',
+    'calculate_fei': 'plfinance.fei',
+    'compare_leagues': 'plfinance.leagues',
+    'evaluate_risk_rules': 'plfinance.risk',
+    'fei_scores': 'plfinance.fei',
+    'get_catalog': 'plfinance.leagues',
+    'get_data_source': 'plfinance.data_sources',
+    'load_dataset': 'plfinance.dataset',
+    'season_comparison': 'plfinance.growth',
+    'season_view': 'plfinance.dataset',
+    'standings_from_matches': 'plfinance.standings',
+    'strategic_recommendations': 'plfinance.risk'
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'plfinance' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,317 @@
+"""
+Pluggable cache backends shared by the data loader and the standings fetcher
+
+``DiskCache`` keeps pickled values in one SQLite file (WAL mode, reads served
+through a memory map), so every process on a host - Streamlit replicas, report
+workers - shares one warm copy. Entries carry a TTL, an optional ``version``
+(e.g. a fingerprint of the source data; a mismatch counts as a miss) and the
+content hash of the stored value, so consumers can tell whether a refill
+actually changed anything. Fills are single-flight: a per-key file lock makes
+concurrent processes wait for the first one instead of all recomputing.
+
+``MemoryCache`` has the same interface for a single process, optionally as an
+LRU bounded by the pickled size of its values. Set PL_CACHE_DIR to enable the
+disk cache; without it callers fall back to per-process caching. The disk
+cache drops long-expired entries as it is written to. File locks use
+``fcntl`` (POSIX).
+"""
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# Directory for the shared cache database and lock files
+CACHE_DIR_ENV = 'PL_CACHE_DIR'
+CACHE_FILE = 'plfinance-cache.sqlite'
+DEFAULT_TTL = 3600
+
+# SQLite memory-map window for reads
+MMAP_BYTES = 256 * 1024 * 1024
+
+# Seconds between a process's purges of expired disk entries, run when it stores a value
+PURGE_INTERVAL = 600
+# Expired entries are kept this long for stale reads (e.g. standings validators) before a purge drops them
+PURGE_GRACE = DEFAULT_TTL
+
+
+def content_hash(data):
+    """
+    Hex SHA-256 of bytes (or of the pickled object)
+    """
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        data = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    return hashlib.sha256(data).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    value: object
+    content_hash: str
+    version: str
+    created_at: float
+    expires_at: float
+
+    @property
+    def expired(self):
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+
+class CacheBackend:
+    """
+    get/set/lock primitives plus the single-flight ``get_or_fill`` built on them
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.fills = 0
+
+    def get(self, key, version=None, stale_ok=False):
+        """
+        Entry for ``key``, or None when missing, of another version, or expired (unless ``stale_ok``)
+        """
+        raise NotImplementedError
+
+    def set(self, key, value, ttl=None, version=None, digest=None):
+        """
+        Store ``value``; ``digest`` overrides the content hash (default: hash of the pickled value)
+        """
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+    def lock(self, key):
+        """
+        Context manager serializing fills of ``key``
+        """
+        raise NotImplementedError
+
+    def get_or_fill(self, key, fill, ttl=None, version=None):
+        """
+        Cached value for ``key``, computing it with ``fill()`` at most once across waiting callers
+        """
+        entry = self.get(key, version=version)
+        if entry is None:
+            with self.lock(key):
+                # Another process may have filled it while this one waited for the lock
+                entry = self.get(key, version=version)
+                if entry is None:
+                    self.misses += 1
+                    self.fills += 1
+                    entry = self.set(key, fill(), ttl=ttl, version=version)
+                    return entry.value
+        self.hits += 1
+        return entry.value
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'fills': self.fills}
+
+    @staticmethod
+    def _usable(entry, version, stale_ok):
+        if entry is None or (version is not None and entry.version != version):
+            return None
+        if entry.expired and not stale_ok:
+            return None
+        return entry
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process backend with the same semantics as ``DiskCache``
+
+    With ``max_bytes``, least recently used entries are evicted once the
+    pickled size of the stored values exceeds it.
+    """
+
+    def __init__(self, max_bytes=None):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+        self.current_bytes = 0
+        self.evictions = 0
+
+    def get(self, key, version=None, stale_ok=False):
+        with self._guard:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        return self._usable(entry, version, stale_ok)
+
+    def set(self, key, value, ttl=None, version=None, digest=None):
+        # Values are only pickled to hash them or, when bounded, to size them
+        payload = None
+        if digest is None or self.max_bytes is not None:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        entry = CacheEntry(
+            value=value,
+            content_hash=digest or content_hash(payload),
+            version=version,
+            created_at=now,
+            expires_at=None if ttl is None else now + ttl
+        )
+        size = 0 if payload is None else len(payload)
+        with self._guard:
+            self._pop(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                # Larger than the whole budget: return it, but don't keep it
+                return entry
+            self._entries[key] = entry
+            self._sizes[key] = size
+            self.current_bytes += size
+            while self.max_bytes is not None and self.current_bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+        return entry
+
+    def _pop(self, key):
+        if self._entries.pop(key, None) is not None:
+            self.current_bytes -= self._sizes.pop(key)
+
+    def delete(self, key):
+        with self._guard:
+            self._pop(key)
+
+    def lock(self, key):
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+
+class _FileLock:
+    """
+    Exclusive ``flock`` on a lock file, plus a thread lock for callers in the same process
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._thread_lock = threading.Lock()
+        self._file = None
+
+    def __enter__(self):
+        import fcntl
+
+        self._thread_lock.acquire()
+        try:
+            self._file = open(self.path, 'a+b')
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        except BaseException:
+            if self._file is not None:
+                self._file.close()
+            self._thread_lock.release()
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        import fcntl
+
+        try:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+        finally:
+            self._file = None
+            self._thread_lock.release()
+
+
+class DiskCache(CacheBackend):
+    """
+    SQLite-backed cache shared by every process that opens the same directory
+    """
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+        self.path = os.path.join(directory, CACHE_FILE)
+        self._lock_dir = os.path.join(directory, 'locks')
+        os.makedirs(self._lock_dir, exist_ok=True)
+        self._local = threading.local()
+        self._locks = {}
+        self._guard = threading.Lock()
+        self._next_purge = 0.0
+        self._connection().execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'key TEXT PRIMARY KEY, value BLOB NOT NULL, content_hash TEXT NOT NULL, '
+            'version TEXT, created_at REAL NOT NULL, expires_at REAL)'
+        )
+
+    def _connection(self):
+        # One connection per thread (and per process: connections never cross a fork)
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(f'PRAGMA mmap_size={MMAP_BYTES}')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key, version=None, stale_ok=False):
+        row = self._connection().execute(
+            'SELECT value, content_hash, version, created_at, expires_at FROM entries WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, digest, entry_version, created_at, expires_at = row
+        entry = CacheEntry(None, digest, entry_version, created_at, expires_at)
+        if self._usable(entry, version, stale_ok) is None:
+            return None
+        entry.value = pickle.loads(value)
+        return entry
+
+    def set(self, key, value, ttl=None, version=None, digest=None):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        entry = CacheEntry(
+            value=value,
+            content_hash=digest or content_hash(payload),
+            version=version,
+            created_at=now,
+            expires_at=None if ttl is None else now + ttl
+        )
+        self._connection().execute(
+            'INSERT OR REPLACE INTO entries (key, value, content_hash, version, created_at, expires_at) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (key, payload, entry.content_hash, version, entry.created_at, entry.expires_at)
+        )
+        if now >= self._next_purge:
+            self._next_purge = now + PURGE_INTERVAL
+            self.purge_expired(grace=PURGE_GRACE)
+        return entry
+
+    def delete(self, key):
+        self._connection().execute('DELETE FROM entries WHERE key = ?', (key,))
+
+    def purge_expired(self, grace=0):
+        """
+        Drop entries expired for at least ``grace`` seconds; returns how many were removed
+        """
+        cursor = self._connection().execute(
+            'DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?', (time.time() - grace,)
+        )
+        return cursor.rowcount
+
+    def lock(self, key):
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                name = hashlib.sha256(key.encode()).hexdigest()[:32] + '.lock'
+                lock = self._locks[key] = _FileLock(os.path.join(self._lock_dir, name))
+            return lock
+
+
+def get_cache(directory=None):
+    """
+    Disk cache in ``directory`` (or PL_CACHE_DIR); None when no shared cache is configured
+    """
+    directory = directory or os.environ.get(CACHE_DIR_ENV)
+    if not directory:
+        return None
+    return DiskCache(directory)
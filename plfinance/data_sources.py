@@ -0,0 +1,234 @@
+"""
+Pluggable data-source layer for the financial and performance tables
+
+Every source exposes the same read interface with column projection and
+Season/Team predicates. ``SampleDataSource`` serves the bundled sample dataset
+from memory; ``ParquetDataSource`` reads a Season-partitioned Parquet dataset
+through memory maps so only the requested partitions and columns are touched.
+
+On-disk layout (hive partitioning on Season)::
+
+    <root>/financial/Season=2020-21/part-0.parquet
+    <root>/performance/Season=2024-25/part-0.parquet
+"""
+import os
+
+import pandas as pd
+
+from plfinance.sample_data import CURRENT_SEASON, CURRENT_SEASON_DATA, SEASONS_FINANCIAL_DATA
+
+FINANCIAL_COLUMNS = [
+    'Team', 'Matchday_Revenue', 'Broadcasting_Revenue', 'Commercial_Revenue',
+    'Total_Revenue', 'Revenue_Growth', 'Season'
+]
+PERFORMANCE_COLUMNS = [
+    'Team', 'Matches_Played', 'Wins', 'Draws', 'Losses', 'Goals_Scored',
+    'Goals_Conceded', 'Points', 'Goal_Difference', 'Season'
+]
+
+TABLES = {
+    'financial': FINANCIAL_COLUMNS,
+    'performance': PERFORMANCE_COLUMNS
+}
+
+# Environment variable pointing at a Parquet dataset root
+DATA_DIR_ENV = 'PL_DATA_DIR'
+
+
+def _as_list(values):
+    if values is None:
+        return None
+    if isinstance(values, str):
+        return [values]
+    return list(values)
+
+
+class DataSource:
+    """
+    Base interface: read a table with optional column projection and Season/Team filters
+    """
+
+    def read(self, table, columns=None, seasons=None, teams=None):
+        raise NotImplementedError
+
+    def seasons(self, table='financial'):
+        """
+        Sorted list of seasons available for a table
+        """
+        return sorted(self.read(table, columns=['Season'])['Season'].unique().tolist())
+
+    def current_season(self):
+        """
+        Season the standings table and headline KPIs refer to: the latest with standings
+        """
+        seasons = self.seasons('performance') or self.seasons('financial')
+        return seasons[-1]
+
+    def fingerprint(self):
+        """
+        Identity (name) and content version of the source, for shared caches
+        """
+        raise NotImplementedError
+
+    def read_financial(self, columns=None, seasons=None, teams=None):
+        return self.read('financial', columns=columns, seasons=seasons, teams=teams)
+
+    def read_performance(self, columns=None, seasons=None, teams=None):
+        return self.read('performance', columns=columns, seasons=seasons, teams=teams)
+
+
+class SampleDataSource(DataSource):
+    """
+    Bundled sample dataset (top 6 clubs, 5 seasons) served from memory
+    """
+
+    def __init__(self):
+        self._tables = None
+
+    def _load(self):
+        if self._tables is None:
+            financial = []
+            for season, data in SEASONS_FINANCIAL_DATA.items():
+                season_df = pd.DataFrame(data)
+                season_df['Season'] = season
+                financial.append(season_df)
+
+            performance = pd.DataFrame(CURRENT_SEASON_DATA)
+            performance['Season'] = CURRENT_SEASON
+
+            self._tables = {
+                'financial': pd.concat(financial, ignore_index=True),
+                'performance': performance
+            }
+        return self._tables
+
+    def read(self, table, columns=None, seasons=None, teams=None):
+        df = self._load()[table]
+        seasons, teams = _as_list(seasons), _as_list(teams)
+
+        mask = pd.Series(True, index=df.index)
+        if seasons is not None:
+            mask &= df['Season'].isin(seasons)
+        if teams is not None:
+            mask &= df['Team'].isin(teams)
+
+        columns = columns or TABLES[table]
+        return df.loc[mask, columns].reset_index(drop=True)
+
+    def seasons(self, table='financial'):
+        if table == 'financial':
+            return sorted(SEASONS_FINANCIAL_DATA)
+        return [CURRENT_SEASON]
+
+    def fingerprint(self):
+        from plfinance.cache import content_hash
+
+        return 'sample', content_hash((SEASONS_FINANCIAL_DATA, CURRENT_SEASON_DATA))
+
+
+class ParquetDataSource(DataSource):
+    """
+    Season-partitioned Parquet dataset read through memory maps
+
+    Column projection and Season/Team predicates are pushed down to the
+    Arrow scanner, so partitions for other seasons are never opened and row
+    groups that cannot match the Team filter are skipped.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._datasets = {}
+
+    def _dataset(self, table):
+        if table not in self._datasets:
+            import pyarrow as pa
+            import pyarrow.dataset as ds
+            from pyarrow import fs
+
+            self._datasets[table] = ds.dataset(
+                os.path.join(self.root, table),
+                format='parquet',
+                partitioning=ds.partitioning(pa.schema([('Season', pa.string())]), flavor='hive'),
+                filesystem=fs.LocalFileSystem(use_mmap=True)
+            )
+        return self._datasets[table]
+
+    def read(self, table, columns=None, seasons=None, teams=None):
+        import pyarrow.dataset as ds
+
+        seasons, teams = _as_list(seasons), _as_list(teams)
+        columns = columns or TABLES[table]
+
+        predicate = None
+        if seasons is not None:
+            predicate = ds.field('Season').isin(seasons)
+        if teams is not None:
+            team_predicate = ds.field('Team').isin(teams)
+            predicate = team_predicate if predicate is None else predicate & team_predicate
+
+        arrow_table = self._dataset(table).to_table(columns=columns, filter=predicate)
+        df = arrow_table.to_pandas()
+
+        # Fragments may be scanned concurrently; restore season order without
+        # disturbing the team order inside each partition
+        if 'Season' in df.columns:
+            df = df.sort_values('Season', kind='stable', ignore_index=True)
+        return df
+
+    def seasons(self, table='financial'):
+        # Partition directories are enough, no file needs to be opened
+        import pyarrow.dataset as ds
+
+        seasons = set()
+        for fragment in self._dataset(table).get_fragments():
+            expression = ds.get_partition_keys(fragment.partition_expression)
+            seasons.add(expression['Season'])
+        return sorted(seasons)
+
+    def fingerprint(self):
+        # File paths, sizes and modification times: rewriting any partition changes the version
+        from plfinance.cache import content_hash
+
+        files = []
+        for table in TABLES:
+            for directory, _, names in os.walk(os.path.join(self.root, table)):
+                for name in names:
+                    stat = os.stat(os.path.join(directory, name))
+                    files.append((os.path.relpath(os.path.join(directory, name), self.root), stat.st_size, stat.st_mtime_ns))
+        return os.path.abspath(self.root), content_hash(sorted(files))
+
+
+def write_parquet_dataset(source, root):
+    """
+    Write every table of ``source`` to ``root`` as a Season-partitioned Parquet dataset
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    for table, columns in TABLES.items():
+        df = source.read(table, columns=columns)
+        ds.write_dataset(
+            pa.Table.from_pandas(df, preserve_index=False),
+            os.path.join(root, table),
+            format='parquet',
+            partitioning=ds.partitioning(pa.schema([('Season', pa.string())]), flavor='hive'),
+            basename_template='part-{i}.parquet',
+            existing_data_behavior='delete_matching'
+        )
+
+
+def get_data_source(root=None):
+    """
+    Parquet source when a dataset root is given (or set in PL_DATA_DIR), otherwise the bundled sample
+    """
+    root = root or os.environ.get(DATA_DIR_ENV)
+    if root:
+        return ParquetDataSource(root)
+    return SampleDataSource()
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Export the bundled sample dataset: python -m plfinance.data_sources <root>
+    write_parquet_dataset(SampleDataSource(), sys.argv[1])
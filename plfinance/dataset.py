@@ -0,0 +1,165 @@
+"""
+Loaded dashboard dataset and the per-season working views built from it
+
+Shared by the Streamlit dashboard and the headless report CLI, so both see
+the same frames, schema and season/team filtering.
+"""
+from dataclasses import dataclass
+
+import pandas as pd
+
+from plfinance.cache import DEFAULT_TTL
+from plfinance.data_sources import get_data_source
+from plfinance.schema import TeamSeasonDictionary, TeamSeasonIndex, apply_schema, to_presentation
+from plfinance.standings import STANDINGS_COLUMNS
+
+FEI_TABLE_COLUMNS = ['Team', 'Total_Revenue', 'Revenue_Growth', 'Commercial_Share%', 'Matchday_Share%', 'FEI']
+
+# Bumped when the pickled Dataset layout changes, so shared caches refill instead of unpickling old entries
+DATASET_FORMAT = 5
+
+
+@dataclass
+class Dataset:
+    """
+    Compact-schema frames of one league: current-season standings + finance, revenue history, all-season finance
+
+    ``index`` locates (Season, Team) rows of ``financial``; ``historical`` has
+    the same rows, so it serves both. ``performance`` holds the standings of
+    every season the source has (only the current one for the bundled data).
+    ``current_season`` is the season ``combined`` describes, and ``version``
+    the content version of the source it was loaded from.
+    """
+    combined: pd.DataFrame
+    historical: pd.DataFrame
+    financial: pd.DataFrame
+    dictionary: TeamSeasonDictionary
+    index: TeamSeasonIndex
+    performance: pd.DataFrame
+    current_season: str
+    version: str = None
+
+    @property
+    def teams(self):
+        return self.combined['Team'].tolist()
+
+    @property
+    def seasons(self):
+        return self.dictionary.season_dtype.categories.tolist()
+
+    def team_history(self, teams):
+        """
+        Revenue history (Team, Season, Total_Revenue) of a team subset, in the compact schema
+        """
+        return self.index.take(self.historical, teams=teams)
+
+    def team_financials(self, teams):
+        """
+        All-season financial rows of a team subset, in the compact schema
+        """
+        return self.index.take(self.financial, teams=teams)
+
+    def season_financials(self, season, teams=None):
+        """
+        Financial rows of one season (optionally a team subset), in the compact schema
+        """
+        return self.index.take(self.financial, season, teams)
+
+    def team_season_row(self, season, team):
+        """
+        One club-season's financial row for display (plain strings, float64), or None
+        """
+        position = self.index.row(season, team)
+        if position is None:
+            return None
+        return to_presentation(self.financial.iloc[[position]]).iloc[0]
+
+
+def load_dataset(source=None):
+    """
+    Load the frames from a data source (the configured one by default)
+    """
+    source = get_data_source() if source is None else source
+    current_season = source.current_season()
+
+    # Create comprehensive financial dataset
+    comprehensive_financial_df = source.read_financial()
+
+    # Get current season (e.g. 2024-25) financial data
+    financial_df = comprehensive_financial_df[comprehensive_financial_df['Season'] == current_season].drop(columns='Season')
+
+    # Historical revenue data (simplified for trend analysis)
+    historical_revenue = comprehensive_financial_df[['Team', 'Season', 'Total_Revenue']].copy()
+
+    # Performance data of every season, and the current season's table
+    all_performance = source.read_performance()
+    performance_df = all_performance[all_performance['Season'] == current_season].drop(columns='Season')
+
+    # Merge performance and current financial data
+    combined_df = pd.merge(performance_df, financial_df, on='Team')
+
+    # Compact schema: categorical Team/Season over one shared dictionary, float32 revenue
+    dictionary = TeamSeasonDictionary.from_frames(comprehensive_financial_df, combined_df, all_performance)
+    financial = apply_schema(comprehensive_financial_df, dictionary)
+    return Dataset(
+        combined=apply_schema(combined_df, dictionary),
+        historical=apply_schema(historical_revenue, dictionary),
+        financial=financial,
+        dictionary=dictionary,
+        index=TeamSeasonIndex(financial, dictionary),
+        performance=apply_schema(all_performance, dictionary),
+        current_season=current_season,
+        version=source.fingerprint()[1]
+    )
+
+
+def cached_dataset(cache=None, source=None, ttl=DEFAULT_TTL):
+    """
+    ``load_dataset`` through a shared cache backend, keyed on the source and versioned by its fingerprint
+
+    Without a cache (``cache=None``) this is a plain load.
+    """
+    source = get_data_source() if source is None else source
+    if cache is None:
+        return load_dataset(source)
+    name, version = source.fingerprint()
+    return cache.get_or_fill(
+        f'dataset:{name}', lambda: load_dataset(source), ttl=ttl, version=f'{version}:{DATASET_FORMAT}'
+    )
+
+
+def season_view(dataset, season, teams, standings=None):
+    """
+    Working frame for one season and team subset, and whether it carries standings
+
+    The current season is merged with the standings (``standings`` when given,
+    e.g. live data, else the static table); other seasons are financial only.
+    Rows come from the dataset's (Season, Team) index; only the small selection
+    is widened for display.
+    """
+    if season == dataset.current_season:
+        if standings is None:
+            standings = to_presentation(dataset.combined[STANDINGS_COLUMNS])
+        filtered_df = pd.merge(standings, to_presentation(dataset.season_financials(season)), on='Team')
+        return filtered_df[filtered_df['Team'].isin(teams)], True
+
+    return to_presentation(dataset.season_financials(season, teams)), False
+
+
+def fei_table(df, show_performance):
+    """
+    FEI analysis table (revenue shares, FEI, points for the current season), best FEI first
+    """
+    fei_columns = ['Team', 'Total_Revenue', 'Revenue_Growth', 'Commercial_Revenue', 'Matchday_Revenue', 'FEI']
+    if show_performance:
+        fei_columns.insert(-1, 'Points')  # Add points for current season
+
+    fei_analysis = df[fei_columns].copy()
+    fei_analysis['Commercial_Share%'] = ((fei_analysis['Commercial_Revenue'] / fei_analysis['Total_Revenue']) * 100).round(1)
+    fei_analysis['Matchday_Share%'] = ((fei_analysis['Matchday_Revenue'] / fei_analysis['Total_Revenue']) * 100).round(1)
+    fei_analysis = fei_analysis.sort_values('FEI', ascending=False)
+
+    display_columns = list(FEI_TABLE_COLUMNS)
+    if show_performance:
+        display_columns.insert(-1, 'Points')
+    return fei_analysis[display_columns]
@@ -0,0 +1,145 @@
+"""
+Lazy, chunked export of dashboard data to CSV, gzip-compressed CSV and Parquet
+
+Exports are produced from an iterable of DataFrames (chunks of one frame, or
+one season at a time from a data source) and emitted as a stream of bytes,
+so a large multi-season export never needs more than one chunk in memory.
+"""
+import io
+import zlib
+from dataclasses import dataclass
+
+DEFAULT_CHUNK_ROWS = 50_000
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    label: str
+    extension: str
+    mime: str
+
+
+EXPORT_FORMATS = {
+    'csv': ExportFormat('CSV', '.csv', 'text/csv'),
+    'csv.gz': ExportFormat('CSV (gzip)', '.csv.gz', 'application/gzip'),
+    'parquet': ExportFormat('Parquet', '.parquet', 'application/vnd.apache.parquet')
+}
+
+
+def iter_chunks(df, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Row slices of ``df`` (views, not copies)
+    """
+    for start in range(0, max(len(df), 1), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def iter_source_frames(source, seasons=None, columns=None, teams=None):
+    """
+    Financial data one season at a time, so only one partition is resident
+    """
+    for season in seasons or source.seasons():
+        yield source.read_financial(columns=columns, seasons=[season], teams=teams)
+
+
+def _iter_csv(frames):
+    header = True
+    for frame in frames:
+        yield frame.to_csv(index=False, header=header).encode()
+        header = False
+
+
+def _iter_gzip_csv(frames):
+    # wbits=31 writes a gzip container rather than a raw zlib stream
+    compressor = zlib.compressobj(level=6, wbits=31)
+    for chunk in _iter_csv(frames):
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class _DrainableBuffer(io.RawIOBase):
+    """
+    Write-only sink whose contents are handed out and discarded after every row group
+    """
+
+    def __init__(self):
+        self._parts = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b''.join(self._parts)
+        self._parts = []
+        return data
+
+
+def _iter_parquet(frames):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink = _DrainableBuffer()
+    writer = None
+    for frame in frames:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(sink, table.schema, compression='snappy')
+        else:
+            table = table.cast(writer.schema)
+        writer.write_table(table)
+        data = sink.drain()
+        if data:
+            yield data
+    if writer is not None:
+        writer.close()
+    yield sink.drain()
+
+
+_WRITERS = {
+    'csv': _iter_csv,
+    'csv.gz': _iter_gzip_csv,
+    'parquet': _iter_parquet
+}
+
+
+def iter_export(frames, fmt='csv'):
+    """
+    Stream an export of ``frames`` (an iterable of DataFrames) as chunks of bytes
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unsupported export format: {fmt!r} (expected one of {', '.join(_WRITERS)})")
+    return _WRITERS[fmt](frames)
+
+
+def write_export(frames, fmt, fileobj):
+    """
+    Write a streamed export to an open binary file; returns the number of bytes written
+    """
+    written = 0
+    for chunk in iter_export(frames, fmt):
+        fileobj.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def export_bytes(df, fmt='csv', chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Complete export of one DataFrame as bytes, e.g. for ``st.download_button``
+    """
+    return b''.join(iter_export(iter_chunks(df, chunk_rows), fmt))
+
+
+def export_file_name(stem, fmt):
+    return stem + EXPORT_FORMATS[fmt].extension
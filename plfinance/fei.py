@@ -0,0 +1,78 @@
+"""
+Vectorized Financial Efficiency Index (FEI) engine
+
+FEI = (Revenue_Growth_Factor * Commercial_Diversification * Revenue_Stability) / (Revenue_Risk_Factor)
+Where:
+- Revenue_Growth_Factor: (Revenue_Growth + 10) / 10 (normalized, minimum 0.5 for negative growth)
+- Commercial_Diversification: Commercial_Revenue / Total_Revenue (higher = better diversification)
+- Revenue_Stability: 1 + (Matchday_Revenue / Total_Revenue) (rewards balanced revenue streams)
+- Revenue_Risk_Factor: Total_Revenue / 500 (normalizes for revenue scale, target £500M)
+"""
+import numpy as np
+
+# Columns the index is computed from
+FEI_INPUT_COLUMNS = ['Revenue_Growth', 'Commercial_Revenue', 'Matchday_Revenue', 'Total_Revenue']
+
+# Floors applied to the growth and risk factors
+MIN_GROWTH_FACTOR = 0.5
+MIN_RISK_FACTOR = 0.5
+
+# Revenue scale the risk factor is normalized against (£M)
+REVENUE_NORMALIZATION = 500
+FEI_DECIMALS = 3
+
+# Distance from a rounding tie (in units of the last kept decimal) rechecked with Python's round
+TIE_TOLERANCE = 1e-6
+
+
+def round_half(values, decimals):
+    """
+    Round like Python's ``round`` on each value, over a whole array
+
+    ``np.round`` rounds the scaled float, which can land on the other side of a
+    tie than ``round`` (it rounds the double's exact decimal value), e.g. 0.2225.
+    The few values near a tie are rounded one by one with ``round``.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.array(np.round(values, decimals))
+    scaled = values * 10.0 ** decimals
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < TIE_TOLERANCE
+    for i in np.flatnonzero(near_tie):
+        rounded.flat[i] = round(float(values.flat[i]), decimals)
+    return rounded[()]
+
+
+def fei_scores(revenue_growth, commercial_revenue, matchday_revenue, total_revenue):
+    """
+    Score whole columns of revenue data at once and return a float64 array of FEI values
+    """
+    revenue_growth = np.asarray(revenue_growth, dtype=np.float64)
+    commercial_revenue = np.asarray(commercial_revenue, dtype=np.float64)
+    matchday_revenue = np.asarray(matchday_revenue, dtype=np.float64)
+    total_revenue = np.asarray(total_revenue, dtype=np.float64)
+
+    revenue_growth_factor = np.fmax(MIN_GROWTH_FACTOR, (revenue_growth + 10) / 10)
+    commercial_diversification = commercial_revenue / total_revenue
+    revenue_stability = 1 + (matchday_revenue / total_revenue)
+    revenue_risk_factor = np.fmax(MIN_RISK_FACTOR, total_revenue / REVENUE_NORMALIZATION)
+
+    fei = (revenue_growth_factor * commercial_diversification * revenue_stability) / revenue_risk_factor
+    return round_half(fei, FEI_DECIMALS)
+
+
+def calculate_fei(df):
+    """
+    Calculate the FEI for every row of a financial DataFrame (single or multi-season)
+    """
+    # pandas is only needed for frames; fei_scores works on plain arrays
+    import pandas as pd
+
+    from plfinance.schema import as_float64
+
+    scores = fei_scores(
+        as_float64(df['Revenue_Growth']),
+        as_float64(df['Commercial_Revenue']),
+        as_float64(df['Matchday_Revenue']),
+        as_float64(df['Total_Revenue'])
+    )
+    return pd.Series(scores, index=df.index, name='FEI')
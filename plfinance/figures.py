@@ -0,0 +1,496 @@
+"""
+Plotly figure factory with a process-wide memoization cache
+
+Every dashboard chart has a builder here. ``FigureCache`` memoizes built
+figures keyed on (league, chart kind, season, frozenset of teams, extra
+inputs) in a byte-bounded LRU shared across sessions, so a hit skips both
+Plotly Express construction and figure validation. Entries are sized with
+``estimate_figure_bytes``, from the trace arrays, without serializing the
+figure.
+
+The cache holds figure objects, not their serialized JSON. ``st.plotly_chart``
+always serializes the figure it is given, and a JSON dict passed instead is
+re-validated into a figure first, which costs more. Serialization per render
+is instead kept small by the WebGL and downsampling limits below.
+
+Point-heavy charts stay light for the browser: the scatter and trend line
+switch to WebGL (``Scattergl``) above ``WEBGL_POINT_THRESHOLD`` points, and
+trend lines are downsampled per team with LTTB (largest-triangle-three-buckets)
+and limited to the top clubs plus one aggregated "other clubs" line before
+serialization.
+"""
+import base64
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Points above which scatter/line traces are rendered with WebGL (PL_WEBGL_THRESHOLD overrides)
+WEBGL_THRESHOLD_ENV = 'PL_WEBGL_THRESHOLD'
+WEBGL_POINT_THRESHOLD = 1000
+
+# Trend line budget: points per team after LTTB, and team lines before aggregating the rest
+TREND_MAX_POINTS = 60
+TREND_MAX_TRACES = 20
+OTHER_CLUBS_LABEL = 'Other clubs (mean)'
+
+REVENUE_STREAM_COLUMNS = ['Matchday_Revenue', 'Broadcasting_Revenue', 'Commercial_Revenue']
+GROWTH_COLOR_SCALE = ['red', 'yellow', 'green']
+
+# Trace properties that carry per-point data, and the serialized size of everything else
+TRACE_ARRAY_PROPERTIES = [
+    'x', 'y', 'values', 'labels', 'text', 'hovertext', 'customdata', 'lowerfence', 'q1', 'median', 'q3', 'upperfence'
+]
+MARKER_ARRAY_PROPERTIES = ['color', 'size']
+FIGURE_OVERHEAD_BYTES = 7000  # layout, including the default template
+TRACE_OVERHEAD_BYTES = 400
+ENCODED_ARRAY_OVERHEAD_BYTES = 30
+
+
+def figure_key(kind, season, teams, *extra, league=None):
+    """
+    Cache key for one chart; team order does not matter, the frames are in data order
+
+    ``league`` tells apart clubs of the same name in different leagues' datasets.
+    """
+    return (league, kind, season, frozenset(teams)) + tuple(extra)
+
+
+def _array_bytes(value):
+    array = np.asarray(value)
+    if array.dtype.kind in 'biuf':
+        # Sent as {"dtype": ..., "bdata": base64}, with each '/' escaped as \u002f
+        encoded = base64.b64encode(np.ascontiguousarray(array).tobytes())
+        return len(encoded) + 5 * encoded.count(b'/') + ENCODED_ARRAY_OVERHEAD_BYTES
+    # Anything else as a JSON list of quoted strings
+    strings = array.astype(str).ravel()
+    return int(np.char.str_len(strings).sum()) + 3 * strings.size
+
+
+def _properties_bytes(obj, names):
+    size = 0
+    for name in names:
+        value = obj[name] if name in obj else None
+        if value is not None and not isinstance(value, str) and np.ndim(value):
+            size += _array_bytes(value)
+    return size
+
+
+def estimate_figure_bytes(fig):
+    """
+    Approximate serialized size of a figure, from its per-point trace arrays
+    """
+    size = FIGURE_OVERHEAD_BYTES
+    for trace in fig.data:
+        size += TRACE_OVERHEAD_BYTES + _properties_bytes(trace, TRACE_ARRAY_PROPERTIES)
+        if 'marker' in trace:
+            size += _properties_bytes(trace.marker, MARKER_ARRAY_PROPERTIES)
+    return size
+
+
+class FigureCache:
+    """
+    Thread-safe LRU of built figures, evicted by estimated serialized size
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (size, figure)
+        self._sizes = {}  # id(figure) -> size, for the cached figures
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def _drop(self, entry):
+        size, fig = entry
+        self.current_bytes -= size
+        self._sizes.pop(id(fig), None)
+
+    def put(self, key, fig):
+        size = estimate_figure_bytes(fig)
+        with self._lock:
+            if key in self._entries:
+                self._drop(self._entries.pop(key))
+            if size > self.max_bytes:
+                # Larger than the whole budget: serve it, but don't keep it
+                return fig
+            self._entries[key] = (size, fig)
+            self._sizes[id(fig)] = size
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, old = self._entries.popitem(last=False)
+                self._drop(old)
+                self.evictions += 1
+        return fig
+
+    def get_or_build(self, key, builder):
+        """
+        Cached figure for ``key``, building (and caching) it with ``builder()`` on a miss
+        """
+        fig = self.get(key)
+        if fig is None:
+            fig = self.put(key, builder())
+        return fig
+
+    def payload_bytes(self, fig):
+        """
+        Estimated serialized size of a cached figure object (None if it is not cached)
+        """
+        return self._sizes.get(id(fig))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+
+def webgl_threshold():
+    return int(os.environ.get(WEBGL_THRESHOLD_ENV, WEBGL_POINT_THRESHOLD))
+
+
+def render_mode(n_points, threshold=None):
+    """
+    Plotly Express render mode: 'webgl' (Scattergl) above the point threshold, else 'svg'
+    """
+    threshold = webgl_threshold() if threshold is None else threshold
+    return 'webgl' if n_points > threshold else 'svg'
+
+
+def lttb(x, y, n_out):
+    """
+    Indices of the ``n_out`` points kept by largest-triangle-three-buckets downsampling
+
+    First and last points are always kept; every bucket in between keeps the
+    point forming the largest triangle with the previously kept point and the
+    mean of the next bucket, which preserves peaks and troughs.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.floor(np.linspace(1, n - 1, n_out - 1)).astype(np.int64)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        kept[i + 1] = a
+    return kept
+
+
+def reduce_trend(hist_df, x='Season', y='Total_Revenue', group='Team', max_points=TREND_MAX_POINTS, max_traces=TREND_MAX_TRACES):
+    """
+    Trend frame limited to ``max_traces`` lines of at most ``max_points`` points each
+
+    Clubs beyond the top ``max_traces`` (by latest value) are averaged into one
+    line; each remaining line is LTTB-downsampled over the season order.
+    Small frames are returned unchanged.
+    """
+    import pandas as pd
+
+    seasons = sorted(hist_df[x].unique())
+    teams = hist_df[group].unique()
+    if len(teams) <= max_traces and len(seasons) <= max_points:
+        return hist_df
+
+    df = hist_df[[group, x, y]].astype({group: str, x: str})
+    if len(teams) > max_traces:
+        latest = df.sort_values(x).groupby(group, sort=False)[y].last()
+        top = set(latest.nlargest(max_traces - 1).index)
+        others = df[~df[group].isin(top)].groupby(x, as_index=False)[y].mean()
+        others[group] = OTHER_CLUBS_LABEL
+        df = pd.concat([df[df[group].isin(top)], others[[group, x, y]]], ignore_index=True)
+
+    if len(seasons) > max_points:
+        season_position = {season: i for i, season in enumerate(seasons)}
+        parts = []
+        for _, team_df in df.groupby(group, sort=False):
+            team_df = team_df.sort_values(x)
+            keep = lttb(team_df[x].map(season_position).to_numpy(), team_df[y].to_numpy(), max_points)
+            parts.append(team_df.iloc[keep])
+        df = pd.concat(parts, ignore_index=True)
+    return df
+
+
+def build_points_bar(df):
+    import plotly.express as px
+
+    return px.bar(df, x='Team', y='Points', title="Current Season Points")
+
+
+def build_revenue_bar(df, season):
+    import plotly.express as px
+
+    return px.bar(df, x='Team', y='Total_Revenue', title=f"Total Revenue {season} (£M)")
+
+
+def build_revenue_pie(team_data, title):
+    """
+    Revenue breakdown of one team (a row of the filtered frame)
+    """
+    import plotly.express as px
+
+    return px.pie(
+        values=[team_data['Matchday_Revenue'], team_data['Broadcasting_Revenue'], team_data['Commercial_Revenue']],
+        names=['Matchday', 'Broadcasting', 'Commercial'],
+        title=title
+    )
+
+
+def build_points_revenue_scatter(df, webgl_threshold=None, fit=None):
+    """
+    Points against total revenue; ``fit`` (from ``RegressionStats.line``) adds the OLS line and its confidence band
+    """
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    fig = px.scatter(
+        df,
+        x='Total_Revenue',
+        y='Points',
+        size='Goals_Scored',
+        hover_name='Team',
+        title="Points vs Revenue Correlation",
+        color='Revenue_Growth',
+        render_mode=render_mode(len(df), webgl_threshold)
+    )
+    if fit is not None:
+        band_x = np.concatenate([fit['Total_Revenue'], fit['Total_Revenue'][::-1]])
+        band_y = np.concatenate([fit['Upper'], fit['Lower'][::-1]])
+        fig.add_trace(go.Scatter(
+            x=band_x, y=band_y, fill='toself', fillcolor='rgba(201, 162, 39, 0.2)', line=dict(width=0),
+            hoverinfo='skip', name='95% confidence band', showlegend=False
+        ))
+        fig.add_trace(go.Scatter(
+            x=fit['Total_Revenue'], y=fit['Fit'], mode='lines', line=dict(color='#c9a227', dash='dash'),
+            name='OLS fit', showlegend=False
+        ))
+    return fig
+
+
+def build_revenue_streams_bar(df, season):
+    import plotly.express as px
+
+    revenue_streams = df.melt(
+        id_vars=['Team'],
+        value_vars=REVENUE_STREAM_COLUMNS,
+        var_name='Revenue_Stream',
+        value_name='Revenue'
+    )
+    revenue_streams['Revenue_Stream'] = revenue_streams['Revenue_Stream'].str.replace('_Revenue', '')
+    return px.bar(
+        revenue_streams,
+        x='Team',
+        y='Revenue',
+        color='Revenue_Stream',
+        title=f"Revenue Streams Breakdown {season}",
+        barmode='stack'
+    )
+
+
+def build_revenue_growth_bar(df, season):
+    import plotly.express as px
+
+    return px.bar(
+        df,
+        x='Team',
+        y='Revenue_Growth',
+        title=f"Revenue Growth {season} (%)",
+        color='Revenue_Growth',
+        color_continuous_scale=GROWTH_COLOR_SCALE
+    )
+
+
+def build_revenue_trend_line(hist_df, max_points=TREND_MAX_POINTS, max_traces=TREND_MAX_TRACES, webgl_threshold=None):
+    import plotly.express as px
+
+    trend_df = reduce_trend(hist_df, max_points=max_points, max_traces=max_traces)
+    # Downsampled lines skip different seasons; keep the axis in season order
+    seasons = sorted(hist_df['Season'].unique())
+    category_orders = {} if trend_df is hist_df else {'Season': seasons}
+    fig = px.line(
+        trend_df,
+        x='Season',
+        y='Total_Revenue',
+        color='Team',
+        title=f"Revenue Growth Over {len(seasons)} Seasons ({seasons[0]} to {seasons[-1]})" if seasons else "Revenue Growth",
+        markers=True,
+        category_orders=category_orders,
+        render_mode=render_mode(len(trend_df), webgl_threshold)
+    )
+    fig.update_layout(height=500)
+    return fig
+
+
+def build_form_revenue_scatter(df, form_window, revenue_window):
+    """
+    Current form (points per game over the last matches) against rolling revenue, one point per club
+    """
+    import plotly.express as px
+
+    fig = px.scatter(
+        df,
+        x='Rolling_Revenue',
+        y='Form_PPG',
+        color='Form_xPts',
+        text='Team',
+        hover_data=['Matches', 'Form_GD'],
+        title=f"Form (last {form_window} matches) vs {revenue_window}-Season Average Revenue",
+        labels={'Rolling_Revenue': 'Revenue (£M)', 'Form_PPG': 'Points per Game', 'Form_xPts': 'xPts per Game'},
+        color_continuous_scale=GROWTH_COLOR_SCALE
+    )
+    fig.update_traces(textposition='top center', marker=dict(size=12))
+    fig.update_layout(height=450)
+    return fig
+
+
+def build_form_trend(history_df, form_window, webgl_threshold=None):
+    """
+    Rolling points per game after every match, one line per club
+    """
+    import plotly.express as px
+
+    fig = px.line(
+        history_df,
+        x='Match',
+        y='Form_PPG',
+        color='Team',
+        hover_data=['Matchday', 'Form_GD', 'Form_xPts'],
+        title=f"Rolling Form ({form_window}-match points per game)",
+        labels={'Form_PPG': 'Points per Game'},
+        render_mode=render_mode(len(history_df), webgl_threshold)
+    )
+    fig.update_layout(height=450)
+    return fig
+
+
+def build_league_comparison_bar(comparison_df, season):
+    """
+    Average revenue per club by stream, one stacked bar per league
+    """
+    import plotly.express as px
+
+    per_club = comparison_df[['League', 'Clubs', *REVENUE_STREAM_COLUMNS]].copy()
+    per_club[REVENUE_STREAM_COLUMNS] = per_club[REVENUE_STREAM_COLUMNS].div(per_club['Clubs'], axis=0).round(1)
+    streams = per_club.melt(
+        id_vars=['League'],
+        value_vars=REVENUE_STREAM_COLUMNS,
+        var_name='Revenue_Stream',
+        value_name='Revenue'
+    )
+    streams['Revenue_Stream'] = streams['Revenue_Stream'].str.replace('_Revenue', '')
+    return px.bar(
+        streams,
+        x='League',
+        y='Revenue',
+        color='Revenue_Stream',
+        title=f"Average Revenue per Club by League {season} (£M)",
+        barmode='stack'
+    )
+
+
+def build_fei_bar(df, season):
+    import plotly.express as px
+
+    fig = px.bar(
+        df.sort_values('FEI', ascending=False),
+        x='Team',
+        y='FEI',
+        title=f"Financial Efficiency Index by Team - {season}",
+        color='FEI',
+        color_continuous_scale=GROWTH_COLOR_SCALE
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+def build_fei_bands(result, season):
+    """
+    Simulated FEI per team as a box of percentile bands (p5/p25/p50/p75/p95) plus the observed value
+    """
+    import plotly.graph_objects as go
+
+    bands = result.fei_bands.sort_values('p50', ascending=False)
+    teams = bands.index.tolist()
+    fig = go.Figure([
+        go.Box(
+            x=teams,
+            lowerfence=bands['p5'], q1=bands['p25'], median=bands['p50'], q3=bands['p75'], upperfence=bands['p95'],
+            name='Simulated (p5-p95)', marker_color='#c9a227'
+        ),
+        go.Scatter(x=teams, y=bands['Observed'], mode='markers', name='Observed', marker=dict(color='black', size=9))
+    ])
+    fig.update_layout(
+        title=f"FEI Range over {result.n_scenarios:,} Scenarios - {season}",
+        yaxis_title='FEI',
+        height=400
+    )
+    return fig
+
+
+def season_figures(df, season, show_performance, hist_df=None):
+    """
+    The dashboard's charts for one season and team subset, by name (one revenue pie per team)
+
+    Used for static report packs; the dashboard builds the same charts
+    individually so it can lay them out and cache them per key.
+    """
+    figures = {}
+    if show_performance:
+        from plfinance.regression import RegressionStats
+
+        figures['points'] = build_points_bar(df)
+        figures['revenue'] = build_revenue_bar(df, season)
+        figures['scatter'] = build_points_revenue_scatter(df, fit=RegressionStats.from_frame(df, season=season).line())
+    else:
+        figures['revenue'] = build_revenue_bar(df, season)
+        figures['streams'] = build_revenue_streams_bar(df, season)
+        figures['growth'] = build_revenue_growth_bar(df, season)
+    if 'FEI' in df.columns:
+        figures['fei'] = build_fei_bar(df, season)
+    if hist_df is not None:
+        figures['trend'] = build_revenue_trend_line(hist_df)
+
+    pie_suffix = "" if show_performance else f" {season}"
+    for _, team_data in df.iterrows():
+        figures[f"pie_{team_data['Team']}"] = build_revenue_pie(team_data, f"{team_data['Team']} Revenue Breakdown{pie_suffix}")
+    return figures
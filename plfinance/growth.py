@@ -0,0 +1,127 @@
+"""
+Season-over-season growth analytics on (team x season) arrays
+
+Values are pivoted once into a dense (teams x seasons) grid; every YoY growth
+column comes from one shifted-array division, CAGR from each team's first and
+last observed season, and rolling averages from a cumulative sum. Result
+frames are assembled in a single constructor call, so cost stays linear in
+the number of seasons instead of inserting one column at a time.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from plfinance.schema import schema_grids, schema_pivot
+
+STREAM_COLUMNS = ['Matchday_Revenue', 'Broadcasting_Revenue', 'Commercial_Revenue', 'Total_Revenue']
+DEFAULT_WINDOW = 3
+
+
+def yoy_growth(values):
+    """
+    Percentage growth between consecutive seasons: (teams x seasons) -> (teams x seasons - 1)
+    """
+    previous = values[:, :-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (values[:, 1:] - previous) / previous * 100
+
+
+def cagr(values):
+    """
+    Compound annual growth (%) from each row's first to last observed season
+    """
+    observed = ~np.isnan(values)
+    n_rows, n_seasons = values.shape
+    rows = np.arange(n_rows)
+    first = np.argmax(observed, axis=1)
+    last = n_seasons - 1 - np.argmax(observed[:, ::-1], axis=1)
+    periods = last - first
+    start, end = values[rows, first], values[rows, last]
+
+    result = np.full(n_rows, np.nan)
+    valid = observed.any(axis=1) & (periods > 0) & (start > 0) & (end >= 0)
+    result[valid] = (np.power(end[valid] / start[valid], 1.0 / periods[valid]) - 1) * 100
+    return result
+
+
+def rolling_mean(values, window=DEFAULT_WINDOW):
+    """
+    Trailing ``window``-season mean along each row (NaN until a full window is observed)
+    """
+    observed = ~np.isnan(values)
+    padding = np.zeros((values.shape[0], 1))
+    sums = np.concatenate([padding, np.cumsum(np.where(observed, values, 0.0), axis=1)], axis=1)
+    counts = np.concatenate([padding, np.cumsum(observed, axis=1)], axis=1)
+
+    window_sums = sums[:, window:] - sums[:, :-window]
+    window_counts = counts[:, window:] - counts[:, :-window]
+    result = np.full(values.shape, np.nan)
+    result[:, window - 1:] = np.where(window_counts == window, window_sums / window, np.nan)
+    return result
+
+
+def season_comparison(hist_df, values='Total_Revenue', decimals=1):
+    """
+    The dashboard's comparison table: one column per season, then one '<season> Growth %' column per YoY step
+
+    Growth is computed from the rounded values, as displayed.
+    """
+    pivot = schema_pivot(hist_df, index='Team', columns='Season', values=values).round(decimals)
+    grid = pivot.to_numpy(dtype=np.float64)
+    growth = np.round(yoy_growth(grid), decimals)
+
+    seasons = pivot.columns.tolist()
+    columns = seasons + [f'{season} Growth %' for season in seasons[1:]]
+    return pd.DataFrame(
+        np.concatenate([grid, growth], axis=1),
+        index=pivot.index,
+        columns=pd.Index(columns, name=pivot.columns.name)
+    )
+
+
+@dataclass
+class GrowthAnalytics:
+    """
+    Growth metrics per stream; frames are indexed by Team with (Stream, Season) columns
+    """
+    values: pd.DataFrame
+    yoy: pd.DataFrame
+    rolling: pd.DataFrame
+    cagr: pd.DataFrame
+    window: int = DEFAULT_WINDOW
+
+    @classmethod
+    def from_frame(cls, financial_df, streams=None, window=DEFAULT_WINDOW):
+        """
+        Pivot every stream once and derive YoY, rolling and CAGR tables from the grids
+        """
+        streams = STREAM_COLUMNS if streams is None else streams
+        if isinstance(financial_df['Team'].dtype, pd.CategoricalDtype) and isinstance(financial_df['Season'].dtype, pd.CategoricalDtype):
+            teams, seasons, grids = schema_grids(financial_df, 'Team', 'Season', streams)
+        else:
+            pivot = financial_df.pivot(index='Team', columns='Season', values=streams)
+            teams, seasons = pivot.index, pivot.columns.levels[1]
+            grids = [pivot[stream].reindex(columns=seasons).to_numpy(dtype=np.float64) for stream in streams]
+
+        def panel(blocks, block_seasons):
+            columns = pd.MultiIndex.from_product([streams, list(block_seasons)], names=['Stream', 'Season'])
+            return pd.DataFrame(np.concatenate(blocks, axis=1), index=teams, columns=columns)
+
+        return cls(
+            values=panel(grids, seasons),
+            yoy=panel([yoy_growth(grid) for grid in grids], seasons[1:]),
+            rolling=panel([rolling_mean(grid, window) for grid in grids], seasons),
+            cagr=pd.DataFrame(
+                np.column_stack([cagr(grid) for grid in grids]),
+                index=teams,
+                columns=pd.Index(streams, name='Stream')
+            ),
+            window=window
+        )
+
+    def stream(self, name):
+        """
+        (values, yoy, rolling) frames of one stream with plain Season columns
+        """
+        return self.values[name], self.yoy[name], self.rolling[name]
@@ -0,0 +1,95 @@
+"""
+Precomputed per-(season, team) aggregates for the KPI metrics row
+
+Sums and non-null counts of every KPI column are computed once per
+(season, team) at load time. The KPIs for any team subset are then combined
+from those partials in O(selected teams) without rescanning the data.
+"""
+import numpy as np
+
+from plfinance.sample_data import SEASON_TARGETS
+from plfinance.schema import as_float64
+
+KPI_COLUMNS = ['Total_Revenue', 'Commercial_Revenue', 'Revenue_Growth', 'Broadcasting_Revenue', 'Matchday_Revenue']
+
+
+class KPIAggregates:
+    """
+    Per-season partial sums/counts, one row per team, and the league's season targets
+    """
+
+    def __init__(self, partials, targets=None):
+        # partials: {season: (team -> row index, sums array, counts array)}
+        self._partials = partials
+        self.targets = targets or SEASON_TARGETS
+
+    @classmethod
+    def from_frame(cls, financial_df, targets=None):
+        """
+        Build the partials from a multi-season financial frame in a single groupby
+
+        ``targets`` ({season: target}) default to the bundled Premier League ones.
+        """
+        frame = financial_df[['Season', 'Team']].copy()
+        for column in KPI_COLUMNS:
+            frame[column] = as_float64(financial_df[column])
+        grouped = frame.groupby(['Season', 'Team'], sort=False, observed=True)[KPI_COLUMNS]
+        sums = grouped.sum()
+        counts = grouped.count()
+
+        partials = {}
+        for season in sums.index.get_level_values('Season').unique():
+            season_sums = sums.xs(season, level='Season')
+            season_counts = counts.xs(season, level='Season')
+            team_index = {team: i for i, team in enumerate(season_sums.index)}
+            partials[season] = (
+                team_index,
+                season_sums.to_numpy(dtype=np.float64),
+                season_counts.to_numpy(dtype=np.int64)
+            )
+        return cls(partials, targets)
+
+    def seasons(self):
+        return list(self._partials)
+
+    def totals(self, season, teams):
+        """
+        Column sums and non-null counts for a team subset of one season
+        """
+        if season not in self._partials:
+            zeros = dict.fromkeys(KPI_COLUMNS, 0)
+            return dict(zeros), dict(zeros)
+        team_index, sums, counts = self._partials[season]
+        rows = [team_index[team] for team in teams if team in team_index]
+        return dict(zip(KPI_COLUMNS, sums[rows].sum(axis=0))), dict(zip(KPI_COLUMNS, counts[rows].sum(axis=0)))
+
+    def compute(self, season, teams, targets=None):
+        """
+        KPI values for the metrics row, including the deltas against the season targets
+
+        A season without a target is measured against the latest season's.
+        """
+        targets = targets or self.targets
+        current_target = targets.get(season) or targets[max(targets)]
+        sums, counts = self.totals(season, teams)
+
+        def mean(column):
+            return sums[column] / counts[column] if counts[column] else np.nan
+
+        avg_total = mean('Total_Revenue')
+        kpis = {
+            'team_count': int(counts['Total_Revenue']),
+            'total_revenue': sums['Total_Revenue'],
+            'avg_total_revenue': avg_total,
+            'avg_commercial': mean('Commercial_Revenue'),
+            'avg_growth': mean('Revenue_Growth'),
+            'avg_broadcasting': mean('Broadcasting_Revenue'),
+            'avg_matchday': mean('Matchday_Revenue'),
+            'target': current_target
+        }
+        kpis['target_diff'] = kpis['total_revenue'] - current_target['revenue_target']
+        kpis['growth_vs_benchmark'] = kpis['avg_growth'] - current_target['growth_benchmark']
+        kpis['commercial_share'] = (kpis['avg_commercial'] / avg_total) * 100
+        kpis['broadcasting_share'] = (kpis['avg_broadcasting'] / avg_total) * 100
+        kpis['matchday_share'] = (kpis['avg_matchday'] / avg_total) * 100
+        return kpis
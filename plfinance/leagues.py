@@ -0,0 +1,340 @@
+"""
+League catalog: a lightweight metadata index over per-league data shards
+
+Data is modelled as (league, season, team). Each league (one division of one
+country) is its own shard, a Season-partitioned dataset in the
+``data_sources`` layout, and is only loaded when it is selected. The catalog
+holds just the metadata the sidebar needs: names, seasons, the clubs of each
+season and the revenue targets. It is read from ``leagues.json`` at the
+dataset root, so listing leagues, seasons and teams never opens a shard.
+The index records each shard's fingerprint (file paths, sizes and
+modification times); when shards are added, removed or rewritten after it
+was built, the catalog is rescanned instead.
+
+On-disk layout::
+
+    <root>/leagues.json
+    <root>/<league>/financial/Season=2024-25/part-0.parquet
+    <root>/<league>/performance/Season=2024-25/part-0.parquet
+
+A root holding ``financial/`` and ``performance/`` directly (the single-league
+layout) is read as the Premier League. Without a root, the catalog serves the
+bundled sample. Rebuild the index after adding or rewriting a shard with
+``python -m plfinance.leagues <root>``.
+"""
+import json
+import os
+from dataclasses import asdict, dataclass, field
+
+import pandas as pd
+
+from plfinance.data_sources import DATA_DIR_ENV, TABLES, ParquetDataSource, SampleDataSource
+from plfinance.sample_data import CURRENT_SEASON, SEASON_TARGETS, SEASONS_FINANCIAL_DATA
+
+DEFAULT_LEAGUE = 'premier-league'
+INDEX_FILE = 'leagues.json'
+
+# Bumped when the index layout changes
+INDEX_FORMAT = 2
+
+STREAM_COLUMNS = ['Matchday_Revenue', 'Broadcasting_Revenue', 'Commercial_Revenue']
+COMPARISON_COLUMNS = [
+    'League', 'Country', 'Tier', 'Clubs', *STREAM_COLUMNS, 'Total_Revenue', 'Avg_Revenue', 'Median_Revenue',
+    'Top_Club_Share%', 'Median_Growth'
+]
+
+
+@dataclass
+class LeagueInfo:
+    """
+    Metadata of one league: seasons, clubs per season and season targets, no data frames
+    """
+    key: str
+    name: str
+    country: str = ''
+    tier: int = 1
+    seasons: list = field(default_factory=list)
+    teams: dict = field(default_factory=dict)  # season -> clubs, in data order
+    targets: dict = field(default_factory=dict)  # season -> revenue_target, growth_benchmark, context
+    current_season: str = None
+    description: str = None
+
+    @property
+    def label(self):
+        return f"{self.name} ({self.country})" if self.country else self.name
+
+    @property
+    def title(self):
+        """
+        Who the dashboard covers, for headings
+        """
+        return self.description or f"{self.name} Teams"
+
+    @property
+    def clubs(self):
+        """
+        Every club that appears in any season, in first-seen order
+        """
+        return list(dict.fromkeys(team for season in self.seasons for team in self.teams.get(season, [])))
+
+    def season_teams(self, season):
+        return list(self.teams.get(season, []))
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+def _derived_target(target, benchmark):
+    return {'revenue_target': int(round(target)), 'growth_benchmark': round(float(benchmark), 1), 'context': 'Derived'}
+
+
+def derived_targets(financial):
+    """
+    Season targets for a league without configured ones: the previous season's
+    combined revenue grown by its median club growth
+
+    The first season has no previous one and gets no target (KPIs measure it
+    against the latest season's), unless it is the league's only season: then
+    its own total stands in.
+    """
+    seasons = financial.groupby('Season', sort=True, observed=True).agg(
+        total=('Total_Revenue', 'sum'), growth=('Revenue_Growth', 'median')
+    )
+    targets = {}
+    previous = None
+    for season, row in seasons.iterrows():
+        if previous is not None:
+            targets[str(season)] = _derived_target(previous['total'] * (1 + previous['growth'] / 100), previous['growth'])
+        previous = row
+    if len(seasons) == 1:
+        season, row = next(seasons.iterrows())
+        targets[str(season)] = _derived_target(row['total'], row['growth'])
+    return targets
+
+
+def scan_league(source, key, name=None, targets=None, **details):
+    """
+    Build a league's metadata from its shard, reading only the Season, Team and revenue total/growth columns
+
+    ``targets`` ({season: target}) override the derived ones season by season.
+    """
+    financial = source.read_financial(columns=['Season', 'Team', 'Total_Revenue', 'Revenue_Growth'])
+    seasons = sorted(financial['Season'].astype(str).unique().tolist())
+    teams = {
+        str(season): group['Team'].astype(str).tolist()
+        for season, group in financial.groupby('Season', sort=True, observed=True)
+    }
+    return LeagueInfo(
+        key=key,
+        name=name or key.replace('-', ' ').title(),
+        seasons=seasons,
+        teams=teams,
+        targets={**derived_targets(financial), **(targets or {})},
+        current_season=source.current_season(),
+        **details
+    )
+
+
+def sample_league():
+    """
+    The bundled sample's metadata, taken from the constants without building its frames
+    """
+    seasons = sorted(SEASONS_FINANCIAL_DATA)
+    return LeagueInfo(
+        key=DEFAULT_LEAGUE,
+        name='Premier League',
+        country='England',
+        tier=1,
+        seasons=seasons,
+        teams={season: list(SEASONS_FINANCIAL_DATA[season]['Team']) for season in seasons},
+        targets=dict(SEASON_TARGETS),
+        current_season=CURRENT_SEASON,
+        description='Top 6 Premier League Teams'
+    )
+
+
+def _is_shard(path):
+    return all(os.path.isdir(os.path.join(path, table)) for table in TABLES)
+
+
+def _shard_keys(root):
+    return [key for key in sorted(os.listdir(root)) if _is_shard(os.path.join(root, key))]
+
+
+def shard_fingerprints(root):
+    """
+    Fingerprint of every shard under ``root``, by league key; only file metadata is read
+    """
+    return {key: ParquetDataSource(os.path.join(root, key)).fingerprint()[1] for key in _shard_keys(root)}
+
+
+class LeagueCatalog:
+    """
+    League metadata by key, with data sources opened on demand (one per shard)
+    """
+
+    def __init__(self, leagues, root=None, fingerprints=None):
+        # leagues: {key: LeagueInfo}, in display order
+        self._leagues = dict(leagues)
+        self.root = root
+        # fingerprints: {key: fingerprint} of the shards the metadata was scanned from
+        self.fingerprints = dict(fingerprints or {})
+        self._sources = {}
+
+    @classmethod
+    def sample(cls):
+        return cls({DEFAULT_LEAGUE: sample_league()})
+
+    @classmethod
+    def from_root(cls, root):
+        """
+        Catalog of a dataset root: ``leagues.json`` when present and current, else a scan of the shards
+        """
+        if _is_shard(root):
+            # Single-league layout: the Premier League, keeping the bundled season targets
+            source = ParquetDataSource(root)
+            league = scan_league(source, DEFAULT_LEAGUE, 'Premier League', targets=dict(SEASON_TARGETS),
+                                 country='England', tier=1)
+            catalog = cls({DEFAULT_LEAGUE: league}, root)
+            catalog._sources[DEFAULT_LEAGUE] = source
+            return catalog
+
+        path = os.path.join(root, INDEX_FILE)
+        if os.path.exists(path):
+            with open(path) as f:
+                index = json.load(f)
+            # Shards added, removed or rewritten since the index was built make it stale
+            if index.get('format') == INDEX_FORMAT and index['shards'] == shard_fingerprints(root):
+                leagues = [LeagueInfo.from_dict(entry) for entry in index['leagues']]
+                return cls({league.key: league for league in leagues}, root, index['shards'])
+        return build_index(root, write=False)
+
+    def __len__(self):
+        return len(self._leagues)
+
+    def __contains__(self, key):
+        return key in self._leagues
+
+    def __getitem__(self, key):
+        return self._leagues[key]
+
+    def keys(self):
+        return list(self._leagues)
+
+    def leagues(self):
+        return list(self._leagues.values())
+
+    def source(self, key):
+        """
+        Data source of one league's shard; nothing is read until the dataset is loaded
+        """
+        if key not in self._leagues:
+            raise KeyError(f"Unknown league {key!r}; available: {', '.join(self._leagues)}")
+        if key not in self._sources:
+            self._sources[key] = (
+                SampleDataSource() if self.root is None else ParquetDataSource(os.path.join(self.root, key))
+            )
+        return self._sources[key]
+
+    def to_json(self):
+        return json.dumps({
+            'format': INDEX_FORMAT,
+            'shards': self.fingerprints,
+            'leagues': [league.to_dict() for league in self.leagues()]
+        }, indent=2)
+
+
+def build_index(root, write=True):
+    """
+    Scan every shard under ``root`` into a catalog, written to ``leagues.json``
+
+    Names, countries, tiers, descriptions and configured (not derived) targets
+    already set in an existing index are kept. The Premier League falls back
+    to the bundled season targets.
+    """
+    existing = {}
+    path = os.path.join(root, INDEX_FILE)
+    if os.path.exists(path):
+        with open(path) as f:
+            existing = {entry['key']: entry for entry in json.load(f)['leagues']}
+
+    leagues = {}
+    fingerprints = {}
+    for key in _shard_keys(root):
+        source = ParquetDataSource(os.path.join(root, key))
+        # Taken before the scan, so a shard rewritten meanwhile reads as stale next time
+        fingerprints[key] = source.fingerprint()[1]
+        known = existing.get(key, {})
+        targets = {season: target for season, target in known.get('targets', {}).items()
+                   if target.get('context') != 'Derived'}
+        if not targets and key == DEFAULT_LEAGUE:
+            targets = dict(SEASON_TARGETS)
+        leagues[key] = scan_league(
+            source, key, known.get('name'), targets=targets,
+            country=known.get('country', ''), tier=known.get('tier', 1), description=known.get('description')
+        )
+    # Top divisions first, then by name
+    leagues = dict(sorted(leagues.items(), key=lambda item: (item[1].tier, item[1].country, item[1].name)))
+    catalog = LeagueCatalog(leagues, root, fingerprints)
+    if write:
+        with open(path, 'w') as f:
+            f.write(catalog.to_json())
+    return catalog
+
+
+def get_catalog(root=None):
+    """
+    Catalog of the dataset root given (or set in PL_DATA_DIR), otherwise of the bundled sample
+    """
+    root = root or os.environ.get(DATA_DIR_ENV)
+    if root:
+        return LeagueCatalog.from_root(root)
+    return LeagueCatalog.sample()
+
+
+def compare_leagues(catalog, season, leagues=None):
+    """
+    One summary row per league for a season, read shard by shard
+
+    Only that season's partition and the revenue columns are read from each
+    shard, and each league is reduced to its row before the next is opened,
+    so memory stays at one league-season however many leagues are compared.
+    Leagues without the season are skipped.
+    """
+    rows = []
+    for key in leagues or catalog.keys():
+        league = catalog[key]
+        if season not in league.seasons:
+            continue
+        df = catalog.source(key).read_financial(
+            columns=['Team', *STREAM_COLUMNS, 'Total_Revenue', 'Revenue_Growth'], seasons=[season]
+        )
+        if df.empty:
+            continue
+        total = df['Total_Revenue'].astype('float64')
+        rows.append({
+            'League': league.name,
+            'Country': league.country,
+            'Tier': league.tier,
+            'Clubs': len(df),
+            **{column: float(df[column].sum()) for column in STREAM_COLUMNS},
+            'Total_Revenue': float(total.sum()),
+            'Avg_Revenue': float(total.mean()),
+            'Median_Revenue': float(total.median()),
+            'Top_Club_Share%': float(total.max() / total.sum() * 100) if total.sum() else float('nan'),
+            'Median_Growth': float(df['Revenue_Growth'].median())
+        })
+    return pd.DataFrame(rows, columns=COMPARISON_COLUMNS)
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Rebuild <root>/leagues.json from the shards: python -m plfinance.leagues <root>
+    catalog = build_index(sys.argv[1])
+    for league in catalog.leagues():
+        print(f"{league.key}: {league.label}, tier {league.tier}, {len(league.seasons)} seasons, {len(league.clubs)} clubs")
@@ -0,0 +1,224 @@
+"""
+Non-blocking live standings fetcher
+
+A background thread runs an asyncio loop with one pooled ``httpx.AsyncClient``
+and periodically re-requests the openfootball results file. Conditional
+requests (If-None-Match / If-Modified-Since) mean an unchanged file costs a
+304 with no body and no re-parse. Page renders only ever read the latest
+parsed snapshot, they never wait on the network.
+
+With a shared cache backend (see plfinance/cache.py), the raw response and
+its validators are stored under the URL for one refresh interval: on each
+tick one process revalidates under the key's lock and every other replica on
+the host reads its result instead of hitting the URL.
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import pandas as pd
+
+from plfinance.cache import content_hash
+from plfinance.standings import LeagueTable, parse_openfootball_matches
+from plfinance.timeseries import FormTracker
+
+DEFAULT_STANDINGS_URL = "https://raw.githubusercontent.com/openfootball/football.json/master/2024-25/en.1.json"
+
+# League the feed covers (see plfinance/leagues.py); other leagues show their static tables
+STANDINGS_LEAGUE = 'premier-league'
+
+# Environment variable overriding the standings URL (e.g. a local stand-in server)
+STANDINGS_URL_ENV = 'PL_STANDINGS_URL'
+
+
+@dataclass
+class StandingsSnapshot:
+    """
+    Latest successfully parsed standings and the validators used to refresh them
+    """
+    standings: pd.DataFrame
+    matches: pd.DataFrame
+    matchday: int
+    fetched_at: float
+    etag: str = None
+    last_modified: str = None
+    # Per-club rolling form, a copy that later fetches do not modify
+    form: FormTracker = None
+
+
+class StandingsFetcher:
+    """
+    Background fetcher keeping the latest standings snapshot in memory
+    """
+
+    def __init__(self, url=None, refresh_interval=300, timeout=10, max_connections=4, cache=None):
+        self.url = url or os.environ.get(STANDINGS_URL_ENV, DEFAULT_STANDINGS_URL)
+        self.refresh_interval = refresh_interval
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.cache = cache
+        self._applied_hash = None
+
+        self._snapshot = None
+        self._table = LeagueTable()
+        self._form = FormTracker()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+        self._loop = None
+        self._wakeup = None
+        self._first_attempt = threading.Event()
+
+        # Request counters, useful for checking conditional-request behaviour
+        self.requests_made = 0
+        self.not_modified = 0
+        self.last_error = None
+
+    def latest(self):
+        """
+        Latest snapshot, or None when nothing has been fetched yet (never blocks)
+        """
+        with self._lock:
+            return self._snapshot
+
+    def start(self):
+        """
+        Start the background refresh loop (idempotent)
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run_loop, name='standings-fetcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                # Loop already closed
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def wait_first_attempt(self, timeout=None):
+        """
+        Block until the first fetch has finished (successfully or not); for scripts, not page renders
+        """
+        return self._first_attempt.wait(timeout)
+
+    def make_client(self):
+        import httpx
+
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+            follow_redirects=True
+        )
+
+    async def refresh(self, client):
+        """
+        One conditional request (or shared-cache read); returns True when the snapshot changed
+        """
+        if self.cache is not None:
+            return await self._refresh_shared(client)
+
+        current = self.latest()
+        validators = (current.etag, current.last_modified) if current is not None else (None, None)
+        response = await self._request(client, *validators)
+        if response.status_code == 304:
+            return False
+        response.raise_for_status()
+        self._apply(response.json(), response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return True
+
+    async def _request(self, client, etag=None, last_modified=None):
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        self.requests_made += 1
+        response = await client.get(self.url, headers=headers)
+        if response.status_code == 304:
+            self.not_modified += 1
+        return response
+
+    async def _refresh_shared(self, client):
+        key = f'standings:{self.url}'
+        entry = self.cache.get(key)
+        if entry is None:
+            # Single flight: one process revalidates, the others wait on the lock and read its result.
+            # Blocking here only holds up this fetcher's own loop thread.
+            with self.cache.lock(key):
+                entry = self.cache.get(key)
+                if entry is None:
+                    entry = await self._fill_shared(client, key)
+
+        if entry.content_hash == self._applied_hash:
+            return False
+        cached = entry.value
+        self._apply(json.loads(cached['content']), cached['etag'], cached['last_modified'])
+        self._applied_hash = entry.content_hash
+        return True
+
+    async def _fill_shared(self, client, key):
+        # An expired entry still supplies the validators for a conditional request
+        previous = self.cache.get(key, stale_ok=True)
+        if previous is None:
+            response = await self._request(client)
+        else:
+            response = await self._request(client, previous.value['etag'], previous.value['last_modified'])
+            if response.status_code == 304:
+                return self.cache.set(key, previous.value, ttl=self.refresh_interval, digest=previous.content_hash)
+        response.raise_for_status()
+
+        cached = {
+            'content': response.content,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+        return self.cache.set(key, cached, ttl=self.refresh_interval, digest=content_hash(response.content))
+
+    def _apply(self, payload, etag, last_modified):
+        # Only results not seen in earlier fetches are applied to the table
+        matches = parse_openfootball_matches(payload)
+        self._table.sync(matches)
+        self._form.sync(matches)
+        snapshot = StandingsSnapshot(
+            standings=self._table.to_frame(),
+            matches=matches,
+            matchday=self._table.matchday,
+            form=self._form.copy(),
+            fetched_at=time.time(),
+            etag=etag,
+            last_modified=last_modified
+        )
+        with self._lock:
+            self._snapshot = snapshot
+
+    async def _refresh_forever(self):
+        self._wakeup = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        async with self.make_client() as client:
+            while not self._stop.is_set():
+                try:
+                    await self.refresh(client)
+                    self.last_error = None
+                except Exception as exc:
+                    # Keep serving the previous snapshot (or static data) on any failure
+                    self.last_error = exc
+                finally:
+                    self._first_attempt.set()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.refresh_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def _run_loop(self):
+        asyncio.run(self._refresh_forever())
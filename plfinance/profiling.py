@@ -0,0 +1,180 @@
+"""
+Opt-in per-stage render timing
+
+Enabled with PL_PROFILE=1 or the ``?profile=1`` query parameter. Each rerun
+gets a ``RunProfiler`` whose ``stage(name)`` context manager times one logical
+stage (data load, filtering, each figure build, chart serialization, ...).
+Finished runs are written as one structured JSON log record and folded into a
+process-wide rolling window that serves p50/p95 per stage.
+
+When profiling is off, ``stage`` returns a shared no-op context manager and
+nothing is recorded, so the instrumentation costs one attribute check per stage.
+"""
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+PROFILE_ENV = 'PL_PROFILE'
+PROFILE_QUERY_PARAM = 'profile'
+
+# Optional file for the JSON log records (stderr otherwise)
+PROFILE_LOG_ENV = 'PL_PROFILE_LOG'
+
+_TRUTHY = {'1', 'true', 'yes', 'on'}
+_NULL_STAGE = contextlib.nullcontext()
+
+logger = logging.getLogger('plfinance.profiling')
+
+
+def _ensure_log_handler():
+    # The records are logged at INFO, whatever level the root logger is at
+    logger.setLevel(logging.INFO)
+    if logger.handlers:
+        return
+    log_path = os.environ.get(PROFILE_LOG_ENV)
+    if log_path:
+        handler = logging.FileHandler(log_path)
+    elif logging.getLogger().handlers:
+        # The host application configured logging: the records go to its handlers
+        return
+    else:
+        handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+
+
+def profiling_enabled(query_params=None):
+    """
+    True when switched on through the environment or the page's query parameters
+    """
+    if os.environ.get(PROFILE_ENV, '').lower() in _TRUTHY:
+        return True
+    if query_params is not None:
+        return str(query_params.get(PROFILE_QUERY_PARAM, '')).lower() in _TRUTHY
+    return False
+
+
+class RollingStageStats:
+    """
+    Process-wide rolling window of stage durations, shared by all sessions
+    """
+
+    def __init__(self, window=500):
+        self.window = window
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def add_run(self, timings):
+        with self._lock:
+            for stage, seconds in timings:
+                samples = self._samples.get(stage)
+                if samples is None:
+                    samples = self._samples[stage] = deque(maxlen=self.window)
+                samples.append(seconds)
+
+    def summary(self):
+        """
+        Count, p50 and p95 (milliseconds) per stage over the rolling window
+        """
+        with self._lock:
+            snapshot = {stage: np.fromiter(samples, dtype=np.float64) for stage, samples in self._samples.items()}
+        rows = [
+            {
+                'Stage': stage,
+                'Runs': len(samples),
+                'p50_ms': np.percentile(samples, 50) * 1000,
+                'p95_ms': np.percentile(samples, 95) * 1000
+            }
+            for stage, samples in snapshot.items()
+        ]
+        return pd.DataFrame(rows, columns=['Stage', 'Runs', 'p50_ms', 'p95_ms']).round(2)
+
+
+class RunProfiler:
+    """
+    Stage timer for a single rerun
+    """
+
+    def __init__(self, enabled=False, stats=None):
+        self.enabled = enabled
+        self.stats = stats
+        self.run_id = uuid.uuid4().hex[:12] if enabled else None
+        self.timings = []
+        self.payloads = {}
+        self.context = {}
+        self._started = time.perf_counter() if enabled else None
+
+    def stage(self, name):
+        """
+        Context manager timing one logical stage (no-op when profiling is off)
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.append((name, time.perf_counter() - start))
+
+    def record_payload(self, chart, nbytes):
+        """
+        Estimated serialized size of one chart's figure (None when unknown), see ``estimate_figure_bytes``
+        """
+        if self.enabled and nbytes is not None:
+            self.payloads[chart] = nbytes
+
+    def annotate(self, **context):
+        """
+        Attach context (selected season, team count, ...) to this run's log record
+        """
+        if self.enabled:
+            self.context.update(context)
+
+    def finish(self):
+        """
+        Log the run as one JSON record and add it to the rolling stats
+        """
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self._started
+        self.timings.append(('total', total))
+        if self.stats is not None:
+            self.stats.add_run(self.timings)
+        _ensure_log_handler()
+        logger.info(json.dumps({
+            'event': 'render_profile',
+            'run_id': self.run_id,
+            'timestamp': time.time(),
+            'stages': [{'stage': stage, 'ms': round(seconds * 1000, 3)} for stage, seconds in self.timings],
+            'estimated_payload_bytes': self.payloads,
+            **self.context
+        }, default=str))
+
+    def run_frame(self):
+        """
+        This run's timings in milliseconds, in execution order
+        """
+        return pd.DataFrame(
+            [(stage, seconds * 1000) for stage, seconds in self.timings],
+            columns=['Stage', 'ms']
+        ).round(2)
+
+    def payload_frame(self):
+        """
+        This run's estimated chart payload sizes in KiB, largest first
+        """
+        frame = pd.DataFrame(list(self.payloads.items()), columns=['Chart', 'Estimated KiB'])
+        frame['Estimated KiB'] = frame['Estimated KiB'] / 1024
+        return frame.sort_values('Estimated KiB', ascending=False, ignore_index=True).round(1)
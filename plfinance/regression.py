@@ -0,0 +1,254 @@
+"""
+Points-vs-revenue OLS fits and rank correlations from cached per-season moments
+
+Each (season, team) row contributes its moments once, at build time: n,
+sum x, sum y, sum x^2, sum y^2 and sum xy for every revenue stream x against
+the performance metric y. Values are shifted by reference means first, so
+the sums stay well conditioned. A fit for any team subset and season range
+adds up the k selected rows' moments (O(k)) and solves every stream, or
+every (season, stream) pair, in one vectorized pass. No fit goes back to the
+data rows. Rank (Spearman) correlations need the values themselves; the k
+cached (x, y) pairs are ranked instead.
+
+Confidence bands are for the fitted mean: yhat +/- t * s * sqrt(1/n + (x - xbar)^2 / Sxx).
+"""
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from plfinance.schema import as_float64
+
+REGRESSION_STREAMS = ['Total_Revenue', 'Matchday_Revenue', 'Broadcasting_Revenue', 'Commercial_Revenue']
+DEFAULT_METRIC = 'Points'
+DEFAULT_CONFIDENCE = 0.95
+
+FIT_COLUMNS = ['Stream', 'n', 'Slope', 'Intercept', 'Slope_SE', 't', 'Pearson_r', 'R2', 'Spearman_rho']
+
+
+def t_quantile(p, dof):
+    """
+    Student-t quantile: exact for 1-2 degrees of freedom, Cornish-Fisher expansion above
+    """
+    dof = np.asarray(dof, dtype=np.float64)
+    z = NormalDist().inv_cdf(p)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expansion = (
+            z
+            + (z ** 3 + z) / (4 * dof)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * dof ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * dof ** 3)
+            + (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / (92160 * dof ** 4)
+        )
+        one = np.tan(np.pi * (p - 0.5))
+        two = (2 * p - 1) / np.sqrt(2 * p * (1 - p))
+    return np.where(dof < 1, np.nan, np.where(dof < 2, one, np.where(dof < 3, two, expansion)))
+
+
+def _row_moments(x, y):
+    # (rows x streams x 6): n, Σx, Σy, Σxx, Σyy, Σxy of single observations
+    y = np.broadcast_to(y[:, None], x.shape)
+    observed = ~(np.isnan(x) | np.isnan(y))
+    x, y = np.where(observed, x, 0.0), np.where(observed, y, 0.0)
+    return np.stack([observed.astype(np.float64), x, y, x * x, y * y, x * y], axis=-1)
+
+
+def _solve(moments, shift_x, shift_y):
+    """
+    OLS quantities from summed moments (any leading shape x streams x 6)
+    """
+    n, sx, sy, sxx, syy, sxy = np.moveaxis(moments, -1, 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_x, mean_y = sx / n, sy / n
+        cxx, cyy, cxy = sxx - sx * mean_x, syy - sy * mean_y, sxy - sx * mean_y
+        slope = cxy / cxx
+        residual = np.maximum(cyy - slope * cxy, 0.0)
+        s = np.sqrt(residual / (n - 2))
+        slope_se = s / np.sqrt(cxx)
+        r = cxy / np.sqrt(cxx * cyy)
+        x_bar, y_bar = mean_x + shift_x, mean_y + shift_y
+        valid = n >= 3
+        nan = np.full(n.shape, np.nan)
+        return {
+            'n': n.astype(np.int64),
+            'Slope': np.where(valid, slope, nan),
+            'Intercept': np.where(valid, y_bar - slope * x_bar, nan),
+            'Slope_SE': np.where(valid, slope_se, nan),
+            't': np.where(valid, slope / slope_se, nan),
+            'Pearson_r': np.where(valid, r, nan),
+            'R2': np.where(valid, r * r, nan),
+            'x_bar': x_bar,
+            'Sxx': cxx,
+            's': np.where(valid, s, nan)
+        }
+
+
+def _spearman(x, y):
+    """
+    Spearman correlation of y with every column of x (average ranks for ties)
+    """
+    if len(y) < 3:
+        return np.full(x.shape[1], np.nan)
+    ranks = pd.DataFrame(x).rank().to_numpy()
+    y_ranks = pd.Series(y).rank().to_numpy()
+    ranks, y_ranks = ranks - ranks.mean(axis=0), y_ranks - y_ranks.mean()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (ranks * y_ranks[:, None]).sum(axis=0) / np.sqrt((ranks ** 2).sum(axis=0) * (y_ranks ** 2).sum())
+
+
+@dataclass
+class _SeasonPartials:
+    team_index: dict
+    moments: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+
+    def pairs(self, rows):
+        # Cached (x, y) values of the selected rows with a known metric
+        y = self.y[rows]
+        keep = ~np.isnan(y)
+        return self.x[rows][keep], y[keep]
+
+
+class RegressionStats:
+    """
+    Per-season moments of a performance metric against each revenue stream, one row per team
+    """
+
+    def __init__(self, partials, shift_x, shift_y, metric=DEFAULT_METRIC, streams=REGRESSION_STREAMS):
+        # partials: {season: _SeasonPartials}
+        self._partials = partials
+        self.shift_x = shift_x
+        self.shift_y = shift_y
+        self.metric = metric
+        self.streams = list(streams)
+
+    @classmethod
+    def from_frame(cls, df, metric=DEFAULT_METRIC, streams=REGRESSION_STREAMS, season=None, shift=None):
+        """
+        Build the partials from a frame with Team, the metric, the streams and Season (or one ``season``)
+        """
+        streams = list(streams)
+        x = np.column_stack([as_float64(df[stream]) for stream in streams])
+        y = as_float64(df[metric])
+        if shift is None:
+            with np.errstate(invalid='ignore'):
+                shift = (np.nan_to_num(np.nanmean(x, axis=0)) if len(x) else np.zeros(len(streams)),
+                         float(np.nan_to_num(np.nanmean(y))) if len(y) else 0.0)
+        shift_x, shift_y = shift
+        moments = _row_moments(x - shift_x, y - shift_y)
+
+        seasons = np.full(len(df), season, dtype=object) if season is not None else df['Season'].astype(str).to_numpy()
+        teams = df['Team'].astype(str).to_numpy()
+        partials = {}
+        for label in pd.unique(seasons):
+            rows = np.flatnonzero(seasons == label)
+            partials[label] = _SeasonPartials(
+                {team: i for i, team in enumerate(teams[rows])}, moments[rows], x[rows], y[rows]
+            )
+        return cls(partials, shift_x, shift_y, metric, streams)
+
+    @classmethod
+    def from_dataset(cls, dataset, metric=DEFAULT_METRIC, streams=REGRESSION_STREAMS):
+        """
+        Every season with standings, joined to that season's finances
+        """
+        frame = pd.merge(
+            dataset.performance[['Season', 'Team', metric]],
+            dataset.financial[['Season', 'Team', *streams]],
+            on=['Season', 'Team']
+        )
+        return cls.from_frame(frame, metric, streams)
+
+    def seasons(self):
+        return sorted(self._partials)
+
+    def with_season(self, season, df):
+        """
+        Copy with one season's rows replaced (e.g. by live standings); other seasons are shared
+        """
+        replacement = RegressionStats.from_frame(df, self.metric, self.streams, season=season,
+                                                 shift=(self.shift_x, self.shift_y))
+        return RegressionStats({**self._partials, **replacement._partials},
+                               self.shift_x, self.shift_y, self.metric, self.streams)
+
+    def _selected(self, seasons=None, teams=None):
+        # (season, row positions) for the selection; O(selected rows)
+        seasons = self.seasons() if seasons is None else [season for season in seasons if season in self._partials]
+        for season in seasons:
+            partials = self._partials[season]
+            if teams is None:
+                rows = np.arange(len(partials.y))
+            else:
+                rows = np.array([partials.team_index[team] for team in teams if team in partials.team_index],
+                                dtype=np.int64)
+            yield season, partials, rows
+
+    def moments(self, seasons=None, teams=None):
+        """
+        Summed (streams x 6) moments of a team subset over a season range
+        """
+        total = np.zeros((len(self.streams), 6))
+        for _, partials, rows in self._selected(seasons, teams):
+            total += partials.moments[rows].sum(axis=0)
+        return total
+
+    def _frame(self, solved, spearman, index):
+        frame = pd.DataFrame({column: solved[column] for column in FIT_COLUMNS[1:-1]}, index=index)
+        frame['Spearman_rho'] = spearman
+        return frame
+
+    def fit(self, seasons=None, teams=None):
+        """
+        Pooled OLS fit and correlations per stream over the selection
+        """
+        moments = np.zeros((len(self.streams), 6))
+        xs, ys = [np.empty((0, len(self.streams)))], [np.empty(0)]
+        for _, partials, rows in self._selected(seasons, teams):
+            moments += partials.moments[rows].sum(axis=0)
+            x, y = partials.pairs(rows)
+            xs.append(x)
+            ys.append(y)
+        solved = _solve(moments, self.shift_x, self.shift_y)
+        return self._frame(solved, _spearman(np.concatenate(xs), np.concatenate(ys)), pd.Index(self.streams, name='Stream'))
+
+    def fits_by_season(self, seasons=None, teams=None):
+        """
+        One fit per (season, stream), solved together, then the pooled fit ('All') when several seasons are selected
+        """
+        selected = list(self._selected(seasons, teams))
+        if not selected:
+            return pd.DataFrame(columns=['Season', *FIT_COLUMNS])
+        moments = np.stack([partials.moments[rows].sum(axis=0) for _, partials, rows in selected])
+        solved = _solve(moments, self.shift_x, self.shift_y)
+        spearman = np.stack([_spearman(*partials.pairs(rows)) for _, partials, rows in selected])
+        index = pd.MultiIndex.from_product([[season for season, _, _ in selected], self.streams],
+                                           names=['Season', 'Stream'])
+        per_season = self._frame({key: value.ravel() for key, value in solved.items()}, spearman.ravel(), index)
+        if len(selected) == 1:
+            return per_season.reset_index()
+        pooled = self.fit([season for season, _, _ in selected], teams)
+        pooled.index = pd.MultiIndex.from_product([['All'], self.streams], names=['Season', 'Stream'])
+        return pd.concat([per_season, pooled]).reset_index()
+
+    def line(self, stream='Total_Revenue', seasons=None, teams=None, confidence=DEFAULT_CONFIDENCE, points=50):
+        """
+        Fitted line and confidence band for one stream over the selection's x range, for charting
+
+        Returns None when the selection has fewer than three observations.
+        """
+        column = self.streams.index(stream)
+        selected = list(self._selected(seasons, teams))
+        x = np.concatenate([np.empty(0)] + [partials.x[rows, column] for _, partials, rows in selected])
+        moments = sum((partials.moments[rows, column].sum(axis=0) for _, partials, rows in selected), np.zeros(6))
+        solved = _solve(moments[None, :], self.shift_x[column:column + 1], self.shift_y)
+        if not np.isfinite(solved['Slope'][0]):
+            return None
+        grid = np.linspace(np.nanmin(x), np.nanmax(x), points)
+        fitted = solved['Intercept'][0] + solved['Slope'][0] * grid
+        n = moments[0]
+        half_width = t_quantile((1 + confidence) / 2, n - 2) * solved['s'][0] * np.sqrt(
+            1 / n + (grid - solved['x_bar'][0]) ** 2 / solved['Sxx'][0]
+        )
+        return pd.DataFrame({stream: grid, 'Fit': fitted, 'Lower': fitted - half_width, 'Upper': fitted + half_width})
@@ -0,0 +1,340 @@
+"""
+Single-document report export: KPI row, FEI table, risk alerts, recommendations and every chart
+
+``ReportExporter`` turns one (season, team subset) into a self-contained HTML
+page, with Plotly's JavaScript inlined and the charts interactive. With
+static images, it produces HTML with embedded PNGs or a PDF. Static images
+are rendered with kaleido, in-process with ``workers=0`` or on a process pool,
+one chart per task. The pool forks, so it is meant for batch scripts;
+multithreaded servers such as the dashboard render in-process. PDFs are
+converted from the static HTML with weasyprint.
+
+Finished documents and chart images are cached per (league, season, teams)
+in a cache backend. They are versioned by ``report_version``: the source
+data's version, the live standings and the season targets. A repeat export
+is then a cache read that builds no figures. Without a shared backend, an
+in-process LRU of ``REPORT_CACHE_BYTES`` is used.
+
+kaleido and weasyprint are optional: ``static_export_available`` and
+``pdf_export_available`` tell whether they are installed.
+"""
+import base64
+import functools
+import html
+import importlib.util
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from plfinance.cache import DEFAULT_TTL, MemoryCache, content_hash
+from plfinance.dataset import fei_table, season_view
+from plfinance.export import ExportFormat
+from plfinance.fei import calculate_fei
+from plfinance.figures import season_figures
+from plfinance.kpi import KPIAggregates
+from plfinance.risk import evaluate_risk_rules, strategic_recommendations
+from plfinance.schema import to_presentation
+
+REPORT_FORMATS = {
+    'html': ExportFormat('HTML (interactive)', '.html', 'text/html'),
+    'html-static': ExportFormat('HTML (static images)', '.html', 'text/html'),
+    'pdf': ExportFormat('PDF', '.pdf', 'application/pdf')
+}
+
+# Bumped when the document layout changes, so cached documents are rebuilt
+REPORT_FORMAT = 1
+
+# Stands in for Plotly's JavaScript in cached interactive documents; it is the same in every one
+_PLOTLYJS_SLOT = '<!-- plotly.js -->'
+
+# Rule messages and recommendations are Streamlit markdown: **bold** spans become <strong>
+_MARKDOWN_BOLD = re.compile(r'\*\*(.+?)\*\*')
+
+# Budget of the exporter's own cache when no shared backend is given
+REPORT_CACHE_BYTES = 32 * 1024 * 1024
+
+IMAGE_WIDTH = 900
+IMAGE_HEIGHT = 500
+
+_STYLE = """
+body { font-family: Helvetica, Arial, sans-serif; color: #111; margin: 2em; }
+h1 { border-bottom: 3px solid #c9a227; padding-bottom: .3em; }
+.kpis { display: flex; gap: 1em; flex-wrap: wrap; }
+.kpi { border: 1px solid #ddd; padding: .6em 1em; min-width: 10em; }
+.kpi .value { font-size: 1.4em; font-weight: bold; }
+.kpi .delta { color: #666; font-size: .85em; }
+table { border-collapse: collapse; margin: 1em 0; }
+th, td { border: 1px solid #ddd; padding: .3em .6em; text-align: right; }
+th { background: #111; color: #fff; }
+.alert { padding: .4em .8em; margin: .3em 0; border-left: 4px solid; }
+.alert.error { border-color: #c0392b; } .alert.warning { border-color: #c9a227; }
+.alert.success { border-color: #27ae60; } .alert.info { border-color: #2980b9; }
+.chart { page-break-inside: avoid; margin: 1em 0; }
+"""
+
+
+def static_export_available():
+    return importlib.util.find_spec('kaleido') is not None
+
+
+def pdf_export_available():
+    return static_export_available() and importlib.util.find_spec('weasyprint') is not None
+
+
+def available_report_formats():
+    """
+    Report formats whose optional dependencies are installed
+    """
+    formats = ['html']
+    if static_export_available():
+        formats.append('html-static')
+    if pdf_export_available():
+        formats.append('pdf')
+    return formats
+
+
+def report_file_name(season, fmt):
+    return f"premier_league_report_{season}{REPORT_FORMATS[fmt].extension}"
+
+
+def report_cache_key(kind, league, season, teams):
+    return f"report-{kind}:{league}:{season}:{','.join(sorted(teams))}"
+
+
+def report_version(dataset, standings=None, targets=None):
+    """
+    Version of a report's inputs: the source data's version, the live standings and the season targets
+
+    Cheap to compute, so a cached report is found without building it.
+    """
+    live = None if standings is None else pd.util.hash_pandas_object(standings, index=False).to_numpy().tobytes()
+    return content_hash((REPORT_FORMAT, dataset.version, live, targets))
+
+
+@dataclass
+class ReportContent:
+    """
+    Everything one report shows, computed once and rendered to any format
+    """
+    season: str
+    teams: list
+    show_performance: bool
+    kpis: dict
+    fei: pd.DataFrame
+    alerts: pd.DataFrame
+    recommendations: list
+    figures: dict = field(repr=False)
+    league: str = None
+    version: str = None
+
+    @property
+    def cache_key(self):
+        return report_cache_key('images', self.league, self.season, self.teams)
+
+
+def report_content(dataset, season, teams, kpi_aggregates=None, standings=None, with_figures=True, league=None):
+    """
+    Report content for one season and team subset of a league (None when the selection is empty)
+
+    ``with_figures=False`` skips building the charts, for outputs that only need the tables.
+    """
+    filtered_df, show_performance = season_view(dataset, season, teams, standings)
+    if filtered_df.empty:
+        return None
+    filtered_df = filtered_df.assign(FEI=calculate_fei(filtered_df))
+    kpi_aggregates = kpi_aggregates or KPIAggregates.from_frame(dataset.financial)
+    figures = {}
+    if with_figures:
+        hist_df = to_presentation(dataset.team_history(teams))
+        figures = season_figures(filtered_df, season, show_performance, hist_df=hist_df)
+    return ReportContent(
+        season=season,
+        teams=list(teams),
+        show_performance=show_performance,
+        kpis=kpi_aggregates.compute(season, filtered_df['Team'].tolist()),
+        fei=fei_table(filtered_df, show_performance),
+        alerts=evaluate_risk_rules(filtered_df),
+        recommendations=strategic_recommendations(filtered_df, show_performance),
+        figures=figures,
+        league=league,
+        version=report_version(dataset, standings, kpi_aggregates.targets)
+    )
+
+
+def _render_image(fig_json, image_format, width, height):
+    # Runs in a pool worker: rebuild the figure from JSON and render it with kaleido
+    import plotly.io as pio
+
+    return pio.from_json(fig_json).to_image(format=image_format, width=width, height=height)
+
+
+class ReportExporter:
+    """
+    Renders report documents; static chart images go through a process pool and a cache
+    """
+
+    def __init__(self, cache=None, workers=None, ttl=DEFAULT_TTL, width=IMAGE_WIDTH, height=IMAGE_HEIGHT):
+        self.cache = MemoryCache(max_bytes=REPORT_CACHE_BYTES) if cache is None else cache
+        self.workers = workers
+        self.ttl = ttl
+        self.width = width
+        self.height = height
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _render_all(self, fig_jsons):
+        if self.workers == 0 or len(fig_jsons) == 1:
+            return [_render_image(fig_json, 'png', self.width, self.height) for fig_json in fig_jsons]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        futures = [
+            self._pool.submit(_render_image, fig_json, 'png', self.width, self.height) for fig_json in fig_jsons
+        ]
+        return [future.result() for future in futures]
+
+    def images(self, content):
+        """
+        PNG bytes per chart name, rendered in parallel and cached per (season, teams)
+        """
+        if not static_export_available():
+            raise ImportError("Static report charts need the kaleido package (pip install kaleido)")
+        names = list(content.figures)
+        return self.cache.get_or_fill(
+            content.cache_key,
+            lambda: dict(zip(names, self._render_all([content.figures[name].to_json() for name in names]))),
+            ttl=self.ttl,
+            version=f'{content.version}:{self.width}x{self.height}'
+        )
+
+    def html(self, content, static=False, plotlyjs=True):
+        """
+        Self-contained HTML document (interactive charts, or embedded PNGs with ``static``)
+
+        ``plotlyjs=False`` leaves a placeholder for Plotly's JavaScript instead of inlining it.
+        """
+        if static:
+            charts = [
+                f'<div class="chart"><img alt="{html.escape(name)}" width="{self.width}" '
+                f'src="data:image/png;base64,{base64.b64encode(png).decode()}"></div>'
+                for name, png in self.images(content).items()
+            ]
+            script = ''
+        else:
+            charts = [
+                f'<div class="chart">{fig.to_html(full_html=False, include_plotlyjs=False)}</div>'
+                for fig in content.figures.values()
+            ]
+            script = _plotlyjs_script() if plotlyjs else _PLOTLYJS_SLOT
+
+        title = f"Premier League Performance & Financial Report - {content.season}"
+        return '\n'.join([
+            '<!DOCTYPE html>',
+            f'<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>',
+            f'<style>{_STYLE}</style>{script}</head><body>',
+            f'<h1>{html.escape(title)}</h1>',
+            f'<p>Teams: {html.escape(", ".join(content.teams))}</p>',
+            '<h2>Key Performance Indicators</h2>',
+            _kpi_row(content.kpis, content.season),
+            '<h2>Financial Efficiency Index (FEI)</h2>',
+            content.fei.to_html(index=False, float_format=lambda value: f"{value:.3f}", border=0),
+            '<h2>Risk Indicators</h2>',
+            _alerts(content.alerts),
+            '<h2>Strategic Recommendations</h2>',
+            '<ol>' + ''.join(f'<li>{_markdown_html(rec)}</li>' for rec in content.recommendations) + '</ol>',
+            '<h2>Charts</h2>',
+            *charts,
+            '</body></html>'
+        ])
+
+    def pdf(self, content):
+        """
+        PDF of the static-image HTML document
+        """
+        if not pdf_export_available():
+            raise ImportError("PDF reports need the kaleido and weasyprint packages (pip install kaleido weasyprint)")
+        import weasyprint
+
+        return weasyprint.HTML(string=self.html(content, static=True)).write_pdf()
+
+    def export(self, content, fmt='html'):
+        """
+        Report document as bytes in one of ``REPORT_FORMATS``
+        """
+        if fmt == 'html':
+            return self.html(content).encode()
+        if fmt == 'html-static':
+            return self.html(content, static=True).encode()
+        if fmt == 'pdf':
+            return self.pdf(content)
+        raise ValueError(f"Unsupported report format: {fmt!r} (expected one of {', '.join(REPORT_FORMATS)})")
+
+    def cached_export(self, league, season, teams, version, build_content, fmt='html'):
+        """
+        Report document bytes, cached per (league, season, teams, format) and ``version``
+
+        ``build_content()`` returns the ``ReportContent`` and only runs on a miss.
+        Interactive HTML is stored without Plotly's JavaScript (about 5 MB, the
+        same in every document), which is put back on the way out.
+        """
+        if fmt not in REPORT_FORMATS:
+            raise ValueError(f"Unsupported report format: {fmt!r} (expected one of {', '.join(REPORT_FORMATS)})")
+
+        def fill():
+            content = build_content()
+            return self.html(content, plotlyjs=False).encode() if fmt == 'html' else self.export(content, fmt)
+
+        document = self.cache.get_or_fill(
+            report_cache_key(fmt, league, season, teams), fill, ttl=self.ttl,
+            version=f'{version}:{self.width}x{self.height}'
+        )
+        if fmt == 'html':
+            document = document.replace(_PLOTLYJS_SLOT.encode(), _plotlyjs_script().encode(), 1)
+        return document
+
+
+@functools.lru_cache(maxsize=1)
+def _plotlyjs_script():
+    from plotly.offline import get_plotlyjs
+
+    return f'<script type="text/javascript">{get_plotlyjs()}</script>'
+
+
+def _markdown_html(text):
+    return _MARKDOWN_BOLD.sub(r'<strong>\1</strong>', html.escape(str(text)))
+
+
+def _kpi_row(kpis, season):
+    cards = [
+        (f"Total Revenue (£M) - {kpis['target']['context']}", f"£{kpis['total_revenue']:.1f}M",
+         f"{kpis['target_diff']:+.1f}M vs {season} Target"),
+        ("Avg Commercial (£M)", f"£{kpis['avg_commercial']:.1f}M", f"{kpis['commercial_share']:.1f}% of Total Revenue"),
+        ("Revenue Growth (%)", f"{kpis['avg_growth']:.1f}%", f"{kpis['growth_vs_benchmark']:+.1f}% vs {season} Benchmark"),
+        ("Avg Broadcasting (£M)", f"£{kpis['avg_broadcasting']:.1f}M", f"{kpis['broadcasting_share']:.1f}% of Total Revenue"),
+        ("Avg Matchday (£M)", f"£{kpis['avg_matchday']:.1f}M", f"{kpis['matchday_share']:.1f}% of Total Revenue")
+    ]
+    return '<div class="kpis">' + ''.join(
+        f'<div class="kpi"><div>{html.escape(label)}</div><div class="value">{html.escape(value)}</div>'
+        f'<div class="delta">{html.escape(delta)}</div></div>'
+        for label, value, delta in cards
+    ) + '</div>'
+
+
+def _alerts(alerts):
+    if alerts.empty:
+        return '<p>No risk indicators fired.</p>'
+    return ''.join(
+        f'<div class="alert {html.escape(str(level))}">{_markdown_html(message)}</div>'
+        for level, message in zip(alerts['Level'], alerts['Message'])
+    )
@@ -0,0 +1,275 @@
+"""
+Declarative, vectorized risk-indicator and recommendation rules
+
+Each rule is a conjunction of threshold conditions over a feature frame
+(revenue shares, FEI, per-group FEI median/mean, ...). All rules are evaluated
+as boolean masks over the whole frame in one pass, and only the rows that fire
+are formatted into messages. Passing ``group_by='Season'`` evaluates
+peer-relative rules (below-median FEI, averages) within each season, so every
+club in every season can be screened at once.
+"""
+import operator
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from plfinance.fei import calculate_fei
+
+ALERT_LEVELS = ['error', 'warning', 'info']
+
+_OPERATORS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge
+}
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    A named alert: fires where every (column, operator, threshold) condition holds
+
+    ``threshold`` may be a number or the name of another feature column.
+    ``section`` orders alerts for display (section, then row, then rule order);
+    ``unless`` names rules that suppress this one on the same row.
+    """
+    name: str
+    level: str
+    conditions: tuple
+    message: str
+    section: int = 0
+    unless: tuple = ()
+
+
+RISK_RULES = [
+    Rule(
+        'declining_revenue', 'warning',
+        (('Revenue_Growth', '<', 0),),
+        "**{Team}**: Revenue declining by {Abs_Revenue_Growth:.1f}% | FEI: {FEI:.3f}",
+        section=0
+    ),
+    # Revenue diversification risk (over-reliance on one stream)
+    Rule(
+        'broadcasting_reliance', 'error',
+        (('Broadcasting_Share', '>', 0.6),),
+        "**{Team}**: Over-reliant on broadcasting ({Broadcasting_Pct:.1f}% of revenue)",
+        section=1
+    ),
+    Rule(
+        'low_commercial_diversification', 'info',
+        (('Commercial_Share', '<', 0.25),),
+        "**{Team}**: Low commercial diversification ({Commercial_Pct:.1f}% of revenue)",
+        section=1,
+        unless=('broadcasting_reliance',)
+    ),
+    Rule(
+        'below_median_fei', 'error',
+        (('FEI', '<', 'FEI_Median'),),
+        "**{Team}**: Below-average financial efficiency (FEI: {FEI:.3f} vs avg: {FEI_Mean:.3f})",
+        section=2
+    ),
+    Rule(
+        'high_revenue_low_fei', 'warning',
+        (('Total_Revenue', '>', 600), ('FEI', '<', 0.5)),
+        "**{Team}**: High revenue (£{Total_Revenue:.1f}M) but poor financial efficiency (FEI: {FEI:.3f})",
+        section=3
+    ),
+    Rule(
+        'large_base_low_growth', 'info',
+        (('Total_Revenue', '>', 500), ('Revenue_Growth', '<', 2)),
+        "**{Team}**: Large revenue base (£{Total_Revenue:.1f}M) with low growth ({Revenue_Growth:.1f}%) - focus on innovation",
+        section=3
+    )
+]
+
+# Evaluated over per-group averages rather than per-team rows
+RECOMMENDATION_RULES = [
+    Rule(
+        'financial_optimization', 'info',
+        (('Avg_FEI', '<', 0.6),),
+        "**Financial Optimization**: Average FEI ({Avg_FEI:.3f}) below target 0.600 - improve revenue diversification and growth"
+    ),
+    Rule(
+        'commercial_expansion', 'info',
+        (('Avg_Commercial_Share', '<', 0.35),),
+        "**Commercial Expansion**: Current commercial share ({Avg_Commercial_Pct:.1f}%) below optimal 35%+ - focus on sponsorship and partnerships"
+    ),
+    Rule(
+        'growth_strategy', 'info',
+        (('Avg_Revenue_Growth', '<', 5),),
+        "**Growth Strategy**: Revenue growth ({Avg_Revenue_Growth:.1f}%) below industry target of 5%+ - diversify revenue streams"
+    ),
+    Rule(
+        'matchday_enhancement', 'info',
+        (('Avg_Matchday_Share', '<', 0.15),),
+        "**Matchday Enhancement**: Current matchday share ({Avg_Matchday_Pct:.1f}%) below optimal 15%+ - improve stadium experience"
+    )
+]
+
+PRIORITY_FOCUS_MESSAGE = "**Priority Focus**: {Team} (FEI: {FEI:.3f}) needs immediate financial efficiency improvements"
+
+# Standard recommendations based on season
+PERFORMANCE_SEASON_RECOMMENDATIONS = [
+    "**FEI Target**: Maintain FEI above 0.600 for sustainable financial efficiency",
+    "**Revenue Balance**: Optimal split - 45% Broadcasting, 35% Commercial, 20% Matchday",
+    "**Performance Alignment**: Balance on-field investment with revenue diversification"
+]
+FINANCIAL_SEASON_RECOMMENDATIONS = [
+    "**FEI Target**: Maintain FEI above 0.600 for financial sustainability",
+    "**Revenue Diversification**: Reduce dependence on single revenue streams",
+    "**Growth Focus**: Target 5-8% annual revenue growth through strategic initiatives"
+]
+
+
+def _group_keys(df, group_by):
+    if group_by is None:
+        return np.zeros(len(df), dtype=np.int8)
+    return df[group_by]
+
+
+def _series_mean(values):
+    # Series.mean (pairwise summation), as the per-frame averages were computed
+    # originally; groupby's cythonized mean sums differently in the last digit
+    return values.mean()
+
+
+def risk_features(df, group_by=None):
+    """
+    Per-row features the risk rules are written against
+    """
+    fei = df['FEI'] if 'FEI' in df.columns else calculate_fei(df)
+    total = df['Total_Revenue']
+    features = pd.DataFrame({
+        'Team': df['Team'],
+        'Total_Revenue': total,
+        'Revenue_Growth': df['Revenue_Growth'],
+        'Abs_Revenue_Growth': df['Revenue_Growth'].abs(),
+        'FEI': fei,
+        'Commercial_Share': df['Commercial_Revenue'] / total,
+        'Broadcasting_Share': df['Broadcasting_Revenue'] / total,
+        'Matchday_Share': df['Matchday_Revenue'] / total
+    }, index=df.index)
+    if group_by is not None:
+        features[group_by] = df[group_by]
+
+    for stream in ('Commercial', 'Broadcasting', 'Matchday'):
+        features[f'{stream}_Pct'] = features[f'{stream}_Share'] * 100
+
+    # Peer statistics: whole frame, or within each group (e.g. season)
+    grouped_fei = fei.groupby(_group_keys(df, group_by), sort=False, observed=True)
+    features['FEI_Median'] = grouped_fei.transform('median')
+    features['FEI_Mean'] = grouped_fei.transform(_series_mean)
+    return features
+
+
+def _rule_masks(features, rules):
+    """
+    (rows x rules) boolean matrix, one vectorized comparison per condition
+    """
+    masks = np.ones((len(features), len(rules)), dtype=bool)
+    for j, rule in enumerate(rules):
+        for column, op, threshold in rule.conditions:
+            rhs = features[threshold].to_numpy() if isinstance(threshold, str) else threshold
+            masks[:, j] &= _OPERATORS[op](features[column].to_numpy(), rhs)
+
+    rule_position = {rule.name: j for j, rule in enumerate(rules)}
+    for j, rule in enumerate(rules):
+        for suppressor in rule.unless:
+            masks[:, j] &= ~masks[:, rule_position[suppressor]]
+    return masks
+
+
+def _fired(features, rules, masks, extra_columns=(), messages=True):
+    rows, rule_idx = np.nonzero(masks)
+    sections = np.array([rule.section for rule in rules], dtype=np.int64)
+    order = np.lexsort((rule_idx, rows, sections[rule_idx]))
+    rows, rule_idx = rows[order], rule_idx[order]
+
+    rule_names = [rule.name for rule in rules]
+    rule_levels = np.array([ALERT_LEVELS.index(rule.level) for rule in rules], dtype=np.int64)
+    fired = features.iloc[rows]
+    table = pd.DataFrame({
+        'Row': rows.astype(np.int64),
+        'Rule': pd.Categorical.from_codes(rule_idx, categories=rule_names),
+        'Level': pd.Categorical.from_codes(rule_levels[rule_idx], categories=ALERT_LEVELS)
+    })
+    if messages:
+        # Only fired rows are formatted
+        records = fired.to_dict('records')
+        table['Message'] = pd.array(
+            [rules[j].message.format(**record) for j, record in zip(rule_idx, records)],
+            dtype='string'
+        )
+    for column in extra_columns:
+        table.insert(1, column, fired[column].to_numpy())
+    return table
+
+
+def evaluate_risk_rules(df, rules=None, group_by=None, messages=True):
+    """
+    Alerts table (Row, [group], Team, Rule, Level, Message) in display order
+
+    ``messages=False`` skips formatting, for screening large frames where only
+    the rule/level columns are needed.
+    """
+    rules = RISK_RULES if rules is None else rules
+    features = risk_features(df, group_by=group_by)
+    extra_columns = ['Team'] if group_by is None else ['Team', group_by]
+    return _fired(features, rules, _rule_masks(features, rules), extra_columns, messages=messages)
+
+
+def recommendation_features(df, group_by=None):
+    """
+    Per-group averages the recommendation rules are written against
+    """
+    features = risk_features(df, group_by=group_by)
+    grouped = features.groupby(_group_keys(df, group_by), sort=False, observed=True)
+    averages = pd.DataFrame({
+        'Avg_FEI': grouped['FEI'].agg(_series_mean),
+        'Avg_Commercial_Share': grouped['Commercial_Share'].agg(_series_mean),
+        'Avg_Revenue_Growth': grouped['Revenue_Growth'].agg(_series_mean),
+        'Avg_Matchday_Share': grouped['Matchday_Share'].agg(_series_mean)
+    })
+    averages['Avg_Commercial_Pct'] = averages['Avg_Commercial_Share'] * 100
+    averages['Avg_Matchday_Pct'] = averages['Avg_Matchday_Share'] * 100
+
+    # Lowest-FEI team per group for the priority recommendation
+    lowest = features.loc[grouped['FEI'].idxmin().to_numpy()]
+    averages['Priority_Team'] = lowest['Team'].to_numpy()
+    averages['Priority_FEI'] = lowest['FEI'].to_numpy()
+    return averages
+
+
+def evaluate_recommendation_rules(df, rules=None, group_by=None, averages=None):
+    """
+    Recommendations table with one row per (group, fired rule)
+
+    ``averages`` reuses an already computed ``recommendation_features`` frame.
+    """
+    rules = RECOMMENDATION_RULES if rules is None else rules
+    if averages is None:
+        averages = recommendation_features(df, group_by=group_by)
+    table = _fired(averages, rules, _rule_masks(averages, rules))
+    if group_by is not None:
+        table.insert(1, group_by, averages.index[table['Row'].to_numpy()])
+    return table
+
+
+def strategic_recommendations(df, show_performance):
+    """
+    The dashboard's ordered recommendation list for one frame
+    """
+    averages = recommendation_features(df)
+    recommendations = evaluate_recommendation_rules(df, averages=averages)['Message'].tolist()
+
+    # Team-specific recommendations
+    low_fei_team = averages.iloc[0]
+    recommendations.append(PRIORITY_FOCUS_MESSAGE.format(Team=low_fei_team['Priority_Team'], FEI=low_fei_team['Priority_FEI']))
+
+    if show_performance:
+        recommendations.extend(PERFORMANCE_SEASON_RECOMMENDATIONS)
+    else:
+        recommendations.extend(FINANCIAL_SEASON_RECOMMENDATIONS)
+    return recommendations
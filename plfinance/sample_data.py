@@ -0,0 +1,73 @@
+"""
+Bundled sample dataset: top 6 Premier League clubs, 2020-21 to 2024-25
+"""
+
+# Season the performance table and the headline KPIs refer to
+CURRENT_SEASON = '2024-25'
+
+# Current season performance data (2024-25)
+CURRENT_SEASON_DATA = {
+    'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
+    'Matches_Played': [10, 10, 10, 10, 10, 10],
+    'Wins': [7, 6, 6, 5, 4, 4],
+    'Draws': [2, 3, 3, 3, 3, 1],
+    'Losses': [1, 1, 1, 2, 3, 5],
+    'Goals_Scored': [22, 18, 21, 16, 12, 15],
+    'Goals_Conceded': [8, 10, 6, 11, 12, 18],
+    'Points': [23, 21, 21, 18, 15, 13],
+    'Goal_Difference': [14, 8, 15, 5, 0, -3]
+}
+
+# Financial data for all seasons (2020-21 to 2024-25 in millions)
+# Each list contains data for all 6 teams for one season
+SEASONS_FINANCIAL_DATA = {
+    '2020-21': {
+        'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
+        'Matchday_Revenue': [7.1, 8.2, 7.5, 6.8, 11.2, 8.5],  # COVID-impacted
+        'Broadcasting_Revenue': [295.4, 201.8, 269.3, 198.7, 254.8, 162.2],
+        'Commercial_Revenue': [342.4, 177.8, 273.6, 287.6, 227.9, 231.7],
+        'Total_Revenue': [644.9, 388.0, 550.4, 493.1, 494.1, 402.4],
+        'Revenue_Growth': [-10.2, -12.9, -1.4, 5.0, -14.9, -9.7]
+    },
+    '2021-22': {
+        'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
+        'Matchday_Revenue': [53.4, 45.2, 71.8, 78.3, 91.0, 45.7],  # Partial recovery
+        'Broadcasting_Revenue': [307.2, 201.8, 275.3, 201.7, 230.8, 167.2],
+        'Commercial_Revenue': [370.4, 186.5, 354.6, 288.3, 305.3, 229.9],
+        'Total_Revenue': [731.0, 433.5, 701.7, 568.3, 627.1, 442.8],
+        'Revenue_Growth': [13.3, 11.7, 27.5, 15.3, 26.9, 10.0]
+    },
+    '2022-23': {
+        'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
+        'Matchday_Revenue': [71.4, 85.2, 83.2, 89.8, 111.0, 65.4],  # Full recovery
+        'Broadcasting_Revenue': [289.6, 201.8, 235.2, 198.7, 256.8, 150.2],
+        'Commercial_Revenue': [315.1, 146.5, 275.9, 192.8, 280.6, 167.4],
+        'Total_Revenue': [676.1, 433.5, 594.3, 481.3, 648.4, 383.0],
+        'Revenue_Growth': [-7.5, 0.0, -15.3, -15.3, 3.4, -13.5]
+    },
+    '2023-24': {
+        'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
+        'Matchday_Revenue': [78.2, 103.5, 84.2, 67.8, 110.1, 85.4],
+        'Broadcasting_Revenue': [314.1, 201.8, 275.2, 203.7, 230.8, 167.2],
+        'Commercial_Revenue': [341.2, 188.4, 247.1, 201.5, 279.3, 175.8],
+        'Total_Revenue': [733.5, 493.7, 606.5, 473.0, 620.2, 428.4],
+        'Revenue_Growth': [8.5, 13.9, 2.1, -1.7, -4.3, 11.9]
+    },
+    '2024-25': {
+        'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
+        'Matchday_Revenue': [82.5, 108.7, 89.1, 72.3, 115.2, 91.8],  # Projected
+        'Broadcasting_Revenue': [325.3, 215.9, 287.4, 218.9, 242.1, 178.5],  # Projected
+        'Commercial_Revenue': [358.7, 201.3, 265.8, 215.6, 295.7, 188.2],  # Projected
+        'Total_Revenue': [766.5, 525.9, 642.3, 506.8, 653.0, 458.5],  # Projected
+        'Revenue_Growth': [4.5, 6.5, 5.9, 7.1, 5.3, 7.0]  # Projected
+    }
+}
+
+# Season-specific targets and benchmarks
+SEASON_TARGETS = {
+    '2020-21': {'revenue_target': 2400, 'growth_benchmark': -8.0, 'context': 'COVID Impact'},
+    '2021-22': {'revenue_target': 2800, 'growth_benchmark': 15.0, 'context': 'Recovery Phase'},
+    '2022-23': {'revenue_target': 3000, 'growth_benchmark': -5.0, 'context': 'Stabilization'},
+    '2023-24': {'revenue_target': 3200, 'growth_benchmark': 5.0, 'context': 'Growth Return'},
+    '2024-25': {'revenue_target': 3400, 'growth_benchmark': 6.0, 'context': 'Projected Growth'}
+}
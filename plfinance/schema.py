@@ -0,0 +1,273 @@
+"""
+Compact typed schema for the team/season frames
+
+Team and Season become pandas Categoricals over one shared dictionary, so
+``==``/``isin`` filters and pivots compare small integer codes instead of
+Python strings. Revenue columns are stored as float32 and match counts as
+small integers. Arithmetic that feeds displayed figures (FEI, KPI sums)
+upcasts to float64 where it is computed.
+"""
+import numpy as np
+import pandas as pd
+
+REVENUE_COLUMNS = ['Matchday_Revenue', 'Broadcasting_Revenue', 'Commercial_Revenue', 'Total_Revenue', 'Revenue_Growth']
+
+# Counts that fit comfortably in small integer types for a 38-match season
+COUNT_DTYPES = {
+    'Matches_Played': np.int8,
+    'Wins': np.int8,
+    'Draws': np.int8,
+    'Losses': np.int8,
+    'Goals_Scored': np.int16,
+    'Goals_Conceded': np.int16,
+    'Points': np.int16,
+    'Goal_Difference': np.int16
+}
+
+
+class TeamSeasonDictionary:
+    """
+    Shared Team/Season category dictionary; Season categories are ordered chronologically
+    """
+
+    def __init__(self, teams, seasons):
+        self.team_dtype = pd.CategoricalDtype(sorted(set(teams)))
+        self.season_dtype = pd.CategoricalDtype(sorted(set(seasons)), ordered=True)
+
+    @classmethod
+    def from_frames(cls, *frames):
+        teams, seasons = set(), set()
+        for frame in frames:
+            if 'Team' in frame.columns:
+                teams.update(frame['Team'].unique())
+            if 'Season' in frame.columns:
+                seasons.update(frame['Season'].unique())
+        return cls(teams, seasons)
+
+    def team_codes(self, teams):
+        """
+        Category codes for team names (-1 for teams outside the dictionary)
+        """
+        return self.team_dtype.categories.get_indexer(list(teams))
+
+    def season_code(self, season):
+        return self.season_dtype.categories.get_loc(season)
+
+
+def apply_schema(df, dictionary):
+    """
+    Copy of ``df`` with categorical Team/Season, float32 revenue and small-int counts
+    """
+    dtypes = {}
+    if 'Team' in df.columns:
+        dtypes['Team'] = dictionary.team_dtype
+    if 'Season' in df.columns:
+        dtypes['Season'] = dictionary.season_dtype
+    for column in REVENUE_COLUMNS:
+        if column in df.columns:
+            dtypes[column] = np.float32
+    for column, dtype in COUNT_DTYPES.items():
+        if column in df.columns:
+            dtypes[column] = dtype
+    return df.astype(dtypes)
+
+
+def _codes(series, dtype, values):
+    # Filter values are translated to codes once; rows are compared as integers
+    if isinstance(series.dtype, pd.CategoricalDtype) and series.dtype == dtype:
+        return series.cat.codes.to_numpy(), dtype.categories.get_indexer(list(values))
+    return None, None
+
+
+def season_mask(df, season, dictionary):
+    """
+    Boolean mask for one season, compared on category codes when the schema is applied
+    """
+    codes, wanted = _codes(df['Season'], dictionary.season_dtype, [season])
+    if codes is None:
+        return (df['Season'] == season).to_numpy()
+    if wanted[0] < 0:
+        return np.zeros(len(df), dtype=bool)
+    return codes == wanted[0]
+
+
+def team_mask(df, teams, dictionary):
+    """
+    Boolean mask for a team subset, compared on category codes when the schema is applied
+    """
+    codes, wanted = _codes(df['Team'], dictionary.team_dtype, teams)
+    if codes is None:
+        return df['Team'].isin(list(teams)).to_numpy()
+    lookup = np.zeros(len(dictionary.team_dtype.categories) + 1, dtype=bool)
+    lookup[wanted[wanted >= 0]] = True
+    # Code -1 (missing) maps to the trailing False slot
+    return lookup[codes]
+
+
+class TeamSeasonIndex:
+    """
+    Row positions of a compact-schema frame sorted by (Season, Team) and by (Team, Season)
+
+    Built once at load time from the category codes. A season block or one
+    club's rows are a contiguous run of the sorted positions, found with a
+    binary search, so lookups cost O(log n) per team instead of a scan of
+    every row. Positions come back in the frame's original row order.
+    """
+
+    def __init__(self, df, dictionary):
+        self.n_rows = len(df)
+        self._n_teams = len(dictionary.team_dtype.categories)
+        self._n_seasons = len(dictionary.season_dtype.categories)
+        teams = df['Team'].cat.codes.to_numpy().astype(np.int64)
+        seasons = df['Season'].cat.codes.to_numpy().astype(np.int64)
+
+        # Stable sorts keep the original row order among equal keys
+        season_keys = seasons * self._n_teams + teams
+        self._season_order = np.argsort(season_keys, kind='stable')
+        self._season_keys = season_keys[self._season_order]
+        team_keys = teams * self._n_seasons + seasons
+        self._team_order = np.argsort(team_keys, kind='stable')
+        self._team_keys = team_keys[self._team_order]
+        self.dictionary = dictionary
+
+    def _runs(self, order, keys, ranges):
+        # Concatenated sorted-position runs for [start, stop) key ranges
+        starts = np.searchsorted(keys, [start for start, _ in ranges], side='left')
+        stops = np.searchsorted(keys, [stop for _, stop in ranges], side='left')
+        if len(ranges) == 1:
+            return order[starts[0]:stops[0]]
+        return np.concatenate([order[start:stop] for start, stop in zip(starts, stops)])
+
+    def positions(self, season=None, teams=None):
+        """
+        Row positions (original order) for a season, a team subset, or both
+        """
+        if season is None and teams is None:
+            return np.arange(self.n_rows)
+        team_codes = None
+        if teams is not None:
+            team_codes = self.dictionary.team_codes(teams)
+            team_codes = np.unique(team_codes[team_codes >= 0])
+            if len(team_codes) == 0:
+                return np.empty(0, dtype=np.int64)
+
+        if season is None:
+            ranges = [(code * self._n_seasons, (code + 1) * self._n_seasons) for code in team_codes]
+            return np.sort(self._runs(self._team_order, self._team_keys, ranges))
+
+        if season not in self.dictionary.season_dtype.categories:
+            return np.empty(0, dtype=np.int64)
+        base = self.dictionary.season_code(season) * self._n_teams
+        if team_codes is None:
+            ranges = [(base, base + self._n_teams)]
+        else:
+            ranges = [(base + code, base + code + 1) for code in team_codes]
+        return np.sort(self._runs(self._season_order, self._season_keys, ranges))
+
+    def row(self, season, team):
+        """
+        Position of the first (Season, Team) row, or None
+        """
+        if season not in self.dictionary.season_dtype.categories:
+            return None
+        code = self.dictionary.team_codes([team])[0]
+        if code < 0:
+            return None
+        # Stable sort: the first match in the sorted keys is the earliest row
+        key = self.dictionary.season_code(season) * self._n_teams + code
+        i = np.searchsorted(self._season_keys, key, side='left')
+        if i == len(self._season_keys) or self._season_keys[i] != key:
+            return None
+        return int(self._season_order[i])
+
+    def take(self, df, season=None, teams=None):
+        """
+        Rows of ``df`` (the indexed frame, or one with the same rows) for a season and/or team subset
+
+        A contiguous run of rows (e.g. a whole season of a frame stored season
+        by season) comes back as an ``iloc`` slice, which pandas' copy-on-write
+        shares with ``df`` until either side is modified; scattered rows are
+        gathered into a new frame.
+        """
+        if len(df) != self.n_rows:
+            raise ValueError(f"Index covers {self.n_rows} rows, frame has {len(df)}")
+        positions = self.positions(season, teams)
+        # Sorted, unique positions are contiguous when they span exactly their count
+        if len(positions) and positions[-1] - positions[0] + 1 == len(positions):
+            return df.iloc[positions[0]:positions[-1] + 1]
+        return df.take(positions)
+
+
+def widen_floats(values, decimals=4):
+    """
+    Upcast float32 values to float64, rounding away float32 representation noise (644.9000244 -> 644.9)
+    """
+    return np.round(np.asarray(values, dtype=np.float64), decimals)
+
+
+def as_float64(series, decimals=4):
+    """
+    float64 values of a column, widening (and de-noising) float32 storage
+    """
+    if series.dtype == np.float32:
+        return widen_floats(series, decimals)
+    return series.to_numpy(dtype=np.float64)
+
+
+def to_presentation(df, decimals=4):
+    """
+    Small working-set copy for charts and tables: plain string Team/Season and float64 metrics
+    """
+    columns = {}
+    for column, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            columns[column] = df[column].astype(dtype.categories.dtype)
+        elif dtype == np.float32:
+            columns[column] = pd.Series(widen_floats(df[column], decimals), index=df.index)
+    return df.assign(**columns) if columns else df.copy()
+
+
+def _present_positions(codes, n_categories):
+    # Observed category codes (sorted) and each row's position among them
+    present = np.bincount(codes, minlength=n_categories) > 0
+    positions = np.cumsum(present) - 1
+    return np.flatnonzero(present), positions[codes]
+
+
+def schema_grids(df, index='Team', columns='Season', values=('Total_Revenue',), decimals=4):
+    """
+    Dense (index x columns) float64 grids for several value columns, sharing one code lookup
+
+    Returns (row labels, column labels, list of grids); only observed
+    categories become rows/columns, in category order. Duplicate
+    (index, columns) pairs keep the last value.
+    """
+    row_present, row_pos = _present_positions(df[index].cat.codes.to_numpy(), len(df[index].cat.categories))
+    col_present, col_pos = _present_positions(df[columns].cat.codes.to_numpy(), len(df[columns].cat.categories))
+
+    grids = []
+    for column in values:
+        grid = np.full((len(row_present), len(col_present)), np.nan)
+        grid[row_pos, col_pos] = widen_floats(df[column], decimals)
+        grids.append(grid)
+    row_labels = pd.Index(df[index].cat.categories[row_present], name=index)
+    col_labels = pd.Index(df[columns].cat.categories[col_present], name=columns)
+    return row_labels, col_labels, grids
+
+
+def schema_pivot(df, index='Team', columns='Season', values='Total_Revenue', decimals=4):
+    """
+    Pivot on category codes with a dense NumPy scatter instead of a hash-based reshape
+
+    Only observed teams/seasons become rows/columns, in category order, like
+    ``DataFrame.pivot``; duplicate (index, columns) pairs keep the last value.
+    """
+    if not (isinstance(df[index].dtype, pd.CategoricalDtype) and isinstance(df[columns].dtype, pd.CategoricalDtype)):
+        return df.pivot(index=index, columns=columns, values=values)
+
+    row_labels, col_labels, (grid,) = schema_grids(df, index, columns, [values], decimals)
+    return pd.DataFrame(grid, index=row_labels, columns=col_labels)
+
+
+def memory_usage_mb(df):
+    return df.memory_usage(deep=True).sum() / 1e6
@@ -0,0 +1,242 @@
+"""
+Monte Carlo what-if simulator for FEI and revenue targets
+
+Each scenario scales every club's Matchday, Broadcasting and Commercial
+revenue by mean-preserving lognormal shocks, one per stream and club. Total
+revenue is the sum of the scaled streams. Revenue growth is recomputed
+against the previous season's total implied by the observed growth, plus a
+normal shock in percentage points. FEI is scored with the dashboard's own
+definition (``fei_scores``).
+
+Scenarios run in batches of ``(scenarios, clubs)`` arrays with no Python
+loop per scenario. Batch size is capped by ``max_cells`` (scenario x club
+cells), so memory stays bounded however many scenarios or clubs are
+requested. Percentile bands come from fixed-width streaming histograms per
+club, sized from the first batch. Rank and target counts are accumulated
+with ``bincount``.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from plfinance.fei import fei_scores
+from plfinance.schema import as_float64
+
+DEFAULT_SCENARIOS = 100_000
+
+# Scenario x club cells per batch (each cell holds a few float64 values per stream)
+DEFAULT_MAX_CELLS = 1_000_000
+
+PERCENTILES = (5, 25, 50, 75, 95)
+HISTOGRAM_BINS = 4096
+
+STREAMS = ['Matchday_Revenue', 'Broadcasting_Revenue', 'Commercial_Revenue']
+
+# Columns of the season frame a simulation reads
+SIMULATION_COLUMNS = ['Team', *STREAMS, 'Total_Revenue', 'Revenue_Growth']
+
+
+@dataclass(frozen=True)
+class ScenarioSpec:
+    """
+    Shock sizes: relative standard deviation per revenue stream, growth noise in percentage points
+    """
+    matchday_sigma: float = 0.10
+    broadcasting_sigma: float = 0.05
+    commercial_sigma: float = 0.08
+    growth_sigma: float = 2.0
+    # Mean log shift applied to every stream (0 = shocks preserve the expected revenue)
+    drift: float = 0.0
+
+    @property
+    def stream_sigmas(self):
+        return np.array([self.matchday_sigma, self.broadcasting_sigma, self.commercial_sigma])
+
+
+class _StreamingHistogram:
+    """
+    Fixed-width histogram per column; values beyond the range land in the edge bins
+    """
+
+    def __init__(self, sample, bins=HISTOGRAM_BINS):
+        # Range from the first batch, widened by its own span on both sides
+        low, high = sample.min(axis=0), sample.max(axis=0)
+        span = np.where(high > low, high - low, np.maximum(np.abs(high), 1.0))
+        self.low = low - span
+        self.width = 3 * span / bins
+        self.bins = bins
+        self.counts = np.zeros((sample.shape[1], bins), dtype=np.int64)
+
+    def add(self, values):
+        columns = values.shape[1]
+        index = np.clip(((values - self.low) / self.width).astype(np.int64), 0, self.bins - 1)
+        flat = (np.arange(columns) * self.bins + index).ravel()
+        self.counts += np.bincount(flat, minlength=columns * self.bins).reshape(columns, self.bins)
+
+    def percentiles(self, percentiles):
+        """
+        (columns x percentiles) values, interpolated linearly inside the bin
+        """
+        cumulative = np.cumsum(self.counts, axis=1)
+        total = cumulative[:, -1:]
+        result = np.empty((self.counts.shape[0], len(percentiles)))
+        for j, percentile in enumerate(percentiles):
+            rank = percentile / 100 * total
+            bin_index = (cumulative < rank).sum(axis=1)
+            rows = np.arange(len(bin_index))
+            below = np.where(bin_index > 0, cumulative[rows, np.maximum(bin_index - 1, 0)], 0)
+            in_bin = np.maximum(self.counts[rows, bin_index], 1)
+            fraction = (rank[:, 0] - below) / in_bin
+            result[:, j] = self.low + (bin_index + fraction) * self.width
+        return result
+
+
+@dataclass
+class SimulationResult:
+    """
+    Percentile bands, rank probabilities and target odds from one simulation run
+    """
+    teams: list
+    n_scenarios: int
+    spec: ScenarioSpec
+    fei_bands: pd.DataFrame
+    revenue_bands: pd.DataFrame
+    rank_probabilities: pd.DataFrame
+    total_revenue_bands: pd.Series
+    revenue_target: float
+    target_probability: float
+
+    @property
+    def rank_stability(self):
+        """
+        Probability that each club keeps its observed FEI rank
+        """
+        observed = self.fei_bands['Observed_Rank']
+        return pd.Series(
+            [self.rank_probabilities.loc[team, rank] for team, rank in observed.items()],
+            index=observed.index, name='P(observed rank)'
+        )
+
+    def band_frame(self, metric='FEI'):
+        """
+        Long-format bands (Team, Percentile, Value) for charting
+        """
+        bands = self.fei_bands if metric == 'FEI' else self.revenue_bands
+        columns = [f'p{p}' for p in PERCENTILES]
+        return bands[columns].reset_index().melt(id_vars='Team', var_name='Percentile', value_name='Value')
+
+
+def _base_arrays(df):
+    streams = np.column_stack([as_float64(df[column]) for column in STREAMS])
+    growth = as_float64(df['Revenue_Growth'])
+    total = as_float64(df['Total_Revenue'])
+    return streams, growth, total
+
+
+def _simulate_batch(rng, streams, previous_total, spec, size):
+    """
+    (totals, growth, fei) arrays of shape (size, clubs) for one batch of scenarios
+    """
+    sigmas = spec.stream_sigmas
+    # Mean-preserving lognormal factors per scenario, club and stream
+    shocks = rng.standard_normal((size, streams.shape[0], 3))
+    factors = np.exp(spec.drift - sigmas ** 2 / 2 + sigmas * shocks)
+    scenario_streams = streams[None, :, :] * factors
+    totals = scenario_streams.sum(axis=2)
+    growth = (totals / previous_total - 1) * 100 + spec.growth_sigma * rng.standard_normal(totals.shape)
+    fei = fei_scores(growth, scenario_streams[:, :, 2], scenario_streams[:, :, 0], totals)
+    return totals, growth, fei
+
+
+def _ranks(fei):
+    # 0 = best FEI in each scenario; ties keep data order
+    order = np.argsort(-fei, axis=1, kind='stable')
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.broadcast_to(np.arange(fei.shape[1]), fei.shape), axis=1)
+    return ranks
+
+
+def simulate(df, revenue_target, spec=None, n_scenarios=DEFAULT_SCENARIOS, seed=0, max_cells=DEFAULT_MAX_CELLS):
+    """
+    Run ``n_scenarios`` what-if scenarios for the clubs in a season frame
+
+    ``df`` has one row per club with the revenue streams, Total_Revenue and
+    Revenue_Growth (the dashboard's filtered frame). ``revenue_target`` is
+    compared with the clubs' combined total revenue in every scenario.
+    """
+    spec = spec or ScenarioSpec()
+    teams = df['Team'].astype(str).tolist()
+    n_teams = len(teams)
+    streams, growth, total = _base_arrays(df)
+    previous_total = total / (1 + growth / 100)
+    observed_fei = fei_scores(growth, streams[:, 2], streams[:, 0], total)
+    observed_rank = _ranks(observed_fei[None, :])[0]
+
+    rng = np.random.default_rng(seed)
+    batch = max(1, min(n_scenarios, max_cells // max(n_teams, 1)))
+    fei_hist = revenue_hist = total_hist = None
+    rank_counts = np.zeros(n_teams * n_teams, dtype=np.int64)
+    hits = 0
+
+    done = 0
+    while done < n_scenarios:
+        size = min(batch, n_scenarios - done)
+        totals, _, fei = _simulate_batch(rng, streams, previous_total, spec, size)
+        league_total = totals.sum(axis=1, keepdims=True)
+        if fei_hist is None:
+            fei_hist, revenue_hist = _StreamingHistogram(fei), _StreamingHistogram(totals)
+            total_hist = _StreamingHistogram(league_total)
+        fei_hist.add(fei)
+        revenue_hist.add(totals)
+        total_hist.add(league_total)
+        rank_counts += np.bincount(
+            (np.arange(n_teams) * n_teams + _ranks(fei)).ravel(), minlength=n_teams * n_teams
+        )
+        hits += int((league_total >= revenue_target).sum())
+        done += size
+
+    columns = [f'p{p}' for p in PERCENTILES]
+    index = pd.Index(teams, name='Team')
+    fei_bands = pd.DataFrame(fei_hist.percentiles(PERCENTILES), index=index, columns=columns)
+    fei_bands['Observed'] = observed_fei
+    fei_bands['Observed_Rank'] = observed_rank + 1
+    revenue_bands = pd.DataFrame(revenue_hist.percentiles(PERCENTILES), index=index, columns=columns)
+    revenue_bands['Observed'] = total
+    rank_probabilities = pd.DataFrame(
+        rank_counts.reshape(n_teams, n_teams) / n_scenarios,
+        index=index, columns=pd.RangeIndex(1, n_teams + 1, name='Rank')
+    )
+    return SimulationResult(
+        teams=teams,
+        n_scenarios=n_scenarios,
+        spec=spec,
+        fei_bands=fei_bands,
+        revenue_bands=revenue_bands,
+        rank_probabilities=rank_probabilities,
+        total_revenue_bands=pd.Series(total_hist.percentiles(PERCENTILES)[0], index=columns, name='Total_Revenue'),
+        revenue_target=revenue_target,
+        target_probability=hits / n_scenarios
+    )
+
+
+def fei_sensitivity(df, shift=0.10):
+    """
+    Change in each club's FEI when one revenue stream (or growth, in points) moves by ``shift``
+
+    Streams are scaled by (1 + shift) with the total and growth following;
+    the growth row adds ``shift * 100`` percentage points.
+    """
+    streams, growth, total = _base_arrays(df)
+    previous_total = total / (1 + growth / 100)
+    base = fei_scores(growth, streams[:, 2], streams[:, 0], total)
+
+    columns = {}
+    for i, column in enumerate(STREAMS):
+        shifted = streams.copy()
+        shifted[:, i] *= 1 + shift
+        shifted_total = shifted.sum(axis=1)
+        shifted_growth = (shifted_total / previous_total - 1) * 100
+        columns[column] = fei_scores(shifted_growth, shifted[:, 2], shifted[:, 0], shifted_total) - base
+    columns['Revenue_Growth'] = fei_scores(growth + shift * 100, streams[:, 2], streams[:, 0], total) - base
+    return pd.DataFrame(columns, index=pd.Index(df['Team'].astype(str).tolist(), name='Team')).round(3)
@@ -0,0 +1,269 @@
+"""
+League table construction from openfootball-style match results
+"""
+import numpy as np
+import pandas as pd
+
+# Columns of the performance table, in dashboard order
+STANDINGS_COLUMNS = [
+    'Team', 'Matches_Played', 'Wins', 'Draws', 'Losses', 'Goals_Scored',
+    'Goals_Conceded', 'Points', 'Goal_Difference'
+]
+
+# Counters kept per team; Points and Goal_Difference are derived from them
+STAT_COLUMNS = ['Matches_Played', 'Wins', 'Draws', 'Losses', 'Goals_Scored', 'Goals_Conceded']
+
+# openfootball club names that differ from the dashboard names once " FC" is dropped
+TEAM_ALIASES = {
+    'Tottenham Hotspur': 'Tottenham',
+    'Brighton & Hove Albion': 'Brighton',
+    'Wolverhampton Wanderers': 'Wolves',
+    'AFC Bournemouth': 'Bournemouth'
+}
+
+
+def normalize_team_name(name):
+    """
+    Map an openfootball club name ("Arsenal FC") onto the dashboard name ("Arsenal")
+    """
+    name = name.strip()
+    if name.endswith(' FC'):
+        name = name[:-3]
+    return TEAM_ALIASES.get(name, name)
+
+
+def parse_openfootball_matches(payload):
+    """
+    Flatten an openfootball ``en.1.json`` document into a frame of played matches
+
+    Handles both the flat ``matches`` layout and the older ``rounds`` layout.
+    Fixtures without a full-time score are skipped.
+    """
+    if 'matches' in payload:
+        raw_matches = payload['matches']
+    else:
+        raw_matches = [
+            dict(match, round=round_['name'])
+            for round_ in payload.get('rounds', [])
+            for match in round_.get('matches', [])
+        ]
+
+    rows = []
+    for match in raw_matches:
+        score = match.get('score', {})
+        full_time = score.get('ft') if isinstance(score, dict) else None
+        if full_time is None:
+            # Older files keep the score in score1/score2
+            if match.get('score1') is None or match.get('score2') is None:
+                continue
+            full_time = [match['score1'], match['score2']]
+        rows.append({
+            'Round': match.get('round'),
+            'Date': match.get('date'),
+            'Home_Team': normalize_team_name(match['team1'] if isinstance(match['team1'], str) else match['team1']['name']),
+            'Away_Team': normalize_team_name(match['team2'] if isinstance(match['team2'], str) else match['team2']['name']),
+            'Home_Goals': int(full_time[0]),
+            'Away_Goals': int(full_time[1])
+        })
+    return pd.DataFrame(rows, columns=['Round', 'Date', 'Home_Team', 'Away_Team', 'Home_Goals', 'Away_Goals'])
+
+
+def matchday_numbers(matches):
+    """
+    Matchday number per match from "Matchday N" round labels, falling back to round order
+    """
+    if matches.empty:
+        return pd.Series([], index=matches.index, dtype=np.int64)
+    numbers = matches['Round'].astype(str).str.extract(r'(\d+)\s*$', expand=False)
+    if numbers.notna().all():
+        return numbers.astype(np.int64)
+    return pd.Series(pd.factorize(matches['Round'])[0] + 1, index=matches.index, dtype=np.int64)
+
+
+def _match_key(date, home_team, away_team):
+    return (date, home_team, away_team)
+
+
+def unseen_matches(results, matches):
+    """
+    Rows of a full results file not yet in ``results`` (match key -> score), or None if a seen score changed
+    """
+    keys = list(zip(matches['Date'], matches['Home_Team'], matches['Away_Team']))
+    scores = list(zip(matches['Home_Goals'], matches['Away_Goals']))
+    is_new = []
+    for key, score in zip(keys, scores):
+        seen = results.get(key)
+        if seen is not None and tuple(seen) != tuple(score):
+            return None
+        is_new.append(seen is None)
+    return matches[np.array(is_new, dtype=bool)]
+
+
+class LeagueTable:
+    """
+    Incrementally maintained league table
+
+    Per-team counters live in one integer array. ``add_match`` touches only the
+    two affected rows; ``extend`` replays a whole batch with a vectorized
+    groupby. Each completed matchday leaves a cheap checkpoint (a copy of the
+    counters) so "as of matchday N" snapshots never replay results.
+
+    Matchdays are treated as ingest order: a rescheduled fixture with an older
+    round label is counted in the current matchday.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self._team_index = {}
+        self._teams = []
+        self._stats = np.zeros((8, len(STAT_COLUMNS)), dtype=np.int64)
+        self._checkpoints = {}
+        self._results = {}
+        self.matchday = 0
+
+    @classmethod
+    def from_matches(cls, matches):
+        table = cls()
+        table.extend(matches)
+        return table
+
+    def __len__(self):
+        return len(self._teams)
+
+    def _row(self, team):
+        row = self._team_index.get(team)
+        if row is None:
+            row = len(self._teams)
+            if row == len(self._stats):
+                # Grow geometrically so adding clubs stays amortized O(1)
+                self._stats = np.vstack([self._stats, np.zeros_like(self._stats)])
+            self._team_index[team] = row
+            self._teams.append(team)
+        return row
+
+    def _advance(self, matchday):
+        if matchday is not None and matchday > self.matchday:
+            if self._teams:
+                self._checkpoints[self.matchday] = (len(self._teams), self._stats[:len(self._teams)].copy())
+            self.matchday = matchday
+
+    def add_match(self, home_team, away_team, home_goals, away_goals, matchday=None, date=None):
+        """
+        Apply one result, updating only the two affected rows
+        """
+        self._advance(matchday)
+        home, away = self._row(home_team), self._row(away_team)
+        home_result = (home_goals > away_goals, home_goals == away_goals, home_goals < away_goals)
+
+        self._stats[home] += (1, home_result[0], home_result[1], home_result[2], home_goals, away_goals)
+        self._stats[away] += (1, home_result[2], home_result[1], home_result[0], away_goals, home_goals)
+        self._results[_match_key(date, home_team, away_team)] = (home_goals, away_goals)
+
+    def extend(self, matches):
+        """
+        Replay a batch of results (a full season file or the new tail of one) in bulk
+        """
+        if matches.empty:
+            return
+        matchdays = np.maximum(matchday_numbers(matches).to_numpy(), self.matchday)
+        # Checkpoint the current matchday before the batch adds any clubs or results
+        self._advance(int(matchdays.min()))
+        for team in pd.unique(matches[['Home_Team', 'Away_Team']].to_numpy().ravel()):
+            self._row(team)
+
+        results = _team_results(matches, matchdays)
+        deltas = results.groupby(['Matchday', 'Team'], sort=True)[STAT_COLUMNS].sum()
+
+        # (matchday x team x stat) deltas, accumulated along the matchday axis
+        batch_matchdays = deltas.index.get_level_values('Matchday').unique().to_numpy()
+        md_position = np.searchsorted(batch_matchdays, deltas.index.get_level_values('Matchday'))
+        team_position = deltas.index.get_level_values('Team').map(self._team_index).to_numpy()
+        cumulative = np.zeros((len(batch_matchdays), len(self._teams), len(STAT_COLUMNS)), dtype=np.int64)
+        np.add.at(cumulative, (md_position, team_position), deltas.to_numpy(dtype=np.int64))
+        cumulative = np.cumsum(cumulative, axis=0) + self._stats[:len(self._teams)]
+
+        # Every matchday of the batch but the last becomes a checkpoint
+        for matchday, stats in zip(batch_matchdays[:-1], cumulative[:-1]):
+            self._checkpoints[int(matchday)] = (len(self._teams), stats)
+        self.matchday = int(batch_matchdays[-1])
+        self._stats[:len(self._teams)] = cumulative[-1]
+
+        for key, score in zip(
+            zip(matches['Date'], matches['Home_Team'], matches['Away_Team']),
+            zip(matches['Home_Goals'], matches['Away_Goals'])
+        ):
+            self._results[key] = score
+
+    def sync(self, matches):
+        """
+        Bring the table in line with a full results file, applying only unseen matches
+
+        Returns the number of matches applied. If a previously applied result
+        changed (a correction), the table is rebuilt from the file.
+        """
+        new_matches = unseen_matches(self._results, matches)
+        if new_matches is None:
+            self._reset()
+            self.extend(matches)
+            return len(matches)
+        self.extend(new_matches)
+        return len(new_matches)
+
+    def _frame(self, n_teams, stats):
+        table = pd.DataFrame(stats[:n_teams], columns=STAT_COLUMNS)
+        table.insert(0, 'Team', self._teams[:n_teams])
+        table['Points'] = table['Wins'] * 3 + table['Draws']
+        table['Goal_Difference'] = table['Goals_Scored'] - table['Goals_Conceded']
+        table = table.sort_values(
+            ['Points', 'Goal_Difference', 'Goals_Scored', 'Team'],
+            ascending=[False, False, False, True],
+            ignore_index=True
+        )
+        return table[STANDINGS_COLUMNS]
+
+    def to_frame(self):
+        """
+        Current standings in the dashboard's performance-table layout
+        """
+        return self._frame(len(self._teams), self._stats)
+
+    def as_of(self, matchday):
+        """
+        Standings as of the end of ``matchday``, served from the nearest checkpoint
+        """
+        if matchday >= self.matchday:
+            return self.to_frame()
+        available = [md for md in self._checkpoints if md <= matchday]
+        if not available:
+            return pd.DataFrame(columns=STANDINGS_COLUMNS)
+        n_teams, stats = self._checkpoints[max(available)]
+        return self._frame(n_teams, stats)
+
+
+def _team_results(matches, matchdays):
+    """
+    One row per team per match (home and away perspectives) with result counters
+    """
+    home_goals = matches['Home_Goals'].to_numpy(dtype=np.int64)
+    away_goals = matches['Away_Goals'].to_numpy(dtype=np.int64)
+    goals_for = np.concatenate([home_goals, away_goals])
+    goals_against = np.concatenate([away_goals, home_goals])
+    return pd.DataFrame({
+        'Matchday': np.concatenate([matchdays, matchdays]),
+        'Team': np.concatenate([matches['Home_Team'].to_numpy(), matches['Away_Team'].to_numpy()]),
+        'Matches_Played': 1,
+        'Wins': (goals_for > goals_against).astype(np.int64),
+        'Draws': (goals_for == goals_against).astype(np.int64),
+        'Losses': (goals_for < goals_against).astype(np.int64),
+        'Goals_Scored': goals_for,
+        'Goals_Conceded': goals_against
+    })
+
+
+def standings_from_matches(matches):
+    """
+    Build the league table from a frame of played matches in one bulk replay
+    """
+    return LeagueTable.from_matches(matches).to_frame()
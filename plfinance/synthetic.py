@@ -0,0 +1,148 @@
+"""
+Deterministic synthetic league generator for scaling tests and benchmarks
+
+Produces N clubs x M seasons of financial and performance data with the
+bundled sample's columns (``SEASONS_FINANCIAL_DATA`` / ``CURRENT_SEASON_DATA``
+plus Season). Seasons run up to ``CURRENT_SEASON``, so the frames drop into
+``load_dataset`` unchanged. Each club has a persistent size and strength:
+bigger clubs earn more in every stream, revenue compounds season to season
+(Revenue_Growth is consistent with consecutive Total_Revenue), and
+stronger clubs win more. The same (clubs, seasons, seed) always gives the
+same frames. ``synthetic_matches`` generates match-by-match results for
+the rolling-form benchmarks.
+"""
+import numpy as np
+import pandas as pd
+
+from plfinance.data_sources import FINANCIAL_COLUMNS, PERFORMANCE_COLUMNS, SampleDataSource
+from plfinance.sample_data import CURRENT_SEASON
+
+# Stream mix of a typical club (matchday, broadcasting, commercial) and its spread
+STREAM_MIX = np.array([0.15, 0.45, 0.40])
+STREAM_MIX_CONCENTRATION = 40.0
+
+
+def season_labels(seasons, last=CURRENT_SEASON):
+    """
+    ``seasons`` consecutive labels ('2023-24' style) ending with ``last``
+    """
+    last_start = int(last[:4])
+    return [f"{year}-{(year + 1) % 100:02d}" for year in range(last_start - seasons + 1, last_start + 1)]
+
+
+def club_names(clubs):
+    return [f"Club {i + 1:04d}" for i in range(clubs)]
+
+
+def synthetic_frames(clubs, seasons, seed=0, matches_played=38, last_season=CURRENT_SEASON):
+    """
+    (financial, performance) frames for ``clubs`` x ``seasons``, rows ordered by season then club
+    """
+    rng = np.random.default_rng(seed)
+    labels = season_labels(seasons, last_season)
+    teams = club_names(clubs)
+
+    # Persistent club traits
+    size = rng.lognormal(mean=0.0, sigma=0.45, size=clubs)
+    strength = 0.6 * np.log(size) + rng.normal(0.0, 0.3, clubs)
+    mix = rng.dirichlet(STREAM_MIX * STREAM_MIX_CONCENTRATION, size=clubs)
+
+    # Revenue compounds from a size-scaled base, one growth draw per club-season
+    growth = rng.normal(0.05, 0.07, (clubs, seasons))
+    total = 400.0 * size[:, None] * np.cumprod(1 + growth, axis=1)
+    streams = np.round(total[:, :, None] * mix[:, None, :] * rng.uniform(0.9, 1.1, (clubs, seasons, 3)), 1)
+    total = streams.sum(axis=2).round(1)
+
+    # Growth against the previous season's total (the first season keeps its drawn growth)
+    revenue_growth = np.empty_like(total)
+    revenue_growth[:, 0] = growth[:, 0] * 100
+    revenue_growth[:, 1:] = (total[:, 1:] - total[:, :-1]) / total[:, :-1] * 100
+    revenue_growth = revenue_growth.round(1)
+
+    # Season-major ordering, like the bundled dataset
+    financial = pd.DataFrame({
+        'Team': np.tile(teams, seasons),
+        'Matchday_Revenue': streams[:, :, 0].T.ravel(),
+        'Broadcasting_Revenue': streams[:, :, 1].T.ravel(),
+        'Commercial_Revenue': streams[:, :, 2].T.ravel(),
+        'Total_Revenue': total.T.ravel(),
+        'Revenue_Growth': revenue_growth.T.ravel(),
+        'Season': np.repeat(labels, clubs)
+    })[FINANCIAL_COLUMNS]
+
+    # Match results: win/draw probabilities from strength relative to the league
+    form = strength[None, :] + rng.normal(0.0, 0.25, (seasons, clubs))
+    edge = (form - form.mean(axis=1, keepdims=True)).ravel()
+    p_win = np.clip(0.37 + 0.18 * edge, 0.05, 0.85)
+    p_draw = np.full_like(p_win, 0.25)
+    p_loss = np.clip(1 - p_win - p_draw, 0.0, None)
+    probabilities = np.stack([p_win, p_draw, p_loss], axis=1)
+    probabilities /= probabilities.sum(axis=1, keepdims=True)
+    results = rng.multinomial(matches_played, probabilities)
+    wins, draws, losses = results[:, 0], results[:, 1], results[:, 2]
+
+    goals_scored = rng.poisson(matches_played * np.clip(1.4 + 0.5 * edge, 0.4, None))
+    goals_conceded = rng.poisson(matches_played * np.clip(1.4 - 0.5 * edge, 0.4, None))
+    performance = pd.DataFrame({
+        'Team': np.tile(teams, seasons),
+        'Matches_Played': matches_played,
+        'Wins': wins,
+        'Draws': draws,
+        'Losses': losses,
+        'Goals_Scored': goals_scored,
+        'Goals_Conceded': goals_conceded,
+        'Points': 3 * wins + draws,
+        'Goal_Difference': goals_scored - goals_conceded,
+        'Season': np.repeat(labels, clubs)
+    })[PERFORMANCE_COLUMNS]
+    return financial, performance
+
+
+def synthetic_matches(clubs, matchdays, seed=0):
+    """
+    Match results in the ``parse_openfootball_matches`` layout: every club plays once per matchday
+    """
+    rng = np.random.default_rng(seed)
+    teams = np.array(club_names(clubs))
+    strength = rng.normal(0.0, 0.3, clubs)
+    pairs = clubs // 2
+
+    order = np.argsort(rng.random((matchdays, clubs)), axis=1)[:, :2 * pairs]
+    home, away = order[:, 0::2].ravel(), order[:, 1::2].ravel()
+    home_goals = rng.poisson(np.clip(1.5 + strength[home] - strength[away], 0.2, None))
+    away_goals = rng.poisson(np.clip(1.2 + strength[away] - strength[home], 0.2, None))
+    rounds = np.repeat(np.arange(1, matchdays + 1), pairs)
+    return pd.DataFrame({
+        'Round': [f"Matchday {md}" for md in rounds],
+        'Date': (np.datetime64('2024-08-01') + (rounds - 1) * 7).astype(str),
+        'Home_Team': teams[home],
+        'Away_Team': teams[away],
+        'Home_Goals': home_goals,
+        'Away_Goals': away_goals
+    })
+
+
+class SyntheticDataSource(SampleDataSource):
+    """
+    Generated league served from memory through the regular data-source interface
+    """
+
+    def __init__(self, clubs, seasons, seed=0, matches_played=38):
+        super().__init__()
+        self.clubs = clubs
+        self.n_seasons = seasons
+        self.seed = seed
+        self.matches_played = matches_played
+
+    def _load(self):
+        if self._tables is None:
+            financial, performance = synthetic_frames(self.clubs, self.n_seasons, self.seed, self.matches_played)
+            self._tables = {'financial': financial, 'performance': performance}
+        return self._tables
+
+    def seasons(self, table='financial'):
+        return season_labels(self.n_seasons)
+
+    def fingerprint(self):
+        # Generation is deterministic, so the parameters identify the content
+        return f'synthetic:{self.clubs}x{self.n_seasons}:{self.seed}', str(self.matches_played)
@@ -0,0 +1,141 @@
+"""
+Local stand-in for the openfootball standings endpoint
+
+Serves an ``en.1.json``-style document over HTTP on localhost with ETag and
+Last-Modified validators, so the live fetcher can be exercised without network
+access. It can also answer with an error status or stall before responding,
+to test the fallback to static standings. Run standalone with ``python -m plfinance.testing [port]`` and point the
+dashboard at it through PL_STANDINGS_URL.
+"""
+import hashlib
+import json
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# A few rounds between the six sample clubs, in the current openfootball layout
+SAMPLE_MATCHES_PAYLOAD = {
+    'name': 'English Premier League 2024/25',
+    'matches': [
+        {'round': 'Matchday 1', 'date': '2024-08-17', 'team1': 'Arsenal FC', 'team2': 'Chelsea FC', 'score': {'ft': [2, 1]}},
+        {'round': 'Matchday 1', 'date': '2024-08-17', 'team1': 'Liverpool FC', 'team2': 'Tottenham Hotspur FC', 'score': {'ft': [3, 0]}},
+        {'round': 'Matchday 1', 'date': '2024-08-18', 'team1': 'Manchester City FC', 'team2': 'Manchester United FC', 'score': {'ft': [1, 1]}},
+        {'round': 'Matchday 2', 'date': '2024-08-24', 'team1': 'Chelsea FC', 'team2': 'Liverpool FC', 'score': {'ft': [0, 2]}},
+        {'round': 'Matchday 2', 'date': '2024-08-24', 'team1': 'Tottenham Hotspur FC', 'team2': 'Manchester City FC', 'score': {'ft': [2, 2]}},
+        {'round': 'Matchday 2', 'date': '2024-08-25', 'team1': 'Manchester United FC', 'team2': 'Arsenal FC', 'score': {'ft': [1, 3]}},
+        {'round': 'Matchday 3', 'date': '2024-08-31', 'team1': 'Arsenal FC', 'team2': 'Liverpool FC'}
+    ]
+}
+
+
+class StandingsStubServer:
+    """
+    Threaded HTTP server returning a fixed JSON payload, honouring conditional requests
+
+    ``etags=False`` serves Last-Modified only. Set ``error_status`` to answer
+    every request with that status, and ``delay`` (seconds) to stall each response.
+    """
+
+    def __init__(self, payload=None, host='127.0.0.1', port=0, etags=True):
+        self.request_count = 0
+        self.not_modified_count = 0
+        self.etags = etags
+        self.error_status = None
+        self.delay = 0
+        self.last_request_headers = {}
+        self._modified_at = 0
+        self.set_payload(SAMPLE_MATCHES_PAYLOAD if payload is None else payload)
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/en.1.json"
+
+    def set_payload(self, payload):
+        """
+        Replace the served document; a new ETag and Last-Modified are issued
+        """
+        self.body = json.dumps(payload).encode()
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:16] + '"'
+        # Whole seconds, later than the previous document even when replaced within the same second
+        self._modified_at = max(int(time.time()), self._modified_at + 1)
+        self.last_modified = formatdate(self._modified_at, usegmt=True)
+
+    def not_modified(self, headers):
+        """
+        Whether a request's validators match the current document (If-None-Match wins over If-Modified-Since)
+        """
+        if_none_match = headers.get('If-None-Match')
+        if if_none_match is not None:
+            return self.etags and if_none_match == self.etag
+        if_modified_since = headers.get('If-Modified-Since')
+        if if_modified_since is None:
+            return False
+        try:
+            return parsedate_to_datetime(if_modified_since).timestamp() >= self._modified_at
+        except (TypeError, ValueError):
+            return False
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.request_count += 1
+                stub.last_request_headers = dict(self.headers)
+                if stub.delay:
+                    time.sleep(stub.delay)
+                if stub.error_status is not None:
+                    self.send_response(stub.error_status)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if stub.not_modified(self.headers):
+                    stub.not_modified_count += 1
+                    self.send_response(304)
+                    self._validators()
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(stub.body)))
+                self._validators()
+                self.end_headers()
+                self.wfile.write(stub.body)
+
+            def _validators(self):
+                if stub.etags:
+                    self.send_header('ETag', stub.etag)
+                self.send_header('Last-Modified', stub.last_modified)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import sys
+
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    server = StandingsStubServer(port=port)
+    print(f"Serving sample standings at {server.url}")
+    server._server.serve_forever()
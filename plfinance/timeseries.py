@@ -0,0 +1,382 @@
+"""
+Rolling-window form and revenue series with constant-time appends
+
+Each club's values (per-match points, goal difference and expected points,
+or per-season revenue) are kept as running prefix sums in one (clubs x
+entries) panel. Appending a match or a season is one O(1) write per club,
+and a batch of them is a single vectorized scatter. The sum over any
+trailing window is the difference of two prefix rows, so the window length
+can be chosen when the series is read, with nothing recomputed over the
+history. ``FormTracker`` follows a results file the way ``LeagueTable``
+does: ``sync`` appends only the unseen matches.
+
+Expected points (xPts) are scoreline-based, since the results file has no
+shot data. Each side's goals are treated as its expected-goals rate, and the
+Poisson win/draw probabilities give 3 x P(win) + P(draw).
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from plfinance.schema import as_float64
+from plfinance.standings import _match_key, matchday_numbers, unseen_matches
+
+DEFAULT_FORM_WINDOW = 5
+DEFAULT_REVENUE_WINDOW = 3
+
+# Per-match values kept for each club, in panel column order
+FORM_VALUES = ['Points', 'Goal_Difference', 'xPts']
+FORM_COLUMNS = ['Team', 'Matches', 'Form_PPG', 'Form_GD', 'Form_xPts']
+
+# Scorelines above this many goals per side use the capped value's xPts
+XPTS_MAX_GOALS = 10
+
+
+@lru_cache(maxsize=1)
+def _xpts_table(max_goals=XPTS_MAX_GOALS, support=30):
+    # xPts[goals_for, goals_against] with Poisson(goals_for) vs Poisson(goals_against)
+    from math import factorial
+
+    k = np.arange(support)
+    rates = np.arange(max_goals + 1, dtype=np.float64)[:, None]
+    factorials = np.array([factorial(int(n)) for n in k], dtype=np.float64)
+    pmf = np.exp(-rates) * rates ** k / factorials
+    pmf[0] = 0.0
+    pmf[0, 0] = 1.0
+    # P(X > Y) and P(X == Y) for every rate pair
+    below = np.concatenate([np.zeros((len(rates), 1)), np.cumsum(pmf, axis=1)[:, :-1]], axis=1)
+    return 3 * (pmf @ below.T) + pmf @ pmf.T
+
+
+def expected_points(goals_for, goals_against):
+    """
+    Scoreline-based expected points for each (goals_for, goals_against) pair
+    """
+    goals_for = np.clip(np.asarray(goals_for, dtype=np.int64), 0, XPTS_MAX_GOALS)
+    goals_against = np.clip(np.asarray(goals_against, dtype=np.int64), 0, XPTS_MAX_GOALS)
+    return _xpts_table()[goals_for, goals_against]
+
+
+class RollingPanel:
+    """
+    Append-only series per key (club) of fixed-width rows, kept as prefix sums
+
+    ``prefix[key, n]`` is the sum of the key's first n rows, so the last
+    ``window`` rows of every key are summed with two gathers. Both axes grow
+    geometrically, keeping appends amortized O(1).
+    """
+
+    def __init__(self, width=1, capacity=16):
+        self.width = width
+        self._index = {}
+        self.keys = []
+        self._prefix = np.zeros((8, capacity + 1, width))
+        self._labels = np.empty((8, capacity), dtype=object)
+        self._lengths = np.zeros(8, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def positions(self, keys=None):
+        """
+        Panel rows for ``keys`` (every key when None); unknown keys are skipped
+        """
+        if keys is None:
+            return np.arange(len(self.keys))
+        return np.array([self._index[key] for key in keys if key in self._index], dtype=np.int64)
+
+    def _rows(self, keys):
+        # Panel rows for a batch of keys, adding unseen keys
+        inverse, uniques = pd.factorize(np.asarray(keys, dtype=object))
+        rows = np.empty(len(uniques), dtype=np.int64)
+        for i, key in enumerate(uniques):
+            row = self._index.get(key)
+            if row is None:
+                row = self._index[key] = len(self.keys)
+                self.keys.append(key)
+            rows[i] = row
+        self._grow(len(self.keys), 0)
+        return rows[inverse]
+
+    def _grow(self, n_keys, n_entries):
+        keys_capacity, entries_capacity = self._labels.shape
+        if n_keys <= keys_capacity and n_entries <= entries_capacity:
+            return
+        if n_keys > keys_capacity:
+            keys_capacity = max(n_keys, 2 * keys_capacity)
+        if n_entries > entries_capacity:
+            entries_capacity = max(n_entries, 2 * entries_capacity)
+        prefix = np.zeros((keys_capacity, entries_capacity + 1, self.width))
+        labels = np.empty((keys_capacity, entries_capacity), dtype=object)
+        lengths = np.zeros(keys_capacity, dtype=np.int64)
+        used_keys, used_entries = self._labels.shape
+        prefix[:used_keys, :used_entries + 1] = self._prefix
+        labels[:used_keys, :used_entries] = self._labels
+        lengths[:used_keys] = self._lengths
+        self._prefix, self._labels, self._lengths = prefix, labels, lengths
+
+    def append(self, key, values, label=None):
+        """
+        Append one row to a key's series
+        """
+        row = self._rows([key])[0]
+        n = self._lengths[row]
+        self._grow(len(self.keys), n + 1)
+        self._prefix[row, n + 1] = self._prefix[row, n] + values
+        self._labels[row, n] = label
+        self._lengths[row] = n + 1
+
+    def extend(self, keys, values, labels=None):
+        """
+        Append a batch of rows (kept in the given order within each key) with one vectorized scatter
+        """
+        if len(keys) == 0:
+            return
+        values = np.asarray(values, dtype=np.float64).reshape(len(keys), self.width)
+        rows = self._rows(keys)
+        order = np.argsort(rows, kind='stable')
+        rows, values = rows[order], values[order]
+
+        # Each batch row's rank among the rows of its key
+        group_starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        group_sizes = np.diff(np.r_[group_starts, len(rows)])
+        rank = np.arange(len(rows)) - np.repeat(group_starts, group_sizes)
+        start_lengths = self._lengths[rows]
+        self._grow(len(self.keys), int((start_lengths + rank).max()) + 1)
+
+        # Cumulative sums restarted at every key, added to the key's current total
+        cumulative = np.cumsum(values, axis=0)
+        offsets = np.repeat(cumulative[group_starts] - values[group_starts], group_sizes, axis=0)
+        self._prefix[rows, start_lengths + rank + 1] = self._prefix[rows, start_lengths] + cumulative - offsets
+        if labels is not None:
+            self._labels[rows, start_lengths + rank] = np.asarray(labels, dtype=object)[order]
+        self._lengths[rows[group_starts]] += group_sizes
+
+    def window(self, window, keys=None):
+        """
+        (positions, sums, counts) over the last ``window`` rows of each key
+        """
+        positions = self.positions(keys)
+        ends = self._lengths[positions]
+        starts = np.maximum(ends - window, 0)
+        sums = self._prefix[positions, ends] - self._prefix[positions, starts]
+        return positions, sums, ends - starts
+
+    def latest_labels(self, positions):
+        return self._labels[positions, np.maximum(self._lengths[positions] - 1, 0)]
+
+    def trailing(self, key, window):
+        """
+        (labels, sums, counts) of the trailing window ending at every row of one key
+        """
+        row = self._index[key]
+        ends = np.arange(1, self._lengths[row] + 1)
+        starts = np.maximum(ends - window, 0)
+        sums = self._prefix[row, ends] - self._prefix[row, starts]
+        return self._labels[row, :len(ends)], sums, ends - starts
+
+    def copy(self):
+        panel = RollingPanel.__new__(RollingPanel)
+        panel.width = self.width
+        panel._index = dict(self._index)
+        panel.keys = list(self.keys)
+        panel._prefix = self._prefix.copy()
+        panel._labels = self._labels.copy()
+        panel._lengths = self._lengths.copy()
+        return panel
+
+
+class FormTracker:
+    """
+    Per-club rolling form (points per game, goal difference, xPts) over match results
+
+    Matches are appended in ingest order, like ``LeagueTable``; each result
+    is one O(1) append to the two clubs' series.
+    """
+
+    def __init__(self):
+        self._panel = RollingPanel(len(FORM_VALUES))
+        self._results = {}
+        self.matchday = 0
+
+    @classmethod
+    def from_matches(cls, matches):
+        tracker = cls()
+        tracker.extend(matches)
+        return tracker
+
+    @property
+    def teams(self):
+        return sorted(self._panel.keys)
+
+    def add_match(self, home_team, away_team, home_goals, away_goals, matchday=None, date=None):
+        """
+        Append one result to both clubs' series
+        """
+        home_xpts, away_xpts = expected_points([home_goals, away_goals], [away_goals, home_goals])
+        home_points = 3 * (home_goals > away_goals) + (home_goals == away_goals)
+        away_points = 3 * (away_goals > home_goals) + (home_goals == away_goals)
+        self._panel.append(home_team, (home_points, home_goals - away_goals, home_xpts), matchday)
+        self._panel.append(away_team, (away_points, away_goals - home_goals, away_xpts), matchday)
+        if matchday is not None:
+            self.matchday = max(self.matchday, matchday)
+        self._results[_match_key(date, home_team, away_team)] = (home_goals, away_goals)
+
+    def extend(self, matches):
+        """
+        Append a batch of results (a full season file or the new tail of one)
+        """
+        if matches.empty:
+            return
+        matchdays = np.maximum(matchday_numbers(matches).to_numpy(), self.matchday)
+        home_goals = matches['Home_Goals'].to_numpy(dtype=np.int64)
+        away_goals = matches['Away_Goals'].to_numpy(dtype=np.int64)
+
+        # Both perspectives of every match, interleaved so each club's rows stay in match order
+        teams = np.column_stack([matches['Home_Team'].to_numpy(), matches['Away_Team'].to_numpy()]).ravel()
+        goals_for = np.column_stack([home_goals, away_goals]).ravel()
+        goals_against = np.column_stack([away_goals, home_goals]).ravel()
+        values = np.column_stack([
+            3 * (goals_for > goals_against) + (goals_for == goals_against),
+            goals_for - goals_against,
+            expected_points(goals_for, goals_against)
+        ])
+        self._panel.extend(teams, values, np.repeat(matchdays, 2))
+
+        self.matchday = int(matchdays.max())
+        for key, score in zip(
+            zip(matches['Date'], matches['Home_Team'], matches['Away_Team']),
+            zip(home_goals.tolist(), away_goals.tolist())
+        ):
+            self._results[key] = score
+
+    def sync(self, matches):
+        """
+        Bring the series in line with a full results file, appending only unseen matches
+
+        Returns the number of matches applied; a corrected result rebuilds every series from the file.
+        """
+        new_matches = unseen_matches(self._results, matches)
+        if new_matches is None:
+            self.__init__()
+            new_matches = matches
+        self.extend(new_matches)
+        return len(new_matches)
+
+    def form(self, window=DEFAULT_FORM_WINDOW, teams=None):
+        """
+        Current form over each club's last ``window`` matches: PPG, goal difference and xPts per game
+        """
+        positions, sums, counts = self._panel.window(window, teams)
+        return pd.DataFrame({
+            'Team': [self._panel.keys[position] for position in positions],
+            'Matches': counts,
+            'Form_PPG': sums[:, 0] / counts,
+            'Form_GD': sums[:, 1],
+            'Form_xPts': sums[:, 2] / counts
+        }, columns=FORM_COLUMNS)
+
+    def history(self, teams=None, window=DEFAULT_FORM_WINDOW):
+        """
+        Form after every match of each club (shorter windows until ``window`` matches are played)
+        """
+        teams = self.teams if teams is None else [team for team in teams if team in self._panel]
+        frames = []
+        for team in teams:
+            labels, sums, counts = self._panel.trailing(team, window)
+            frames.append(pd.DataFrame({
+                'Team': team,
+                'Match': np.arange(1, len(counts) + 1),
+                'Matchday': labels,
+                'Form_PPG': sums[:, 0] / counts,
+                'Form_GD': sums[:, 1],
+                'Form_xPts': sums[:, 2] / counts
+            }))
+        if not frames:
+            return pd.DataFrame(columns=['Team', 'Match', 'Matchday', *FORM_COLUMNS[2:]])
+        return pd.concat(frames, ignore_index=True)
+
+    def copy(self):
+        """
+        Independent copy, safe to read while this tracker keeps appending
+        """
+        tracker = FormTracker.__new__(FormTracker)
+        tracker._panel = self._panel.copy()
+        tracker._results = dict(self._results)
+        tracker.matchday = self.matchday
+        return tracker
+
+
+class RollingRevenue:
+    """
+    Per-club season revenue series; adding a season is one O(1) append per club
+    """
+
+    def __init__(self, column='Total_Revenue'):
+        self.column = column
+        self._panel = RollingPanel()
+
+    @classmethod
+    def from_frame(cls, financial_df, column='Total_Revenue'):
+        """
+        Series for every club in a financial frame, seasons in chronological order
+        """
+        rolling = cls(column)
+        rolling.extend(financial_df)
+        return rolling
+
+    @property
+    def teams(self):
+        return sorted(self._panel.keys)
+
+    def append(self, team, season, value):
+        self._panel.append(team, value, season)
+
+    def extend(self, financial_df):
+        """
+        Append the rows of a financial frame (seasons newer than those already held), oldest season first
+        """
+        # Ordered categorical codes, or the labels themselves ('2023-24' sorts chronologically)
+        season = financial_df['Season']
+        order = np.argsort(
+            season.cat.codes.to_numpy() if isinstance(season.dtype, pd.CategoricalDtype) else season.to_numpy(),
+            kind='stable'
+        )
+        self._panel.extend(
+            financial_df['Team'].astype(str).to_numpy()[order],
+            as_float64(financial_df[self.column])[order],
+            season.astype(str).to_numpy()[order]
+        )
+
+    def latest(self, window=DEFAULT_REVENUE_WINDOW, teams=None):
+        """
+        Mean revenue over each club's last ``window`` seasons, with the latest season
+        """
+        positions, sums, counts = self._panel.window(window, teams)
+        return pd.DataFrame({
+            'Team': [self._panel.keys[position] for position in positions],
+            'Season': self._panel.latest_labels(positions),
+            'Seasons': counts,
+            'Rolling_Revenue': sums[:, 0] / counts
+        })
+
+    def history(self, team, window=DEFAULT_REVENUE_WINDOW):
+        """
+        Rolling mean after every season of one club
+        """
+        labels, sums, counts = self._panel.trailing(team, window)
+        return pd.DataFrame({'Season': labels, 'Rolling_Revenue': sums[:, 0] / counts})
+
+
+def form_vs_revenue(tracker, revenue, teams=None, form_window=DEFAULT_FORM_WINDOW,
+                    revenue_window=DEFAULT_REVENUE_WINDOW):
+    """
+    Current form joined with rolling revenue, one row per club present in both
+    """
+    form = tracker.form(form_window, teams)
+    rolling = revenue.latest(revenue_window, form['Team'].tolist())
+    return form.merge(rolling[['Team', 'Rolling_Revenue']], on='Team', how='inner')
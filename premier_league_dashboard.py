@@ -1,335 +1,319 @@
+"""
+Streamlit UI shell: layout, widgets and caching over the plfinance core package
+
+Run with: streamlit run premier_league_dashboard.py
+"""
+import contextlib
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import requests
-import json
-import base64
 from datetime import datetime
 
-# Page configuration
-st.set_page_config(
-    page_title="Premier League Analytics Dashboard",
-    page_icon="⚽",
-    layout="wide"
+from plfinance.cache import DEFAULT_TTL, get_cache
+from plfinance.dataset import cached_dataset, fei_table, season_view
+from plfinance.export import EXPORT_FORMATS, export_bytes, export_file_name
+from plfinance.fei import calculate_fei
+from plfinance.figures import (
+    FigureCache, build_fei_bands, build_fei_bar, build_form_revenue_scatter, build_form_trend,
+    build_league_comparison_bar, build_points_bar, build_points_revenue_scatter, build_revenue_bar,
+    build_revenue_growth_bar, build_revenue_pie, build_revenue_streams_bar, build_revenue_trend_line, figure_key
+)
+from plfinance.growth import STREAM_COLUMNS, GrowthAnalytics, season_comparison
+from plfinance.kpi import KPIAggregates
+from plfinance.leagues import DEFAULT_LEAGUE, compare_leagues, get_catalog
+from plfinance.live import STANDINGS_LEAGUE, StandingsFetcher
+from plfinance.profiling import RollingStageStats, RunProfiler, profiling_enabled
+from plfinance.regression import RegressionStats
+from plfinance.report import (
+    REPORT_FORMATS, ReportExporter, available_report_formats, report_content, report_file_name, report_version
 )
+from plfinance.risk import evaluate_risk_rules, strategic_recommendations
+from plfinance.schema import to_presentation
+from plfinance.simulation import SIMULATION_COLUMNS, ScenarioSpec, fei_sensitivity, simulate
+from plfinance.timeseries import DEFAULT_FORM_WINDOW, DEFAULT_REVENUE_WINDOW, RollingRevenue, form_vs_revenue
 
-@st.cache_data
-def load_premier_league_data():
-    """
-    Load real Premier League data from multiple sources
-    """
-    # Current season performance data (2024-25)
-    current_season_data = {
-        'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
-        'Matches_Played': [10, 10, 10, 10, 10, 10],
-        'Wins': [7, 6, 6, 5, 4, 4],
-        'Draws': [2, 3, 3, 3, 3, 1],
-        'Losses': [1, 1, 1, 2, 3, 5],
-        'Goals_Scored': [22, 18, 21, 16, 12, 15],
-        'Goals_Conceded': [8, 10, 6, 11, 12, 18],
-        'Points': [23, 21, 21, 18, 15, 13],
-        'Goal_Difference': [14, 8, 15, 5, 0, -3]
-    }
-    
-    # Financial data for all seasons (2020-21 to 2024-25 in millions)
-    # Each list contains data for all 6 teams for one season
-    seasons_financial_data = {
-        '2020-21': {
-            'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
-            'Matchday_Revenue': [7.1, 8.2, 7.5, 6.8, 11.2, 8.5],  # COVID-impacted
-            'Broadcasting_Revenue': [295.4, 201.8, 269.3, 198.7, 254.8, 162.2],
-            'Commercial_Revenue': [342.4, 177.8, 273.6, 287.6, 227.9, 231.7],
-            'Total_Revenue': [644.9, 388.0, 550.4, 493.1, 494.1, 402.4],
-            'Revenue_Growth': [-10.2, -12.9, -1.4, 5.0, -14.9, -9.7]
-        },
-        '2021-22': {
-            'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
-            'Matchday_Revenue': [53.4, 45.2, 71.8, 78.3, 91.0, 45.7],  # Partial recovery
-            'Broadcasting_Revenue': [307.2, 201.8, 275.3, 201.7, 230.8, 167.2],
-            'Commercial_Revenue': [370.4, 186.5, 354.6, 288.3, 305.3, 229.9],
-            'Total_Revenue': [731.0, 433.5, 701.7, 568.3, 627.1, 442.8],
-            'Revenue_Growth': [13.3, 11.7, 27.5, 15.3, 26.9, 10.0]
-        },
-        '2022-23': {
-            'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
-            'Matchday_Revenue': [71.4, 85.2, 83.2, 89.8, 111.0, 65.4],  # Full recovery
-            'Broadcasting_Revenue': [289.6, 201.8, 235.2, 198.7, 256.8, 150.2],
-            'Commercial_Revenue': [315.1, 146.5, 275.9, 192.8, 280.6, 167.4],
-            'Total_Revenue': [676.1, 433.5, 594.3, 481.3, 648.4, 383.0],
-            'Revenue_Growth': [-7.5, 0.0, -15.3, -15.3, 3.4, -13.5]
-        },
-        '2023-24': {
-            'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
-            'Matchday_Revenue': [78.2, 103.5, 84.2, 67.8, 110.1, 85.4],
-            'Broadcasting_Revenue': [314.1, 201.8, 275.2, 203.7, 230.8, 167.2],
-            'Commercial_Revenue': [341.2, 188.4, 247.1, 201.5, 279.3, 175.8],
-            'Total_Revenue': [733.5, 493.7, 606.5, 473.0, 620.2, 428.4],
-            'Revenue_Growth': [8.5, 13.9, 2.1, -1.7, -4.3, 11.9]
-        },
-        '2024-25': {
-            'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
-            'Matchday_Revenue': [82.5, 108.7, 89.1, 72.3, 115.2, 91.8],  # Projected
-            'Broadcasting_Revenue': [325.3, 215.9, 287.4, 218.9, 242.1, 178.5],  # Projected
-            'Commercial_Revenue': [358.7, 201.3, 265.8, 215.6, 295.7, 188.2],  # Projected
-            'Total_Revenue': [766.5, 525.9, 642.3, 506.8, 653.0, 458.5],  # Projected
-            'Revenue_Growth': [4.5, 6.5, 5.9, 7.1, 5.3, 7.0]  # Projected
-        }
-    }
-    
-    # Create comprehensive financial dataset
-    all_financial_data = []
-    for season, data in seasons_financial_data.items():
-        season_df = pd.DataFrame(data)
-        season_df['Season'] = season
-        all_financial_data.append(season_df)
-    
-    comprehensive_financial_df = pd.concat(all_financial_data, ignore_index=True)
-    
-    # Get current season (2024-25) financial data
-    current_financial = seasons_financial_data['2024-25']
-    financial_df = pd.DataFrame(current_financial)
-    
-    # Historical revenue data (simplified for trend analysis)
-    historical_revenue = comprehensive_financial_df[['Team', 'Season', 'Total_Revenue']].copy()
-    
-    # Convert to DataFrames
-    performance_df = pd.DataFrame(current_season_data)
-    
-    # Merge performance and current financial data
-    combined_df = pd.merge(performance_df, financial_df, on='Team')
-    
-    return combined_df, historical_revenue, comprehensive_financial_df
+@st.cache_resource
+def get_shared_cache():
+    """
+    Host-wide disk cache (PL_CACHE_DIR), or None for per-process caching only
+    """
+    return get_cache()
 
-@st.cache_data
-def fetch_live_premier_league_standings():
+# Leagues kept loaded per process; a league dropped from the caches is reloaded from its shard when selected again
+MAX_LOADED_LEAGUES = 4
+
+@st.cache_resource
+def get_league_catalog():
     """
-    Attempt to fetch live Premier League standings from a free API
-    Fallback to static data if API is unavailable
+    League metadata index (seasons, clubs, targets) of the configured data root; no league data is loaded
     """
-    try:
-        # Using a free football API (OpenFootball data)
-        url = "https://raw.githubusercontent.com/openfootball/football.json/master/2024-25/en.1.json"
-        response = requests.get(url, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            st.success("Live data loaded successfully!")
-            return True
-        else:
-            st.warning("Live API unavailable, using static data")
-            return False
-    except:
-        st.warning("Live API unavailable, using static data")
-        return False
+    return get_catalog()
 
-def create_download_link(df, filename, link_text):
+@st.cache_data(ttl=DEFAULT_TTL, max_entries=MAX_LOADED_LEAGUES)
+def load_league_data(league=DEFAULT_LEAGUE):
     """
-    Create a download link for DataFrame
+    Load one league's data from its shard, on first selection
+    (Parquet dataset in PL_DATA_DIR, or the bundled sample dataset)
+    Shared with other replicas through the disk cache when PL_CACHE_DIR is set
     """
-    csv = df.to_csv(index=False)
-    b64 = base64.b64encode(csv.encode()).decode()
-    href = f'<a href="data:file/csv;base64,{b64}" download="{filename}">{link_text}</a>'
-    return href
+    return cached_dataset(get_shared_cache(), get_league_catalog().source(league))
 
-def main():
-    # Load data
-    combined_df, historical_df, comprehensive_financial_df = load_premier_league_data()
-    
-    # Check for live data
-    live_data_available = fetch_live_premier_league_standings()
-    
-    # Sidebar filters
-    st.sidebar.header("Dashboard Filters")
-    
-    # Season filter
-    available_seasons = ['2020-21', '2021-22', '2022-23', '2023-24', '2024-25']
-    selected_season = st.sidebar.selectbox(
-        "Select Season:",
-        options=available_seasons,
-        index=len(available_seasons)-1,  # Default to latest season
-        help="Choose season for financial analysis"
-    )
-    
-    # Title and description
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        st.title("Premier League Performance & Financial Analytics Dashboard")
-        st.subheader(f"Business Intelligence Dashboard for Top 6 Premier League Teams - {selected_season} Season")
-    with col2:
-        st.markdown("")
-        st.markdown("")
-        st.markdown("<div style='text-align: right; color: #666; font-style: italic;'>Made with ❤️ by Mayank Kumar</div>", unsafe_allow_html=True)
-    
-    # Team filter
-    selected_teams = st.sidebar.multiselect(
-        "Select Teams:",
-        options=combined_df['Team'].tolist(),
-        default=combined_df['Team'].tolist(),
-        help="Choose teams to analyze"
+@st.cache_resource(max_entries=MAX_LOADED_LEAGUES)
+def load_kpi_aggregates(league=DEFAULT_LEAGUE):
+    """
+    Precompute per-(season, team) KPI partials once per data load, against the league's season targets
+    """
+    return KPIAggregates.from_frame(load_league_data(league).financial, targets=get_league_catalog()[league].targets)
+
+@st.cache_resource(max_entries=MAX_LOADED_LEAGUES)
+def load_rolling_revenue(league=DEFAULT_LEAGUE):
+    """
+    Per-club season revenue prefix sums, built once per data load
+    """
+    return RollingRevenue.from_frame(load_league_data(league).financial)
+
+@st.cache_resource(max_entries=MAX_LOADED_LEAGUES)
+def load_regression_stats(league=DEFAULT_LEAGUE):
+    """
+    Per-(season, team) points-vs-revenue moments, built once per data load
+    """
+    return RegressionStats.from_dataset(load_league_data(league))
+
+@st.cache_data(ttl=DEFAULT_TTL, max_entries=32)
+def load_league_comparison(season, leagues):
+    """
+    Per-league revenue summary of one season, read shard by shard without loading the leagues
+    """
+    return compare_leagues(get_league_catalog(), season, list(leagues))
+
+@st.cache_resource
+def get_stage_stats():
+    """
+    Process-wide rolling stage timings shared by all sessions
+    """
+    return RollingStageStats()
+
+@st.cache_resource
+def get_figure_cache():
+    """
+    Process-wide figure cache shared by all sessions
+    """
+    return FigureCache()
+
+@st.cache_resource
+def get_standings_fetcher():
+    """
+    Start the background live standings fetcher once per server process
+    Renders read its latest snapshot and fall back to static data until one exists
+    """
+    return StandingsFetcher(cache=get_shared_cache()).start()
+
+def live_snapshot_for(league):
+    """
+    Latest live standings snapshot when the feed covers the league, else None
+    """
+    if league != STANDINGS_LEAGUE:
+        return None
+    return get_standings_fetcher().latest()
+
+@st.cache_resource
+def get_report_exporter():
+    """
+    Process-wide report exporter; static chart images are cached in the shared cache when configured
+    Charts render in-process: forking a process pool from the threaded server is unsafe
+    """
+    return ReportExporter(cache=get_shared_cache(), workers=0)
+
+def build_report_document(league, season, teams, fmt):
+    """
+    Report document bytes, generated when the download button is clicked
+    A repeat export of unchanged data is served from the report cache without building the report
+    """
+    dataset, kpi_aggregates = load_league_data(league), load_kpi_aggregates(league)
+    live_snapshot = live_snapshot_for(league)
+    standings = live_snapshot.standings if live_snapshot is not None and not live_snapshot.standings.empty else None
+    return get_report_exporter().cached_export(
+        league, season, teams, report_version(dataset, standings, kpi_aggregates.targets),
+        lambda: report_content(dataset, season, teams, kpi_aggregates, standings, league=league),
+        fmt
     )
-    
-    # Get season-specific financial data
-    season_financial_df = comprehensive_financial_df[comprehensive_financial_df['Season'] == selected_season]
-    
-    # For current season (2024-25), add performance data; for others, use only financial data
-    if selected_season == '2024-25':
-        # Merge season-specific financial data with performance data for current season
-        performance_df = pd.DataFrame({
-            'Team': ['Manchester City', 'Arsenal', 'Liverpool', 'Chelsea', 'Manchester United', 'Tottenham'],
-            'Matches_Played': [10, 10, 10, 10, 10, 10],
-            'Wins': [7, 6, 6, 5, 4, 4],
-            'Draws': [2, 3, 3, 3, 3, 1],
-            'Losses': [1, 1, 1, 2, 3, 5],
-            'Goals_Scored': [22, 18, 21, 16, 12, 15],
-            'Goals_Conceded': [8, 10, 6, 11, 12, 18],
-            'Points': [23, 21, 21, 18, 15, 13],
-            'Goal_Difference': [14, 8, 15, 5, 0, -3]
-        })
-        # Merge current season financial data with performance data
-        current_season_financial = season_financial_df.copy()
-        filtered_df = pd.merge(performance_df, current_season_financial, on='Team')
-        filtered_df = filtered_df[filtered_df['Team'].isin(selected_teams)]
-        show_performance = True
-    else:
-        # Use only financial data for historical seasons
-        filtered_df = season_financial_df[season_financial_df['Team'].isin(selected_teams)]
-        show_performance = False
-    
-    # Data freshness indicator
-    if live_data_available:
-        st.sidebar.success("Live data active")
-    else:
-        st.sidebar.info("Using static data")
-    
-    st.sidebar.write("**Last Updated:** " + datetime.now().strftime("%Y-%m-%d %H:%M"))
-    
-    # Check if filtered data is empty
-    if filtered_df.empty:
-        st.warning("Please select at least one team to view analytics.")
+
+def show_chart(fig, name, profiler):
+    """
+    Render a Plotly figure, timing its serialization as its own stage
+    and recording its estimated payload size (from the figure cache)
+    """
+    with profiler.stage(f'chart:{name}'):
+        st.plotly_chart(fig, use_container_width=True)
+    if profiler.enabled:
+        profiler.record_payload(name, get_figure_cache().payload_bytes(fig))
+
+def render_profile_panel(profiler):
+    """
+    Debug sidebar panel with this run's stage timings and rolling p50/p95 per stage
+    """
+    with st.sidebar.expander("Render Profile", expanded=True):
+        st.caption(f"Run {profiler.run_id}")
+        st.dataframe(profiler.run_frame(), hide_index=True, use_container_width=True)
+        st.caption("Rolling p50/p95 across sessions")
+        st.dataframe(profiler.stats.summary(), hide_index=True, use_container_width=True)
+        if profiler.payloads:
+            st.caption(f"Chart payloads: ~{sum(profiler.payloads.values()) / 1024:.0f} KiB sent this run (estimated)")
+            st.dataframe(profiler.payload_frame(), hide_index=True, use_container_width=True)
+        cache_stats = get_figure_cache().stats()
+        st.caption(
+            f"Figure cache: {cache_stats['entries']} entries, ~{cache_stats['bytes'] / 1024:.0f} KiB, "
+            f"{cache_stats['hits']} hits / {cache_stats['misses']} misses"
+        )
+
+# Inputs shared by the dashboard sections, set on every full run; a section that
+# reruns on its own (st.fragment) reads them instead of redoing load and filtering
+SECTION_INPUTS_KEY = 'section_inputs'
+
+# Profiler of the full run in progress (None between runs)
+ACTIVE_PROFILER_KEY = 'active_profiler'
+
+@contextlib.contextmanager
+def section_profiler(section):
+    """
+    The full run's profiler, or a separate one (logged as its own record)
+    when the section reruns by itself after one of its widgets changed
+    """
+    profiler = st.session_state.get(ACTIVE_PROFILER_KEY)
+    if profiler is not None:
+        yield profiler
         return
+    profiler = RunProfiler(profiling_enabled(st.query_params), stats=get_stage_stats())
+    profiler.annotate(fragment=section)
+    try:
+        yield profiler
+    finally:
+        profiler.finish()
+
+def season_regression_stats(inputs):
+    """
+    Cached regression moments, with the selected season's rows taken from live standings when those are shown
+    """
+    stats = load_regression_stats(inputs['league'])
+    if inputs['data_version'] != 'static':
+        stats = stats.with_season(inputs['season'], inputs['df'])
+    return stats
+
+@st.fragment(key='kpis')
+def render_kpi_section():
+    inputs = st.session_state[SECTION_INPUTS_KEY]
+    selected_season = inputs['season']
+    kpis = inputs['kpis']
+    current_target = kpis['target']
     
-    # KPI Metrics Section
     st.header(f"Key Performance Indicators - {selected_season}")
     
-    # Season-specific targets and benchmarks
-    season_targets = {
-        '2020-21': {'revenue_target': 2400, 'growth_benchmark': -8.0, 'context': 'COVID Impact'},
-        '2021-22': {'revenue_target': 2800, 'growth_benchmark': 15.0, 'context': 'Recovery Phase'},
-        '2022-23': {'revenue_target': 3000, 'growth_benchmark': -5.0, 'context': 'Stabilization'},
-        '2023-24': {'revenue_target': 3200, 'growth_benchmark': 5.0, 'context': 'Growth Return'},
-        '2024-25': {'revenue_target': 3400, 'growth_benchmark': 6.0, 'context': 'Projected Growth'}
-    }
-    
-    current_target = season_targets.get(selected_season, season_targets['2024-25'])
-    
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        total_revenue = filtered_df['Total_Revenue'].sum()
-        target_diff = total_revenue - current_target['revenue_target']
         st.metric(
             label=f"Total Revenue (£M) - {current_target['context']}",
-            value=f"£{total_revenue:.1f}M",
-            delta=f"{target_diff:+.1f}M vs {selected_season} Target"
+            value=f"£{kpis['total_revenue']:.1f}M",
+            delta=f"{kpis['target_diff']:+.1f}M vs {selected_season} Target"
         )
     
     with col2:
-        avg_commercial = filtered_df['Commercial_Revenue'].mean()
-        commercial_share = (avg_commercial / filtered_df['Total_Revenue'].mean()) * 100
         st.metric(
             label="Avg Commercial (£M)",
-            value=f"£{avg_commercial:.1f}M",
-            delta=f"{commercial_share:.1f}% of Total Revenue"
+            value=f"£{kpis['avg_commercial']:.1f}M",
+            delta=f"{kpis['commercial_share']:.1f}% of Total Revenue"
         )
     
     with col3:
-        avg_growth = filtered_df['Revenue_Growth'].mean()
-        growth_vs_benchmark = avg_growth - current_target['growth_benchmark']
         st.metric(
             label="Revenue Growth (%)",
-            value=f"{avg_growth:.1f}%",
-            delta=f"{growth_vs_benchmark:+.1f}% vs {selected_season} Benchmark"
+            value=f"{kpis['avg_growth']:.1f}%",
+            delta=f"{kpis['growth_vs_benchmark']:+.1f}% vs {selected_season} Benchmark"
         )
     
     with col4:
-        avg_broadcasting = filtered_df['Broadcasting_Revenue'].mean()
-        broadcasting_share = (avg_broadcasting / filtered_df['Total_Revenue'].mean()) * 100
         st.metric(
             label="Avg Broadcasting (£M)",
-            value=f"£{avg_broadcasting:.1f}M",
-            delta=f"{broadcasting_share:.1f}% of Total Revenue"
+            value=f"£{kpis['avg_broadcasting']:.1f}M",
+            delta=f"{kpis['broadcasting_share']:.1f}% of Total Revenue"
         )
     
     with col5:
-        avg_matchday = filtered_df['Matchday_Revenue'].mean()
-        matchday_share = (avg_matchday / filtered_df['Total_Revenue'].mean()) * 100
         st.metric(
             label="Avg Matchday (£M)",
-            value=f"£{avg_matchday:.1f}M",
-            delta=f"{matchday_share:.1f}% of Total Revenue"
+            value=f"£{kpis['avg_matchday']:.1f}M",
+            delta=f"{kpis['matchday_share']:.1f}% of Total Revenue"
         )
+
+@st.fragment(key='pie')
+def render_pie_section():
+    # Picking another team only redraws this chart
+    inputs = st.session_state[SECTION_INPUTS_KEY]
+    league, selected_season, selected_teams = inputs['league'], inputs['season'], inputs['teams']
+    if len(selected_teams) == 0:
+        return
     
-    # Visualizations Section
-    if show_performance:
+    # Revenue breakdown pie chart for selected team
+    selected_team = st.selectbox("Select team for revenue breakdown:", selected_teams)
+    if inputs['show_performance']:
+        title = f"{selected_team} Revenue Breakdown"
+    else:
+        title = f"{selected_team} Revenue Breakdown {selected_season}"
+    with section_profiler('pie') as profiler:
+        with profiler.stage('figure:pie'):
+            # One (Season, Team) index lookup instead of scanning the season frame
+            fig_pie = get_figure_cache().get_or_build(
+                figure_key('pie', selected_season, [selected_team], league=league),
+                lambda: build_revenue_pie(load_league_data(league).team_season_row(selected_season, selected_team), title)
+            )
+        show_chart(fig_pie, 'pie', profiler)
+
+def render_season_charts(profiler):
+    inputs = st.session_state[SECTION_INPUTS_KEY]
+    selected_season, selected_teams, filtered_df = inputs['season'], inputs['teams'], inputs['df']
+    
+    # Figures are memoized process-wide on (chart, season, teams); current-season
+    # charts also key on the standings version so live updates invalidate them
+    figures = get_figure_cache()
+    league, data_version = inputs['league'], inputs['data_version']
+    
+    if inputs['show_performance']:
         st.header("Performance & Financial Analytics")
         
         # Row 1: Points and Revenue comparison
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_points = px.bar(
-                filtered_df, 
-                x='Team', 
-                y='Points',
-                title="Current Season Points"
-            )
-            st.plotly_chart(fig_points, use_container_width=True)
+            with profiler.stage('figure:points'):
+                fig_points = figures.get_or_build(
+                    figure_key('points', selected_season, selected_teams, data_version, league=league),
+                    lambda: build_points_bar(filtered_df)
+                )
+            show_chart(fig_points, 'points', profiler)
         
         with col2:
-            fig_revenue = px.bar(
-                filtered_df, 
-                x='Team', 
-                y='Total_Revenue',
-                title=f"Total Revenue {selected_season} (£M)"
-            )
-            st.plotly_chart(fig_revenue, use_container_width=True)
+            with profiler.stage('figure:revenue'):
+                fig_revenue = figures.get_or_build(
+                    figure_key('revenue', selected_season, selected_teams, data_version, league=league),
+                    lambda: build_revenue_bar(filtered_df, selected_season)
+                )
+            show_chart(fig_revenue, 'revenue', profiler)
         
         # Row 2: Revenue breakdown and correlation
         col1, col2 = st.columns(2)
         
         with col1:
-            # Revenue breakdown pie chart for selected team
-            if len(selected_teams) > 0:
-                selected_team = st.selectbox("Select team for revenue breakdown:", selected_teams)
-                team_data = filtered_df[filtered_df['Team'] == selected_team].iloc[0]
-                
-                revenue_breakdown = {
-                    'Revenue Stream': ['Matchday', 'Broadcasting', 'Commercial'],
-                    'Amount': [team_data['Matchday_Revenue'], 
-                              team_data['Broadcasting_Revenue'], 
-                              team_data['Commercial_Revenue']]
-                }
-                
-                fig_pie = px.pie(
-                    values=revenue_breakdown['Amount'],
-                    names=revenue_breakdown['Revenue Stream'],
-                    title=f"{selected_team} Revenue Breakdown"
-                )
-                st.plotly_chart(fig_pie, use_container_width=True)
+            render_pie_section()
         
         with col2:
             # Points vs Revenue correlation
-            fig_scatter = px.scatter(
-                filtered_df, 
-                x='Total_Revenue', 
-                y='Points',
-                size='Goals_Scored',
-                hover_name='Team',
-                title="Points vs Revenue Correlation",
-                color='Revenue_Growth'
-            )
-            st.plotly_chart(fig_scatter, use_container_width=True)
+            with profiler.stage('figure:scatter'):
+                fig_scatter = figures.get_or_build(
+                    figure_key('scatter', selected_season, selected_teams, data_version, league=league),
+                    lambda: build_points_revenue_scatter(
+                        filtered_df,
+                        fit=season_regression_stats(inputs).line(seasons=[selected_season], teams=selected_teams)
+                    )
+                )
+            show_chart(fig_scatter, 'scatter', profiler)
     else:
         st.header(f"Financial Analytics - {selected_season}")
         
@@ -337,124 +321,191 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            fig_revenue = px.bar(
-                filtered_df, 
-                x='Team', 
-                y='Total_Revenue',
-                title=f"Total Revenue {selected_season} (£M)"
-            )
-            st.plotly_chart(fig_revenue, use_container_width=True)
+            with profiler.stage('figure:revenue'):
+                fig_revenue = figures.get_or_build(
+                    figure_key('revenue', selected_season, selected_teams, league=league),
+                    lambda: build_revenue_bar(filtered_df, selected_season)
+                )
+            show_chart(fig_revenue, 'revenue', profiler)
         
         with col2:
             # Revenue streams comparison
-            revenue_streams = filtered_df.melt(
-                id_vars=['Team'], 
-                value_vars=['Matchday_Revenue', 'Broadcasting_Revenue', 'Commercial_Revenue'],
-                var_name='Revenue_Stream', 
-                value_name='Revenue'
-            )
-            revenue_streams['Revenue_Stream'] = revenue_streams['Revenue_Stream'].str.replace('_Revenue', '')
-            
-            fig_streams = px.bar(
-                revenue_streams,
-                x='Team',
-                y='Revenue',
-                color='Revenue_Stream',
-                title=f"Revenue Streams Breakdown {selected_season}",
-                barmode='stack'
-            )
-            st.plotly_chart(fig_streams, use_container_width=True)
+            with profiler.stage('figure:streams'):
+                fig_streams = figures.get_or_build(
+                    figure_key('streams', selected_season, selected_teams, league=league),
+                    lambda: build_revenue_streams_bar(filtered_df, selected_season)
+                )
+            show_chart(fig_streams, 'streams', profiler)
         
         # Row 2: Revenue breakdown pie chart and growth comparison
         col1, col2 = st.columns(2)
         
         with col1:
-            # Revenue breakdown pie chart for selected team
-            if len(selected_teams) > 0:
-                selected_team = st.selectbox("Select team for revenue breakdown:", selected_teams)
-                team_data = filtered_df[filtered_df['Team'] == selected_team].iloc[0]
-                
-                revenue_breakdown = {
-                    'Revenue Stream': ['Matchday', 'Broadcasting', 'Commercial'],
-                    'Amount': [team_data['Matchday_Revenue'], 
-                              team_data['Broadcasting_Revenue'], 
-                              team_data['Commercial_Revenue']]
-                }
-                
-                fig_pie = px.pie(
-                    values=revenue_breakdown['Amount'],
-                    names=revenue_breakdown['Revenue Stream'],
-                    title=f"{selected_team} Revenue Breakdown {selected_season}"
-                )
-                st.plotly_chart(fig_pie, use_container_width=True)
+            render_pie_section()
         
         with col2:
             # Revenue growth comparison
-            fig_growth = px.bar(
-                filtered_df,
-                x='Team',
-                y='Revenue_Growth',
-                title=f"Revenue Growth {selected_season} (%)",
-                color='Revenue_Growth',
-                color_continuous_scale=['red', 'yellow', 'green']
-            )
-            st.plotly_chart(fig_growth, use_container_width=True)
+            with profiler.stage('figure:growth'):
+                fig_growth = figures.get_or_build(
+                    figure_key('growth', selected_season, selected_teams, league=league),
+                    lambda: build_revenue_growth_bar(filtered_df, selected_season)
+                )
+            show_chart(fig_growth, 'growth', profiler)
+
+@st.fragment(key='trend')
+def render_trend_section():
+    inputs = st.session_state[SECTION_INPUTS_KEY]
+    league, selected_teams = inputs['league'], inputs['teams']
+    dataset = load_league_data(league)
+    seasons = get_league_catalog()[league].seasons
     
     # Historical Revenue Trends
-    st.header("5-Season Revenue Trends (2020-21 to 2024-25)")
-    
-    # Filter historical data for selected teams
-    hist_filtered = historical_df[historical_df['Team'].isin(selected_teams)]
-    
-    fig_line = px.line(
-        hist_filtered, 
-        x='Season', 
-        y='Total_Revenue', 
-        color='Team',
-        title="Revenue Growth Over 5 Seasons (2020-21 to 2024-25)",
-        markers=True
-    )
-    fig_line.update_layout(height=500)
-    st.plotly_chart(fig_line, use_container_width=True)
-    
-    # Add a comparison table
-    st.subheader("Season-over-Season Revenue Comparison")
-    
-    # Create a pivot table for easy comparison
-    revenue_pivot = hist_filtered.pivot(index='Team', columns='Season', values='Total_Revenue')
-    revenue_pivot = revenue_pivot.round(1)
-    
-    # Calculate year-over-year growth
-    for i in range(1, len(revenue_pivot.columns)):
-        prev_season = revenue_pivot.columns[i-1]
-        curr_season = revenue_pivot.columns[i]
-        growth_col = f'{curr_season} Growth %'
-        revenue_pivot[growth_col] = ((revenue_pivot[curr_season] - revenue_pivot[prev_season]) / revenue_pivot[prev_season] * 100).round(1)
-    
-    st.dataframe(revenue_pivot, use_container_width=True)
-    
-    # Risk & Insights Section
-    st.header("Business Intelligence & Risk Analysis")
-    
-    # Calculate Financial Efficiency Index (FEI) - works for all seasons
-    # Financial Efficiency Index Formula:
-    # FEI = (Revenue_Growth_Factor * Commercial_Diversification * Revenue_Stability) / (Revenue_Risk_Factor)
-    # Where:
-    # - Revenue_Growth_Factor: (Revenue_Growth + 10) / 10 (normalized, minimum 0.5 for negative growth)
-    # - Commercial_Diversification: Commercial_Revenue / Total_Revenue (higher = better diversification)
-    # - Revenue_Stability: 1 + (Matchday_Revenue / Total_Revenue) (rewards balanced revenue streams)
-    # - Revenue_Risk_Factor: Total_Revenue / 500 (normalizes for revenue scale, target £500M)
-    
-    def calculate_financial_efficiency_index(row):
-        revenue_growth_factor = max(0.5, (row['Revenue_Growth'] + 10) / 10)
-        commercial_diversification = row['Commercial_Revenue'] / row['Total_Revenue']
-        revenue_stability = 1 + (row['Matchday_Revenue'] / row['Total_Revenue'])
-        revenue_risk_factor = max(0.5, row['Total_Revenue'] / 500)
+    st.header(f"{len(seasons)}-Season Revenue Trends ({seasons[0]} to {seasons[-1]})")
+    
+    with section_profiler('trend') as profiler:
+        # Filter historical data for selected teams
+        # The trend only depends on the team selection, not the season
+        with profiler.stage('figure:trend'):
+            hist_filtered = dataset.team_history(selected_teams)
+            fig_line = get_figure_cache().get_or_build(
+                figure_key('trend', None, selected_teams, league=league),
+                lambda: build_revenue_trend_line(to_presentation(hist_filtered))
+            )
+        show_chart(fig_line, 'trend', profiler)
         
-        fei = (revenue_growth_factor * commercial_diversification * revenue_stability) / revenue_risk_factor
-        return round(fei, 3)
-    
-    filtered_df['FEI'] = filtered_df.apply(calculate_financial_efficiency_index, axis=1)
+        # Add a comparison table
+        st.subheader("Season-over-Season Revenue Comparison")
+        
+        # Create a pivot table for easy comparison
+        # Year-over-year growth for every season in one shifted-array pass
+        with profiler.stage('revenue_pivot'):
+            revenue_pivot = season_comparison(hist_filtered)
+        
+        st.dataframe(revenue_pivot, use_container_width=True)
+
+@st.fragment(key='growth_detail')
+def render_growth_section():
+    # Switching the stream only reruns this expander
+    inputs = st.session_state[SECTION_INPUTS_KEY]
+    dataset = load_league_data(inputs['league'])
+    
+    # CAGR, rolling averages and per-stream growth
+    with st.expander("Growth Detail by Revenue Stream"), section_profiler('growth_detail') as profiler:
+        with profiler.stage('growth_analytics'):
+            growth = GrowthAnalytics.from_frame(dataset.team_financials(inputs['teams']))
+        st.write("**Compound annual growth rate (%)**, first to last season")
+        st.dataframe(growth.cagr.round(1), use_container_width=True)
+        selected_stream = st.selectbox(
+            "Revenue stream:",
+            options=STREAM_COLUMNS,
+            format_func=lambda stream: stream.replace('_', ' ')
+        )
+        _, stream_yoy, stream_rolling = growth.stream(selected_stream)
+        st.write("**Year-over-year growth (%)**")
+        st.dataframe(stream_yoy.round(1), use_container_width=True)
+        st.write(f"**Rolling {growth.window}-season average (£M)**")
+        st.dataframe(stream_rolling.round(1), use_container_width=True)
+
+@st.fragment(key='form')
+def render_form_section():
+    # Changing a window only reruns this expander
+    inputs = st.session_state[SECTION_INPUTS_KEY]
+    league, selected_teams = inputs['league'], inputs['teams']
+    live_snapshot = live_snapshot_for(league)
+    
+    with st.expander("Recent Form vs Revenue"), section_profiler('form') as profiler:
+        if live_snapshot is None or live_snapshot.form is None or not live_snapshot.form.teams:
+            st.caption("Match-by-match form needs the live results feed; it appears once live standings have loaded.")
+            return
+        col1, col2 = st.columns(2)
+        with col1:
+            form_window = st.slider("Form window (matches)", 3, 10, DEFAULT_FORM_WINDOW)
+        with col2:
+            revenue_window = st.slider("Revenue window (seasons)", 1, 5, DEFAULT_REVENUE_WINDOW)
+        
+        # Windows are read from running prefix sums: no recomputation over the season
+        with profiler.stage('form'):
+            form_df = form_vs_revenue(live_snapshot.form, load_rolling_revenue(league), selected_teams, form_window, revenue_window)
+            form_history = live_snapshot.form.history(form_df['Team'].tolist(), form_window)
+        if form_df.empty:
+            st.caption("No live results for the selected teams yet.")
+            return
+        
+        figures = get_figure_cache()
+        col1, col2 = st.columns(2)
+        with col1:
+            with profiler.stage('figure:form'):
+                fig_form = figures.get_or_build(
+                    figure_key('form', None, selected_teams, live_snapshot.fetched_at, form_window, revenue_window,
+                               league=league),
+                    lambda: build_form_revenue_scatter(form_df, form_window, revenue_window)
+                )
+            show_chart(fig_form, 'form', profiler)
+        with col2:
+            with profiler.stage('figure:form_trend'):
+                fig_form_trend = figures.get_or_build(
+                    figure_key('form_trend', None, selected_teams, live_snapshot.fetched_at, form_window, league=league),
+                    lambda: build_form_trend(form_history, form_window)
+                )
+            show_chart(fig_form_trend, 'form_trend', profiler)
+        st.dataframe(form_df.round(2), hide_index=True, use_container_width=True)
+
+@st.fragment(key='regression')
+def render_regression_section():
+    # Moving the season range only reruns this expander
+    inputs = st.session_state[SECTION_INPUTS_KEY]
+    stats = season_regression_stats(inputs)
+    seasons = stats.seasons()
+    
+    with st.expander("Points vs Revenue Regression"), section_profiler('regression') as profiler:
+        if not seasons:
+            st.caption("No season with standings to fit.")
+            return
+        if len(seasons) > 1:
+            first, last = st.select_slider("Season range:", options=seasons, value=(seasons[0], seasons[-1]))
+            seasons = seasons[seasons.index(first):seasons.index(last) + 1]
+        st.write(f"**{stats.metric} vs each revenue stream** (OLS and Spearman rank correlation), selected teams")
+        
+        # Combined from cached per-season moments: no refit over the data rows
+        with profiler.stage('regression'):
+            fits = stats.fits_by_season(seasons, inputs['teams'])
+        st.dataframe(fits.round(3), hide_index=True, use_container_width=True)
+
+@st.fragment(key='leagues')
+def render_league_section():
+    # Changing the compared leagues only reruns this expander
+    inputs = st.session_state[SECTION_INPUTS_KEY]
+    catalog = get_league_catalog()
+    selected_season = inputs['season']
+    
+    with st.expander("League Comparison"), section_profiler('leagues') as profiler:
+        leagues = st.multiselect(
+            "Leagues:",
+            options=catalog.keys(),
+            default=catalog.keys(),
+            format_func=lambda key: catalog[key].label
+        )
+        missing = [catalog[key].label for key in leagues if selected_season not in catalog[key].seasons]
+        if missing:
+            st.caption(f"No {selected_season} data for: {', '.join(missing)}")
+        
+        # Only the season's revenue columns are read, one shard at a time
+        with profiler.stage('league_comparison'):
+            comparison = load_league_comparison(selected_season, tuple(leagues))
+        if comparison.empty:
+            return
+        with profiler.stage('figure:leagues'):
+            fig_leagues = get_figure_cache().get_or_build(
+                figure_key('leagues', selected_season, leagues),
+                lambda: build_league_comparison_bar(comparison, selected_season)
+            )
+        show_chart(fig_leagues, 'leagues', profiler)
+        st.dataframe(comparison.round(1), hide_index=True, use_container_width=True)
+
+@st.fragment(key='fei')
+def render_fei_section():
+    inputs = st.session_state[SECTION_INPUTS_KEY]
+    selected_season, selected_teams, filtered_df = inputs['season'], inputs['teams'], inputs['df']
     
     # Display FEI scores
     st.subheader("Financial Efficiency Index (FEI)")
@@ -465,138 +516,142 @@ def main():
     st.write("- **Revenue Risk Factor**: Total Revenue ÷ £500M (normalization)")
     st.write("- **Higher FEI = Better financial efficiency and diversification**")
     
-    # Create FEI visualization
-    fig_fei = px.bar(
-        filtered_df.sort_values('FEI', ascending=False),
-        x='Team',
-        y='FEI',
-        title=f"Financial Efficiency Index by Team - {selected_season}",
-        color='FEI',
-        color_continuous_scale=['red', 'yellow', 'green']
-    )
-    fig_fei.update_layout(height=400)
-    st.plotly_chart(fig_fei, use_container_width=True)
-    
-    # FEI Analysis Table
-    fei_columns = ['Team', 'Total_Revenue', 'Revenue_Growth', 'Commercial_Revenue', 'Matchday_Revenue', 'FEI']
-    if show_performance:
-        fei_columns.insert(-1, 'Points')  # Add points for current season
-    
-    fei_analysis = filtered_df[fei_columns].copy()
-    fei_analysis['Commercial_Share%'] = ((fei_analysis['Commercial_Revenue'] / fei_analysis['Total_Revenue']) * 100).round(1)
-    fei_analysis['Matchday_Share%'] = ((fei_analysis['Matchday_Revenue'] / fei_analysis['Total_Revenue']) * 100).round(1)
-    fei_analysis = fei_analysis.sort_values('FEI', ascending=False)
-    
-    display_columns = ['Team', 'Total_Revenue', 'Revenue_Growth', 'Commercial_Share%', 'Matchday_Share%', 'FEI']
-    if show_performance:
-        display_columns.insert(-1, 'Points')
-    
-    st.dataframe(fei_analysis[display_columns], use_container_width=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("Risk Indicators")
+    with section_profiler('fei') as profiler:
+        # Create FEI visualization
+        with profiler.stage('figure:fei'):
+            fig_fei = get_figure_cache().get_or_build(
+                figure_key('fei', selected_season, selected_teams, league=inputs['league']),
+                lambda: build_fei_bar(filtered_df, selected_season)
+            )
+        show_chart(fig_fei, 'fei', profiler)
         
-        # Teams with declining revenue
-        declining_revenue = filtered_df[filtered_df['Revenue_Growth'] < 0]
-        if not declining_revenue.empty:
-            for _, team in declining_revenue.iterrows():
-                st.warning(f"**{team['Team']}**: Revenue declining by {abs(team['Revenue_Growth']):.1f}% | FEI: {team['FEI']:.3f}")
+        # FEI Analysis Table
+        with profiler.stage('fei_table'):
+            fei_analysis = fei_table(filtered_df, inputs['show_performance'])
+        st.dataframe(fei_analysis, use_container_width=True)
+
+@st.cache_data(max_entries=32)
+def run_simulation(df, revenue_target, spec, n_scenarios):
+    """
+    Memoized what-if run per (selection, shock sizes, scenario count)
+    """
+    return simulate(df, revenue_target, spec=spec, n_scenarios=n_scenarios)
+
+@st.fragment(key='simulation')
+def render_simulation_section():
+    # Moving a slider reruns only the simulator
+    inputs = st.session_state[SECTION_INPUTS_KEY]
+    selected_season, filtered_df = inputs['season'], inputs['df']
+    revenue_target = inputs['kpis']['target']['revenue_target']
+    
+    with st.expander("What-if Scenario Simulator"), section_profiler('simulation') as profiler:
+        st.write("Monte Carlo runs perturbing each club's revenue streams and growth; FEI uses the formula above.")
+        col1, col2, col3, col4, col5 = st.columns(5)
+        with col1:
+            matchday_sigma = st.slider("Matchday shock (±%)", 0, 50, 10)
+        with col2:
+            broadcasting_sigma = st.slider("Broadcasting shock (±%)", 0, 50, 5)
+        with col3:
+            commercial_sigma = st.slider("Commercial shock (±%)", 0, 50, 8)
+        with col4:
+            growth_sigma = st.slider("Growth shock (± pts)", 0.0, 10.0, 2.0, step=0.5)
+        with col5:
+            n_scenarios = st.selectbox("Scenarios:", options=[10_000, 100_000, 250_000], index=1,
+                                       format_func=lambda n: f"{n:,}")
+        spec = ScenarioSpec(matchday_sigma / 100, broadcasting_sigma / 100, commercial_sigma / 100, growth_sigma)
         
-        # Revenue diversification risk (over-reliance on one stream)
-        for _, team in filtered_df.iterrows():
-            commercial_share = team['Commercial_Revenue'] / team['Total_Revenue']
-            broadcasting_share = team['Broadcasting_Revenue'] / team['Total_Revenue']
-            matchday_share = team['Matchday_Revenue'] / team['Total_Revenue']
-            
-            if broadcasting_share > 0.6:
-                st.error(f"**{team['Team']}**: Over-reliant on broadcasting ({broadcasting_share*100:.1f}% of revenue)")
-            elif commercial_share < 0.25:
-                st.info(f"**{team['Team']}**: Low commercial diversification ({commercial_share*100:.1f}% of revenue)")
+        with profiler.stage('simulation'):
+            result = run_simulation(filtered_df[SIMULATION_COLUMNS], revenue_target, spec, n_scenarios)
         
-        # Financial efficiency analysis (works for all seasons)
-        low_fei_teams = filtered_df[filtered_df['FEI'] < filtered_df['FEI'].median()]
-        if not low_fei_teams.empty:
-            for _, team in low_fei_teams.iterrows():
-                st.error(f"**{team['Team']}**: Below-average financial efficiency (FEI: {team['FEI']:.3f} vs avg: {filtered_df['FEI'].mean():.3f})")
+        st.metric(
+            label=f"P(Total Revenue ≥ £{revenue_target:,}M {selected_season} Target)",
+            value=f"{result.target_probability:.1%}",
+            delta=f"median £{result.total_revenue_bands['p50']:.1f}M"
+        )
+        with profiler.stage('figure:fei_bands'):
+            fig_bands = build_fei_bands(result, selected_season)
+        show_chart(fig_bands, 'fei_bands', profiler)
         
-        # Additional financial risk analysis
-        for _, team in filtered_df.iterrows():
-            # High revenue but poor efficiency
-            if team['Total_Revenue'] > 600 and team['FEI'] < 0.5:
-                st.warning(f"**{team['Team']}**: High revenue (£{team['Total_Revenue']:.1f}M) but poor financial efficiency (FEI: {team['FEI']:.3f})")
-            
-            # Low growth with high revenue
-            if team['Total_Revenue'] > 500 and team['Revenue_Growth'] < 2:
-                st.info(f"**{team['Team']}**: Large revenue base (£{team['Total_Revenue']:.1f}M) with low growth ({team['Revenue_Growth']:.1f}%) - focus on innovation")
+        st.write("**FEI rank stability** (probability of keeping the observed rank) and sensitivity to a +10% shift")
+        stability = result.fei_bands[['Observed', 'Observed_Rank']].assign(
+            Rank_Stability=result.rank_stability.round(3)
+        )
+        st.dataframe(stability.join(fei_sensitivity(filtered_df)), use_container_width=True)
+
+@st.fragment(key='risk')
+def render_risk_section():
+    inputs = st.session_state[SECTION_INPUTS_KEY]
+    filtered_df = inputs['df']
     
-    with col2:
-        st.subheader("Strategic Recommendations")
-        
-        # Data-driven recommendations based on FEI analysis (works for all seasons)
-        avg_fei = filtered_df['FEI'].mean()
-        avg_commercial_share = (filtered_df['Commercial_Revenue'] / filtered_df['Total_Revenue']).mean()
-        avg_revenue_growth = filtered_df['Revenue_Growth'].mean()
-        avg_matchday_share = (filtered_df['Matchday_Revenue'] / filtered_df['Total_Revenue']).mean()
-        
-        recommendations = []
-        
-        # FEI-based recommendations
-        if avg_fei < 0.6:
-            recommendations.append(f"**Financial Optimization**: Average FEI ({avg_fei:.3f}) below target 0.600 - improve revenue diversification and growth")
-        
-        # Commercial diversification recommendations
-        if avg_commercial_share < 0.35:
-            recommendations.append(f"**Commercial Expansion**: Current commercial share ({avg_commercial_share*100:.1f}%) below optimal 35%+ - focus on sponsorship and partnerships")
-        
-        # Revenue growth recommendations
-        if avg_revenue_growth < 5:
-            recommendations.append(f"**Growth Strategy**: Revenue growth ({avg_revenue_growth:.1f}%) below industry target of 5%+ - diversify revenue streams")
-        
-        # Matchday revenue optimization
-        if avg_matchday_share < 0.15:
-            recommendations.append(f"**Matchday Enhancement**: Current matchday share ({avg_matchday_share*100:.1f}%) below optimal 15%+ - improve stadium experience")
-        
-        # Team-specific recommendations
-        low_fei_team = filtered_df.loc[filtered_df['FEI'].idxmin()]
-        recommendations.append(f"**Priority Focus**: {low_fei_team['Team']} (FEI: {low_fei_team['FEI']:.3f}) needs immediate financial efficiency improvements")
-        
-        # Standard recommendations based on season
-        if show_performance:
-            recommendations.extend([
-                "**FEI Target**: Maintain FEI above 0.600 for sustainable financial efficiency",
-                "**Revenue Balance**: Optimal split - 45% Broadcasting, 35% Commercial, 20% Matchday",
-                "**Performance Alignment**: Balance on-field investment with revenue diversification"
-            ])
-        else:
-            recommendations.extend([
-                f"**FEI Target**: Maintain FEI above 0.600 for financial sustainability",
-                "**Revenue Diversification**: Reduce dependence on single revenue streams",
-                "**Growth Focus**: Target 5-8% annual revenue growth through strategic initiatives"
-            ])
+    col1, col2 = st.columns(2)
+    
+    with section_profiler('risk') as profiler:
+        with col1:
+            st.subheader("Risk Indicators")
+            
+            # Every rule is evaluated as a vectorized mask in one pass (see plfinance/risk.py)
+            with profiler.stage('risk_indicators'):
+                alerts = evaluate_risk_rules(filtered_df)
+                for level, message in zip(alerts['Level'], alerts['Message']):
+                    getattr(st, level)(message)
         
-        for i, rec in enumerate(recommendations, 1):
-            if i <= len(recommendations):
-                st.info(f"{i}. {rec}")
+        with col2:
+            st.subheader("Strategic Recommendations")
+            
+            # Data-driven recommendations based on FEI analysis (works for all seasons)
+            with profiler.stage('recommendations'):
+                recommendations = strategic_recommendations(filtered_df, inputs['show_performance'])
+                for i, rec in enumerate(recommendations, 1):
+                    st.info(f"{i}. {rec}")
+
+@st.fragment(key='export')
+def render_export_section():
+    # Changing the export format only reruns this section
+    inputs = st.session_state[SECTION_INPUTS_KEY]
+    selected_teams, filtered_df, kpis = inputs['teams'], inputs['df'], inputs['kpis']
     
-    # Download Section
     st.header("Data Export Options")
     
     col1, col2, col3 = st.columns(3)
     
-    with col1:
+    with col1, section_profiler('export') as profiler:
         st.subheader("Download Data")
-        csv_link = create_download_link(filtered_df, "premier_league_analytics.csv", "Download CSV Report")
-        st.markdown(csv_link, unsafe_allow_html=True)
+        with profiler.stage('export'):
+            export_format = st.selectbox(
+                "Export format:",
+                options=list(EXPORT_FORMATS),
+                format_func=lambda fmt: EXPORT_FORMATS[fmt].label
+            )
+            # The file is only generated when the button is clicked
+            export_df = filtered_df.copy()
+            st.download_button(
+                label=f"Download {EXPORT_FORMATS[export_format].label} Report",
+                data=lambda: export_bytes(export_df, export_format),
+                file_name=export_file_name(f"{inputs['league'].replace('-', '_')}_analytics", export_format),
+                mime=EXPORT_FORMATS[export_format].mime
+            )
+            
+            # KPIs, FEI, alerts, recommendations and every chart in one document
+            report_format = st.selectbox(
+                "Report format:",
+                options=available_report_formats(),
+                format_func=lambda fmt: REPORT_FORMATS[fmt].label
+            )
+            league, selected_season = inputs['league'], inputs['season']
+            st.download_button(
+                label=f"Download {REPORT_FORMATS[report_format].label} Report",
+                data=lambda: build_report_document(league, selected_season, selected_teams, report_format),
+                file_name=report_file_name(selected_season, report_format),
+                mime=REPORT_FORMATS[report_format].mime
+            )
     
     with col2:
         st.subheader("Quick Stats")
         st.write(f"**Teams Analyzed**: {len(selected_teams)}")
-        st.write(f"**Total Revenue**: £{filtered_df['Total_Revenue'].sum():.1f}M")
-        st.write(f"**Average Revenue Growth**: {filtered_df['Revenue_Growth'].mean():.1f}%")
+        st.write(f"**Total Revenue**: £{kpis['total_revenue']:.1f}M")
+        st.write(f"**Average Revenue Growth**: {kpis['avg_growth']:.1f}%")
         
-        if show_performance:
+        if inputs['show_performance']:
             st.write(f"**Average Points**: {filtered_df['Points'].mean():.1f}")
             st.write(f"**Top Performer**: {filtered_df.loc[filtered_df['Points'].idxmax(), 'Team']}")
         else:
@@ -611,5 +666,142 @@ def main():
         st.write("- **Historical**: 5-year revenue trends analysis")
         st.write("- **Updated**: Live data integration")
 
+def render_dashboard(profiler):
+    # Sidebar filters
+    st.sidebar.header("Dashboard Filters")
+    
+    # League filter; options, seasons and teams come from the metadata index, not from loaded frames
+    catalog = get_league_catalog()
+    league_key = catalog.keys()[0]
+    if len(catalog) > 1:
+        league_key = st.sidebar.selectbox(
+            "League:",
+            options=catalog.keys(),
+            format_func=lambda key: catalog[key].label,
+            help="Each league is loaded from its own shard when selected"
+        )
+    league = catalog[league_key]
+    
+    # Load data
+    with profiler.stage('data_load'):
+        dataset = load_league_data(league_key)
+    
+    # Check for live data (never waits on the network)
+    with profiler.stage('live_standings'):
+        live_snapshot = live_snapshot_for(league_key)
+        live_data_available = live_snapshot is not None and not live_snapshot.standings.empty
+    
+    # Season filter
+    available_seasons = league.seasons
+    # Default to the season with standings (the latest one for the bundled data)
+    default_season = league.current_season if league.current_season in available_seasons else available_seasons[-1]
+    selected_season = st.sidebar.selectbox(
+        "Select Season:",
+        options=available_seasons,
+        index=available_seasons.index(default_season),
+        help="Choose season for financial analysis"
+    )
+    
+    # Title and description
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.title("Premier League Performance & Financial Analytics Dashboard")
+        st.subheader(f"Business Intelligence Dashboard for {league.title} - {selected_season} Season")
+    with col2:
+        st.markdown("")
+        st.markdown("")
+        st.markdown("<div style='text-align: right; color: #666; font-style: italic;'>Made with ❤️ by Mayank Kumar</div>", unsafe_allow_html=True)
+    
+    # Team filter: the clubs of the selected season (divisions change with promotion and relegation)
+    season_teams = league.season_teams(selected_season)
+    selected_teams = st.sidebar.multiselect(
+        "Select Teams:",
+        options=season_teams,
+        default=season_teams,
+        help="Choose teams to analyze"
+    )
+    
+    # Get season-specific financial data
+    with profiler.stage('filtering'):
+        # For the current season (2024-25 in the sample), add performance data; for others, use only financial data
+        # Live standings replace the static table once the background fetch has succeeded
+        standings = live_snapshot.standings if live_data_available else None
+        filtered_df, show_performance = season_view(dataset, selected_season, selected_teams, standings)
+    
+    profiler.annotate(league=league_key, season=selected_season, teams=len(selected_teams))
+    
+    # Data freshness indicator
+    if live_data_available:
+        st.sidebar.success("Live data active")
+    else:
+        st.sidebar.info("Using static data")
+    
+    st.sidebar.write("**Last Updated:** " + datetime.now().strftime("%Y-%m-%d %H:%M"))
+    
+    # Check if filtered data is empty
+    if filtered_df.empty:
+        st.warning("Please select at least one team to view analytics.")
+        return
+    
+    # KPIs are combined from the per-(season, team) partials built at load time
+    with profiler.stage('kpis'):
+        kpis = load_kpi_aggregates(league_key).compute(selected_season, filtered_df['Team'].tolist())
+    
+    # Calculate Financial Efficiency Index (FEI) - works for all seasons
+    # Scored column-wise in one pass, see plfinance/fei.py for the formula
+    with profiler.stage('fei'):
+        filtered_df['FEI'] = calculate_fei(filtered_df)
+    
+    st.session_state[SECTION_INPUTS_KEY] = {
+        'league': league_key,
+        'season': selected_season,
+        'teams': selected_teams,
+        'df': filtered_df,
+        'show_performance': show_performance,
+        'kpis': kpis,
+        'data_version': live_snapshot.fetched_at if live_data_available and show_performance else 'static'
+    }
+    
+    # Each section below is a fragment: a widget inside it reruns only that section
+    render_kpi_section()
+    
+    # Visualizations Section
+    render_season_charts(profiler)
+    
+    render_trend_section()
+    render_growth_section()
+    render_form_section()
+    render_regression_section()
+    if len(catalog) > 1:
+        render_league_section()
+    
+    # Risk & Insights Section
+    st.header("Business Intelligence & Risk Analysis")
+    render_fei_section()
+    render_simulation_section()
+    render_risk_section()
+    
+    # Download Section
+    render_export_section()
+
+def main():
+    # Page configuration (on run, not on import)
+    st.set_page_config(
+        page_title="Premier League Analytics Dashboard",
+        page_icon="⚽",
+        layout="wide"
+    )
+    
+    # Stage timing is opt-in (PL_PROFILE=1 or ?profile=1); otherwise every stage is a no-op
+    profiler = RunProfiler(profiling_enabled(st.query_params), stats=get_stage_stats())
+    st.session_state[ACTIVE_PROFILER_KEY] = profiler
+    try:
+        render_dashboard(profiler)
+    finally:
+        st.session_state[ACTIVE_PROFILER_KEY] = None
+        profiler.finish()
+    if profiler.enabled:
+        render_profile_panel(profiler)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
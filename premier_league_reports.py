@@ -0,0 +1,238 @@
+"""
+Headless report packs: KPI tables, FEI, risk alerts, recommendations and figures
+
+Runs the dashboard's data loading, KPI, FEI and risk logic without the
+Streamlit runtime, fanning every (season, team subset) combination of one
+league out over a process pool. Each worker loads that league's shard once
+(memory-mapped when PL_DATA_DIR points at a Parquet dataset) and writes one
+report directory:
+
+    <output>/<season>/<subset>/kpis.json
+    <output>/<season>/<subset>/fei.csv
+    <output>/<season>/<subset>/alerts.csv
+    <output>/<season>/<subset>/recommendations.txt
+    <output>/<season>/<subset>/figures/<chart>.html|.png|.svg
+    <output>/<season>/<subset>/report.html|.pdf      (with --document)
+
+plus ``<output>/manifest.json`` listing every report (and one shared
+``plotly.min.js`` for the HTML figures). ``--document`` adds everything in
+one file (plfinance/report.py). Current-season reports use the static
+standings table, so packs are reproducible. Static images (png/svg,
+html-static, pdf) need the optional ``kaleido`` package; PDF also needs
+``weasyprint``.
+
+Run with: python premier_league_reports.py reports/ [--league premier-league] [--seasons 2023-24 2024-25]
+                                           [--subsets all each] [--workers 4] [--document html]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from plfinance.cache import get_cache
+from plfinance.dataset import cached_dataset
+from plfinance.kpi import KPIAggregates
+from plfinance.leagues import DEFAULT_LEAGUE, get_catalog
+from plfinance.report import REPORT_FORMATS, ReportExporter, pdf_export_available, report_content, static_export_available
+
+FIGURE_FORMATS = ['html', 'png', 'svg', 'none']
+DOCUMENT_FORMATS = ['none', *REPORT_FORMATS]
+PLOTLY_BUNDLE = 'plotly.min.js'
+
+# Per-process state, filled once by the pool initializer
+_worker = {}
+
+
+def subset_slug(teams, all_teams):
+    """
+    Directory name for a team subset: 'all', a single team, or teams joined with '+'
+    """
+    if sorted(teams) == sorted(all_teams):
+        return 'all'
+    return '+'.join(re.sub(r'[^a-z0-9]+', '-', team.lower()).strip('-') for team in teams)
+
+
+def expand_subsets(specs, all_teams):
+    """
+    Team subsets from CLI specs: 'all', 'each' (one subset per club) or comma-separated team lists
+    """
+    subsets = []
+    for spec in specs:
+        if spec == 'all':
+            subsets.append(list(all_teams))
+        elif spec == 'each':
+            subsets.extend([team] for team in all_teams)
+        else:
+            teams = [team.strip() for team in spec.split(',') if team.strip()]
+            unknown = sorted(set(teams) - set(all_teams))
+            if unknown:
+                raise ValueError(f"Unknown teams in subset {spec!r}: {', '.join(unknown)}")
+            subsets.append(teams)
+
+    # Keep the first occurrence of each subset
+    seen, unique = set(), []
+    for teams in subsets:
+        if frozenset(teams) not in seen:
+            seen.add(frozenset(teams))
+            unique.append(teams)
+    return unique
+
+
+def init_worker(data_dir, league):
+    """
+    Load the league's dataset and KPI partials once per worker process
+    """
+    catalog = get_catalog(data_dir)
+    # Workers on one host share a single load through the disk cache when PL_CACHE_DIR is set
+    dataset = cached_dataset(get_cache(), catalog.source(league))
+    _worker['dataset'] = dataset
+    _worker['league'] = league
+    _worker['clubs'] = catalog[league].clubs
+    _worker['kpis'] = KPIAggregates.from_frame(dataset.financial, targets=catalog[league].targets)
+    # Reports already run in parallel, so each worker renders its document's charts in-process
+    _worker['exporter'] = ReportExporter(cache=get_cache(), workers=0)
+
+
+def write_figures(figures, figure_dir, figure_format):
+    os.makedirs(figure_dir, exist_ok=True)
+    paths = []
+    for name, fig in figures.items():
+        file_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', name) + f'.{figure_format}'
+        path = os.path.join(figure_dir, file_name)
+        if figure_format == 'html':
+            # Every page references the one bundle at the output root (<root>/<season>/<subset>/figures/)
+            fig.write_html(path, include_plotlyjs=f'../../../{PLOTLY_BUNDLE}')
+        else:
+            fig.write_image(path)
+        paths.append(path)
+    return paths
+
+
+def build_report(season, teams, output_dir, figure_format, document='none'):
+    """
+    Write one (season, team subset) report directory and return its manifest entry
+    """
+    start = time.perf_counter()
+    dataset = _worker['dataset']
+    subset = subset_slug(teams, _worker['clubs'])
+    report_dir = os.path.join(output_dir, season, subset)
+    os.makedirs(report_dir, exist_ok=True)
+
+    entry = {'season': season, 'subset': subset, 'teams': list(teams), 'path': report_dir}
+    content = report_content(
+        dataset, season, teams, _worker['kpis'], with_figures=figure_format != 'none' or document != 'none',
+        league=_worker['league']
+    )
+    if content is None:
+        entry.update(status='empty', seconds=round(time.perf_counter() - start, 3))
+        return entry
+
+    with open(os.path.join(report_dir, 'kpis.json'), 'w') as f:
+        json.dump({'season': season, 'teams': list(teams), **content.kpis}, f, indent=2, default=float)
+
+    content.fei.to_csv(os.path.join(report_dir, 'fei.csv'), index=False)
+
+    alerts = content.alerts
+    alerts.drop(columns='Row').to_csv(os.path.join(report_dir, 'alerts.csv'), index=False)
+
+    with open(os.path.join(report_dir, 'recommendations.txt'), 'w') as f:
+        f.writelines(f"{i}. {rec}\n" for i, rec in enumerate(content.recommendations, 1))
+
+    figure_paths = []
+    if figure_format != 'none':
+        figure_paths = write_figures(content.figures, os.path.join(report_dir, 'figures'), figure_format)
+
+    if document != 'none':
+        document_path = os.path.join(report_dir, 'report' + REPORT_FORMATS[document].extension)
+        with open(document_path, 'wb') as f:
+            f.write(_worker['exporter'].export(content, document))
+        entry['document'] = document_path
+
+    entry.update(
+        status='ok',
+        alerts=len(alerts),
+        figures=len(figure_paths),
+        seconds=round(time.perf_counter() - start, 3)
+    )
+    return entry
+
+
+def _run_task(task):
+    return build_report(*task)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('output_dir')
+    parser.add_argument('--data-dir', default=None, help="Parquet dataset root (default: PL_DATA_DIR or the sample data)")
+    parser.add_argument('--league', default=DEFAULT_LEAGUE, help="League key in the dataset's league index")
+    parser.add_argument('--seasons', nargs='+', default=None, help="Seasons to report (default: all)")
+    parser.add_argument('--subsets', nargs='+', default=['all', 'each'],
+                        help="'all', 'each' (one report per club) or comma-separated team lists")
+    parser.add_argument('--figures', choices=FIGURE_FORMATS, default='html')
+    parser.add_argument('--document', choices=DOCUMENT_FORMATS, default='none',
+                        help="Also write the whole report as one HTML or PDF file")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    if args.figures in ('png', 'svg'):
+        try:
+            import kaleido  # noqa: F401
+        except ImportError:
+            parser.error(f"--figures {args.figures} needs the kaleido package (pip install kaleido)")
+    if args.document == 'html-static' and not static_export_available():
+        parser.error("--document html-static needs the kaleido package (pip install kaleido)")
+    if args.document == 'pdf' and not pdf_export_available():
+        parser.error("--document pdf needs the kaleido and weasyprint packages (pip install kaleido weasyprint)")
+
+    # The parent only needs the team and season lists, which come from the league index
+    catalog = get_catalog(args.data_dir)
+    if args.league not in catalog:
+        parser.error(f"unknown league {args.league!r}; available: {', '.join(catalog.keys())}")
+    league = catalog[args.league]
+    seasons = args.seasons or league.seasons
+    unknown = sorted(set(seasons) - set(league.seasons))
+    if unknown:
+        parser.error(f"unknown seasons: {', '.join(unknown)}")
+    try:
+        subsets = expand_subsets(args.subsets, league.clubs)
+    except ValueError as e:
+        parser.error(str(e))
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    if args.figures == 'html':
+        from plotly.offline import get_plotlyjs
+
+        with open(os.path.join(args.output_dir, PLOTLY_BUNDLE), 'w') as f:
+            f.write(get_plotlyjs())
+
+    tasks = [(season, teams, args.output_dir, args.figures, args.document) for season in seasons for teams in subsets]
+    start = time.perf_counter()
+    entries = []
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker, initargs=(args.data_dir, args.league)) as pool:
+        futures = [pool.submit(_run_task, task) for task in tasks]
+        for future in as_completed(futures):
+            entry = future.result()
+            entries.append(entry)
+            print(f"{entry['season']} {entry['subset']}: {entry['status']} ({entry['seconds']:.2f}s)", file=sys.stderr)
+
+    entries.sort(key=lambda entry: (entry['season'], entry['subset']))
+    manifest = {
+        'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'league': args.league,
+        'workers': args.workers,
+        'figures': args.figures,
+        'document': args.document,
+        'seconds': round(time.perf_counter() - start, 3),
+        'reports': entries
+    }
+    with open(os.path.join(args.output_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Wrote {len(entries)} reports to {args.output_dir} in {manifest['seconds']:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
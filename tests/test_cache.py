@@ -0,0 +1,61 @@
+import time
+
+from plfinance import cache as cache_module
+from plfinance.cache import DiskCache, MemoryCache
+from plfinance.report import REPORT_CACHE_BYTES, ReportExporter
+
+
+def test_memory_cache_is_unbounded_by_default():
+    cache = MemoryCache()
+    for i in range(100):
+        cache.set(f'k{i}', b'x' * 10_000)
+    assert all(cache.get(f'k{i}') is not None for i in range(100))
+    assert cache.evictions == 0
+
+
+def test_bounded_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_bytes=35_000)
+    for key in ('a', 'b', 'c'):
+        cache.set(key, b'x' * 10_000)
+    cache.get('a')
+    cache.set('d', b'x' * 10_000)
+    assert cache.get('b') is None
+    assert all(cache.get(key) is not None for key in ('a', 'c', 'd'))
+    assert cache.current_bytes <= cache.max_bytes
+    assert cache.evictions == 1
+
+    # Replacing a key keeps the size bookkeeping exact
+    cache.set('a', b'y' * 100)
+    cache.delete('c')
+    assert cache.current_bytes == sum(cache._sizes.values())
+
+
+def test_bounded_memory_cache_skips_oversized_values():
+    cache = MemoryCache(max_bytes=1_000)
+    assert cache.get_or_fill('big', lambda: b'x' * 5_000) == b'x' * 5_000
+    assert cache.get('big') is None
+    assert cache.current_bytes == 0
+
+
+def test_report_exporter_bounds_its_own_cache():
+    with ReportExporter() as exporter:
+        assert exporter.cache.max_bytes == REPORT_CACHE_BYTES
+
+
+def test_disk_cache_purges_long_expired_entries_on_write(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.set('recent', 1, ttl=0)
+    cache.set('old', 2, ttl=0)
+    past = time.time() - cache_module.PURGE_GRACE - 1
+    cache._connection().execute('UPDATE entries SET expires_at = ? WHERE key = ?', (past, 'old'))
+
+    # The next purge is not due yet
+    cache.set('fresh', 3, ttl=60)
+    assert cache.get('old', stale_ok=True) is not None
+
+    cache._next_purge = 0.0
+    cache.set('fresh', 3, ttl=60)
+    assert cache.get('old', stale_ok=True) is None
+    # Recently expired entries stay readable as stale values
+    assert cache.get('recent', stale_ok=True).value == 1
+    assert cache.get('fresh').value == 3
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from plfinance.data_sources import SampleDataSource
+from plfinance.dataset import load_dataset
+from plfinance.fei import calculate_fei, fei_scores, round_half
+from plfinance.synthetic import SyntheticDataSource
+
+
+def row_fei(row):
+    # The dashboard's original per-row implementation
+    revenue_growth_factor = max(0.5, (row['Revenue_Growth'] + 10) / 10)
+    commercial_diversification = row['Commercial_Revenue'] / row['Total_Revenue']
+    revenue_stability = 1 + (row['Matchday_Revenue'] / row['Total_Revenue'])
+    revenue_risk_factor = max(0.5, row['Total_Revenue'] / 500)
+
+    fei = (revenue_growth_factor * commercial_diversification * revenue_stability) / revenue_risk_factor
+    return round(fei, 3)
+
+
+def test_compact_schema_matches_row_wise_on_source_rows():
+    # The dashboard scores the float32 frames; the original scored the source's float64 values
+    source = SampleDataSource().read_financial()
+    expected = source.assign(FEI=source.apply(row_fei, axis=1)).set_index(['Season', 'Team'])['FEI']
+    df = load_dataset().financial
+    scores = calculate_fei(df).set_axis(pd.MultiIndex.from_frame(df[['Season', 'Team']].astype(str)))
+    pd.testing.assert_series_equal(scores.loc[expected.index], expected, check_names=False)
+
+
+def test_matches_row_wise_on_synthetic():
+    df = SyntheticDataSource(500, 20, seed=3).read_financial()
+    pd.testing.assert_series_equal(calculate_fei(df), df.apply(row_fei, axis=1), check_names=False)
+
+
+def test_matches_row_wise_at_rounding_ties():
+    # One-decimal revenue figures, as in the source data, hit exact ties (e.g. 0.2225)
+    rng = np.random.default_rng(0)
+    n = 400_000
+    df = pd.DataFrame({
+        'Revenue_Growth': np.round(rng.uniform(-20, 30, n), 1),
+        'Commercial_Revenue': np.round(rng.uniform(20, 400, n), 1),
+        'Matchday_Revenue': np.round(rng.uniform(5, 150, n), 1),
+    })
+    df['Total_Revenue'] = np.round(df['Commercial_Revenue'] + df['Matchday_Revenue'] + rng.uniform(50, 400, n), 1)
+    expected = np.array([row_fei(row) for row in df.to_dict('records')])
+    np.testing.assert_array_equal(calculate_fei(df).to_numpy(), expected)
+
+
+def test_round_half_follows_python_round():
+    values = [0.2225, 0.0005, 1.0015, 2.675, -0.2225, 0.1234, np.nan]
+    rounded = round_half(values, 3)
+    assert rounded[:-1].tolist() == [round(value, 3) for value in values[:-1]]
+    assert np.isnan(rounded[-1])
+
+
+def test_scalar_inputs():
+    score = fei_scores(5.0, 200.0, 80.0, 600.0)
+    assert np.ndim(score) == 0
+    assert score == row_fei({'Revenue_Growth': 5.0, 'Commercial_Revenue': 200.0, 'Matchday_Revenue': 80.0, 'Total_Revenue': 600.0})
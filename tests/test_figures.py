@@ -0,0 +1,62 @@
+import pytest
+
+from plfinance.dataset import load_dataset, season_view
+from plfinance.fei import calculate_fei
+from plfinance.figures import (
+    FigureCache, build_fei_bar, build_points_bar, build_points_revenue_scatter, build_revenue_growth_bar,
+    build_revenue_pie, build_revenue_streams_bar, build_revenue_trend_line, estimate_figure_bytes, figure_key
+)
+from plfinance.schema import to_presentation
+from plfinance.synthetic import SyntheticDataSource
+
+
+def chart_cases(dataset):
+    season = dataset.current_season
+    df, _ = season_view(dataset, season, dataset.teams)
+    df = df.assign(FEI=calculate_fei(df))
+    history = to_presentation(dataset.team_history(dataset.teams))
+    return {
+        'points': build_points_bar(df),
+        'pie': build_revenue_pie(df.iloc[0], "Revenue Breakdown"),
+        'streams': build_revenue_streams_bar(df, season),
+        'growth': build_revenue_growth_bar(df, season),
+        'fei': build_fei_bar(df, season),
+        'scatter svg': build_points_revenue_scatter(df, webgl_threshold=10 ** 9),
+        'scatter webgl': build_points_revenue_scatter(df, webgl_threshold=0),
+        'trend lttb': build_revenue_trend_line(history),
+        'trend lttb webgl': build_revenue_trend_line(history, webgl_threshold=0),
+    }
+
+
+@pytest.mark.parametrize('source', [None, SyntheticDataSource(300, 80, seed=5)], ids=['sample', 'synthetic'])
+def test_estimate_tracks_serialized_size(source):
+    dataset = load_dataset(source)
+    for name, fig in chart_cases(dataset).items():
+        actual = len(fig.to_json())
+        assert abs(estimate_figure_bytes(fig) - actual) <= 0.1 * actual, name
+
+
+def test_trend_estimate_follows_downsampling():
+    history = to_presentation(load_dataset(SyntheticDataSource(300, 80, seed=5)).team_history(None))
+    full = build_revenue_trend_line(history, max_points=1000, max_traces=1000)
+    reduced = build_revenue_trend_line(history)
+    assert estimate_figure_bytes(reduced) < estimate_figure_bytes(full) / 5
+    assert any(trace.type == 'scattergl' for trace in full.data)
+
+
+def test_cache_tracks_sizes_of_cached_figures():
+    figures = list(chart_cases(load_dataset()).values())
+    sizes = [estimate_figure_bytes(fig) for fig in figures]
+    cache = FigureCache(max_bytes=sum(sizes[:3]))
+    for i, fig in enumerate(figures[:3]):
+        assert cache.get_or_build(figure_key('chart', None, [], i), lambda: fig) is fig
+        assert cache.payload_bytes(fig) == sizes[i]
+    assert cache.current_bytes == sum(sizes[:3])
+
+    # The least recently used figure is evicted, and its size forgotten with it
+    cache.get(figure_key('chart', None, [], 0))
+    cache.put(figure_key('chart', None, [], 3), figures[3])
+    assert figure_key('chart', None, [], 1) not in cache
+    assert cache.payload_bytes(figures[1]) is None
+    assert cache.payload_bytes(figures[0]) == sizes[0]
+    assert cache.current_bytes <= cache.max_bytes
@@ -0,0 +1,68 @@
+import json
+import os
+
+import pytest
+
+from plfinance.data_sources import write_parquet_dataset
+from plfinance.kpi import KPIAggregates
+from plfinance.leagues import INDEX_FILE, LeagueCatalog, build_index, derived_targets
+from plfinance.synthetic import SyntheticDataSource
+
+
+@pytest.fixture
+def root(tmp_path):
+    for i, key in enumerate(['league-a', 'league-b']):
+        write_parquet_dataset(SyntheticDataSource(8, 3, seed=i), str(tmp_path / key))
+    build_index(str(tmp_path))
+    return str(tmp_path)
+
+
+def test_current_index_is_read(root, monkeypatch):
+    monkeypatch.setattr('plfinance.leagues.scan_league', lambda *args, **kwargs: pytest.fail("shard scanned"))
+    catalog = LeagueCatalog.from_root(root)
+    assert catalog.keys() == ['league-a', 'league-b']
+
+
+def test_added_shard_triggers_a_rescan(root):
+    write_parquet_dataset(SyntheticDataSource(8, 3, seed=2), os.path.join(root, 'league-c'))
+    assert LeagueCatalog.from_root(root).keys() == ['league-a', 'league-b', 'league-c']
+
+
+def test_rewritten_shard_triggers_a_rescan(root):
+    write_parquet_dataset(SyntheticDataSource(10, 5, seed=0), os.path.join(root, 'league-a'))
+    league = LeagueCatalog.from_root(root)['league-a']
+    assert len(league.seasons) == 5
+    assert len(league.clubs) == 10
+
+
+def test_index_keeps_edited_names_across_rescans(root):
+    path = os.path.join(root, INDEX_FILE)
+    with open(path) as f:
+        index = json.load(f)
+    index['leagues'][0]['name'] = 'Renamed'
+    with open(path, 'w') as f:
+        json.dump(index, f)
+
+    write_parquet_dataset(SyntheticDataSource(8, 3, seed=2), os.path.join(root, 'league-c'))
+    assert LeagueCatalog.from_root(root)['league-a'].name == 'Renamed'
+
+
+def test_derived_targets_start_from_the_second_season():
+    financial = SyntheticDataSource(8, 3, seed=0).read_financial()
+    targets = derived_targets(financial)
+    seasons = sorted(financial['Season'].unique())
+    assert sorted(targets) == seasons[1:]
+
+    first = financial[financial['Season'] == seasons[0]]
+    growth = first['Revenue_Growth'].median()
+    assert targets[seasons[1]]['revenue_target'] == round(first['Total_Revenue'].sum() * (1 + growth / 100))
+
+    # The first season is measured against the latest season's target
+    kpis = KPIAggregates.from_frame(financial, targets=targets).compute(seasons[0], first['Team'].tolist())
+    assert kpis['target'] == targets[seasons[-1]]
+
+
+def test_single_season_league_targets_its_own_total():
+    financial = SyntheticDataSource(8, 1, seed=0).read_financial()
+    (season, target), = derived_targets(financial).items()
+    assert target['revenue_target'] == round(financial['Total_Revenue'].sum())
@@ -0,0 +1,168 @@
+import asyncio
+import copy
+import threading
+
+import httpx
+import pytest
+
+from plfinance.cache import DiskCache
+from plfinance.dataset import load_dataset, season_view
+from plfinance.live import StandingsFetcher
+from plfinance.testing import SAMPLE_MATCHES_PAYLOAD, StandingsStubServer
+
+
+def refresh(fetcher):
+    """
+    One refresh on a fresh client, as one iteration of the background loop
+    """
+    async def run():
+        async with fetcher.make_client() as client:
+            return await fetcher.refresh(client)
+
+    return asyncio.run(run())
+
+
+def points(snapshot):
+    return dict(zip(snapshot.standings['Team'], snapshot.standings['Points']))
+
+
+def played_payload():
+    # The sample payload with its unplayed Matchday 3 fixture finished
+    payload = copy.deepcopy(SAMPLE_MATCHES_PAYLOAD)
+    payload['matches'][-1]['score'] = {'ft': [0, 1]}
+    return payload
+
+
+@pytest.fixture
+def stub():
+    with StandingsStubServer() as server:
+        yield server
+
+
+def test_first_response_builds_snapshot(stub):
+    fetcher = StandingsFetcher(url=stub.url)
+    assert fetcher.latest() is None
+    assert refresh(fetcher) is True
+
+    snapshot = fetcher.latest()
+    assert snapshot.etag == stub.etag
+    assert snapshot.last_modified == stub.last_modified
+    assert snapshot.matchday == 2
+    assert points(snapshot) == {
+        'Arsenal': 6, 'Liverpool': 6, 'Manchester City': 2, 'Tottenham': 1, 'Manchester United': 1, 'Chelsea': 0
+    }
+    assert 'If-None-Match' not in stub.last_request_headers
+
+
+def test_etag_revalidation_keeps_snapshot(stub):
+    fetcher = StandingsFetcher(url=stub.url)
+    refresh(fetcher)
+    snapshot = fetcher.latest()
+
+    assert refresh(fetcher) is False
+    assert stub.last_request_headers['If-None-Match'] == stub.etag
+    assert stub.not_modified_count == fetcher.not_modified == 1
+    assert fetcher.latest() is snapshot
+
+
+def test_if_modified_since_revalidation_keeps_snapshot():
+    with StandingsStubServer(etags=False) as stub:
+        fetcher = StandingsFetcher(url=stub.url)
+        refresh(fetcher)
+        snapshot = fetcher.latest()
+        assert snapshot.etag is None
+
+        assert refresh(fetcher) is False
+        assert 'If-None-Match' not in stub.last_request_headers
+        assert stub.last_request_headers['If-Modified-Since'] == stub.last_modified
+        assert stub.not_modified_count == 1
+        assert fetcher.latest() is snapshot
+
+        # A newer document is served in full again
+        stub.set_payload(played_payload())
+        assert refresh(fetcher) is True
+        assert fetcher.latest().matchday == 3
+
+
+def test_changed_payload_updates_table(stub):
+    fetcher = StandingsFetcher(url=stub.url)
+    refresh(fetcher)
+    before = points(fetcher.latest())
+
+    stub.set_payload(played_payload())
+    assert refresh(fetcher) is True
+    snapshot = fetcher.latest()
+    assert snapshot.etag == stub.etag
+    assert snapshot.matchday == 3
+    assert points(snapshot)['Liverpool'] == before['Liverpool'] + 3
+    assert points(snapshot)['Arsenal'] == before['Arsenal']
+
+
+@pytest.mark.parametrize('failure', ['error', 'timeout'])
+def test_failure_falls_back_to_static_standings(stub, failure):
+    if failure == 'error':
+        stub.error_status = 503
+    else:
+        stub.delay = 1
+    fetcher = StandingsFetcher(url=stub.url, timeout=0.2, refresh_interval=60).start()
+    try:
+        assert fetcher.wait_first_attempt(timeout=10)
+    finally:
+        fetcher.stop(timeout=5)
+
+    expected_error = httpx.HTTPStatusError if failure == 'error' else httpx.TimeoutException
+    assert isinstance(fetcher.last_error, expected_error)
+    assert fetcher.latest() is None
+
+    # Without a snapshot the dashboard passes no live standings: the static table is shown
+    dataset = load_dataset()
+    df, show_performance = season_view(dataset, dataset.current_season, dataset.teams, standings=None)
+    static = dataset.combined.set_index('Team')['Points'].astype(int).to_dict()
+    assert show_performance
+    assert dict(zip(df['Team'], df['Points'])) == {str(team): points for team, points in static.items()}
+
+
+def test_failure_keeps_previous_snapshot(stub):
+    fetcher = StandingsFetcher(url=stub.url)
+    refresh(fetcher)
+    snapshot = fetcher.latest()
+
+    stub.error_status = 500
+    with pytest.raises(httpx.HTTPStatusError):
+        refresh(fetcher)
+    assert fetcher.latest() is snapshot
+
+
+def test_shared_cache_single_flight(stub, tmp_path):
+    # Separate cache handles stand in for separate processes sharing PL_CACHE_DIR
+    stub.delay = 0.3
+    fetchers = [StandingsFetcher(url=stub.url, cache=DiskCache(str(tmp_path))) for _ in range(4)]
+    changed = [None] * len(fetchers)
+
+    def run(i):
+        changed[i] = refresh(fetchers[i])
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(fetchers))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert changed == [True] * len(fetchers)
+    assert stub.request_count == 1
+    assert sum(fetcher.requests_made for fetcher in fetchers) == 1
+    assert len({tuple(sorted(points(fetcher.latest()).items())) for fetcher in fetchers}) == 1
+
+    # Within the TTL the shared entry is reused without touching the server
+    assert refresh(fetchers[0]) is False
+    assert stub.request_count == 1
+
+
+def test_shared_cache_revalidates_expired_entry(stub, tmp_path):
+    fetcher = StandingsFetcher(url=stub.url, cache=DiskCache(str(tmp_path)), refresh_interval=0)
+    assert refresh(fetcher) is True
+    # Expired: one conditional request, answered 304, and the applied snapshot stays
+    snapshot = fetcher.latest()
+    assert refresh(fetcher) is False
+    assert stub.not_modified_count == 1
+    assert fetcher.latest() is snapshot
@@ -0,0 +1,94 @@
+from itertools import combinations
+
+import pandas as pd
+import pytest
+
+from plfinance.data_sources import SampleDataSource
+from plfinance.dataset import load_dataset, season_view
+from plfinance.fei import calculate_fei
+from plfinance.risk import evaluate_risk_rules, strategic_recommendations
+from test_fei import row_fei
+
+
+def row_alerts(df):
+    # The dashboard's original per-row risk indicators
+    alerts = []
+    for _, team in df[df['Revenue_Growth'] < 0].iterrows():
+        alerts.append(('warning', f"**{team['Team']}**: Revenue declining by {abs(team['Revenue_Growth']):.1f}% | FEI: {team['FEI']:.3f}"))
+
+    for _, team in df.iterrows():
+        commercial_share = team['Commercial_Revenue'] / team['Total_Revenue']
+        broadcasting_share = team['Broadcasting_Revenue'] / team['Total_Revenue']
+        if broadcasting_share > 0.6:
+            alerts.append(('error', f"**{team['Team']}**: Over-reliant on broadcasting ({broadcasting_share*100:.1f}% of revenue)"))
+        elif commercial_share < 0.25:
+            alerts.append(('info', f"**{team['Team']}**: Low commercial diversification ({commercial_share*100:.1f}% of revenue)"))
+
+    for _, team in df[df['FEI'] < df['FEI'].median()].iterrows():
+        alerts.append(('error', f"**{team['Team']}**: Below-average financial efficiency (FEI: {team['FEI']:.3f} vs avg: {df['FEI'].mean():.3f})"))
+
+    for _, team in df.iterrows():
+        if team['Total_Revenue'] > 600 and team['FEI'] < 0.5:
+            alerts.append(('warning', f"**{team['Team']}**: High revenue (£{team['Total_Revenue']:.1f}M) but poor financial efficiency (FEI: {team['FEI']:.3f})"))
+        if team['Total_Revenue'] > 500 and team['Revenue_Growth'] < 2:
+            alerts.append(('info', f"**{team['Team']}**: Large revenue base (£{team['Total_Revenue']:.1f}M) with low growth ({team['Revenue_Growth']:.1f}%) - focus on innovation"))
+    return alerts
+
+
+def row_recommendations(df):
+    # The dashboard's original data-driven recommendations (before the standard list)
+    avg_fei = df['FEI'].mean()
+    avg_commercial_share = (df['Commercial_Revenue'] / df['Total_Revenue']).mean()
+    avg_revenue_growth = df['Revenue_Growth'].mean()
+    avg_matchday_share = (df['Matchday_Revenue'] / df['Total_Revenue']).mean()
+
+    recommendations = []
+    if avg_fei < 0.6:
+        recommendations.append(f"**Financial Optimization**: Average FEI ({avg_fei:.3f}) below target 0.600 - improve revenue diversification and growth")
+    if avg_commercial_share < 0.35:
+        recommendations.append(f"**Commercial Expansion**: Current commercial share ({avg_commercial_share*100:.1f}%) below optimal 35%+ - focus on sponsorship and partnerships")
+    if avg_revenue_growth < 5:
+        recommendations.append(f"**Growth Strategy**: Revenue growth ({avg_revenue_growth:.1f}%) below industry target of 5%+ - diversify revenue streams")
+    if avg_matchday_share < 0.15:
+        recommendations.append(f"**Matchday Enhancement**: Current matchday share ({avg_matchday_share*100:.1f}%) below optimal 15%+ - improve stadium experience")
+
+    low_fei_team = df.loc[df['FEI'].idxmin()]
+    recommendations.append(f"**Priority Focus**: {low_fei_team['Team']} (FEI: {low_fei_team['FEI']:.3f}) needs immediate financial efficiency improvements")
+    return recommendations
+
+
+def _subsets():
+    source = SampleDataSource()
+    financial = source.read_financial()
+    current_season = source.current_season()
+    performance = source.read_performance()
+    performance = performance[performance['Season'] == current_season].drop(columns='Season')
+    for season in source.seasons():
+        season_df = financial[financial['Season'] == season]
+        if season == current_season:
+            season_df = pd.merge(performance, season_df, on='Team')
+        teams = season_df['Team'].tolist()
+        for size in range(1, len(teams) + 1):
+            for subset in combinations(teams, size):
+                yield season, list(subset), season_df[season_df['Team'].isin(subset)]
+
+
+SUBSETS = list(_subsets())
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    return load_dataset()
+
+
+def test_matches_row_wise_on_every_team_subset(dataset):
+    for season, teams, source_df in SUBSETS:
+        expected = source_df.assign(FEI=source_df.apply(row_fei, axis=1))
+        df, show_performance = season_view(dataset, season, teams)
+        df = df.assign(FEI=calculate_fei(df))
+
+        alerts = evaluate_risk_rules(df)
+        assert list(zip(alerts['Level'], alerts['Message'])) == row_alerts(expected), (season, teams)
+
+        recommendations = strategic_recommendations(df, show_performance)
+        assert recommendations[:-3] == row_recommendations(expected), (season, teams)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from plfinance.dataset import load_dataset
+from plfinance.schema import TeamSeasonIndex, season_mask, team_mask
+from plfinance.synthetic import SyntheticDataSource
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    return load_dataset(SyntheticDataSource(50, 8, seed=1))
+
+
+@pytest.fixture(params=['stored', 'shuffled'])
+def frame(request, dataset):
+    financial = dataset.financial
+    if request.param == 'shuffled':
+        financial = financial.sample(frac=1, random_state=0)
+    return financial, TeamSeasonIndex(financial, dataset.dictionary)
+
+
+def test_take_matches_masks(dataset, frame):
+    financial, index = frame
+    dictionary = dataset.dictionary
+    rng = np.random.default_rng(0)
+    for season in dataset.seasons:
+        teams = list(rng.choice(dictionary.team_dtype.categories, 6, replace=False))
+        assert index.take(financial, season).equals(financial[season_mask(financial, season, dictionary)])
+        assert index.take(financial, season, teams).equals(
+            financial[season_mask(financial, season, dictionary) & team_mask(financial, teams, dictionary)]
+        )
+        assert index.take(financial, teams=teams).equals(financial[team_mask(financial, teams, dictionary)])
+    assert index.take(financial, '1900-01').empty
+    assert index.take(financial, teams=['Nobody FC']).empty
+
+
+def test_row_matches_masks(dataset, frame):
+    financial, index = frame
+    dictionary = dataset.dictionary
+    for season in dataset.seasons[::3]:
+        for team in dictionary.team_dtype.categories[::7]:
+            mask = season_mask(financial, season, dictionary) & team_mask(financial, [team], dictionary)
+            expected = np.flatnonzero(mask)
+            assert index.row(season, team) == (int(expected[0]) if len(expected) else None)
+    assert index.row('1900-01', dictionary.team_dtype.categories[0]) is None
+    assert index.row(dataset.seasons[0], 'Nobody FC') is None
+
+
+def test_contiguous_season_is_a_slice(dataset):
+    # Frames are stored season by season, so a season block needs no gather
+    financial = dataset.financial
+    season = dataset.seasons[len(dataset.seasons) // 2]
+    block = dataset.index.take(financial, season)
+    assert np.shares_memory(block['Total_Revenue'].to_numpy(), financial['Total_Revenue'].to_numpy())